@@ -6,13 +6,19 @@ import glob
 import os
 from typing import List
 
-from pmtiles_utils import convert_mbtiles_to_pmtiles
+from pmtiles_utils import ensure_pmtiles_for_years
 
 
 def main() -> None:
     ap = argparse.ArgumentParser(description="Convert humans_{year}.mbtiles → humans_{year}.pmtiles in a directory")
     ap.add_argument("--tiles-dir", required=True, help="Directory containing humans_{year}.mbtiles")
     ap.add_argument("--years", nargs="*", type=int, help="Specific years to convert (default: all found)")
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Parallel conversions (default: half the CPU count with the pmtiles CLI, else all CPUs)",
+    )
     args = ap.parse_args()
 
     tiles_dir = args.tiles_dir
@@ -36,6 +42,7 @@ def main() -> None:
 
     print(f"Converting {len(years)} MBTiles → PMTiles under {tiles_dir}…")
     ok_all = True
+    pending: List[int] = []
     for y in years:
         mb = os.path.join(tiles_dir, f"humans_{y}.mbtiles")
         pm = os.path.join(tiles_dir, f"humans_{y}.pmtiles")
@@ -46,12 +53,14 @@ def main() -> None:
         if os.path.exists(pm):
             print(f"  ↪ Skip {y}: {pm} already exists")
             continue
-        print(f"  → {os.path.basename(mb)} → {os.path.basename(pm)}")
-        ok = convert_mbtiles_to_pmtiles(mb, pm)
-        if ok:
+        pending.append(y)
+
+    # Years convert independently, so run them in parallel processes
+    for y, pm in ensure_pmtiles_for_years(tiles_dir, pending, max_workers=args.jobs).items():
+        if pm:
             print(f"  ✓ {os.path.basename(pm)}")
         else:
-            print("  ✗ Conversion failed. Install `pmtiles` CLI or `pip install pmtiles`.")
+            print(f"  ✗ Conversion failed for {y}. Install `pmtiles` CLI or `pip install pmtiles`.")
             ok_all = False
 
     if ok_all:
@@ -3,7 +3,7 @@
 Dot generation strategies (deterministic + random) extracted from LODProcessor.
 Encapsulates density-aware dot creation while preserving existing behavior.
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import numpy as np
 from landmask import is_land
@@ -41,23 +41,7 @@ class DotGenerator:
         """
         dots: List[tuple] = []
 
-        # Apply minimum population threshold - scale with dot size for
-        # sparse eras. Use a lower cutoff for detailed (base) dots so
-        # extremely sparse BCE regions still contribute at least one dot
-        # and get aggregated into LOD 0-2.
-        if lod_level == 3:
-            # For base dots, lower cutoff significantly. For BCE-era runs
-            # (proxied by people_per_dot <= 10), allow very sparse cells
-            # through.
-            min_pop_cutoff = (
-                0.5
-                if people_per_dot <= 10
-                else max(people_per_dot / 4, 0.5)
-            )
-        else:
-            # Coarser LODs can keep a higher cutoff to avoid noise
-            min_pop_cutoff = max(people_per_dot / 2, 5)
-        if cell_population < min_pop_cutoff:
+        if cell_population < self._min_population_cutoff(people_per_dot, lod_level):
             return dots
 
         # Determine settlement type based on population
@@ -92,6 +76,142 @@ class DotGenerator:
                 lod_level,
             )
 
+    @staticmethod
+    def _min_population_cutoff(
+        people_per_dot: int, lod_level: Optional[int] = None
+    ) -> float:
+        """Smallest cell population that gets any dots."""
+        # Apply minimum population threshold - scale with dot size for
+        # sparse eras. Use a lower cutoff for detailed (base) dots so
+        # extremely sparse BCE regions still contribute at least one dot
+        # and get aggregated into LOD 0-2.
+        if lod_level == 3:
+            # For base dots, lower cutoff significantly. For BCE-era runs
+            # (proxied by people_per_dot <= 10), allow very sparse cells
+            # through.
+            return (
+                0.5
+                if people_per_dot <= 10
+                else max(people_per_dot / 4, 0.5)
+            )
+        # Coarser LODs can keep a higher cutoff to avoid noise
+        return max(people_per_dot / 2, 5)
+
+    @staticmethod
+    def _dot_count_rule(
+        settlement_type: str, people_per_dot: int, lod_level: Optional[int] = None
+    ) -> Tuple[float, Optional[int]]:
+        """(people per dot, max dots) for deterministic dots of a settlement type.
+
+        A cell gets max(1, min(max_dots, int(cell_population / people per dot))).
+        """
+        # LOD-aware dot distribution logic
+        # LOD 3 (Detailed zoom ≥6): More granular dots for detailed views
+        # LOD 0-2 (Coarser zoom <6): Fewer dots to avoid clutter
+        if lod_level == 3:  # Detailed LOD - show more granular dots
+            if settlement_type == "rural":
+                # Rural at detailed level: standard granularity with a
+                # safety cap
+                return people_per_dot, 20
+            if settlement_type == "town":
+                # Towns at detailed level: balanced density
+                return max(people_per_dot * 2, 50), 25
+            # Cities at detailed level: rich structure without
+            # overwhelming the budget
+            return max(people_per_dot * 4, 100), 75
+        # LOD 0-2 - use original aggregated logic to avoid clutter
+        if settlement_type == "rural":
+            return people_per_dot, None
+        if settlement_type == "town":
+            # Towns at coarse LOD: Fewer dots to reduce clutter
+            # 5× more people per dot
+            return people_per_dot * 5, 5
+        # Cities at coarse LOD: Very few dots to avoid overwhelming the view
+        # 20× more people per dot
+        return people_per_dot * 20, 3
+
+    def create_density_aware_dots_batch(
+        self,
+        cell_populations: np.ndarray,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        cellsize: float,
+        people_per_dot: int,
+        lod_level: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        create_density_aware_dots for many cells at once.
+
+        The cutoff, settlement type and (for deterministic placement) dot
+        count are computed for all cells together; only the placement itself
+        runs per cell. Output matches concatenating per-cell calls in order.
+
+        Returns:
+            (lat, lon, population) arrays with one entry per dot
+        """
+        cell_populations = np.asarray(cell_populations, dtype=np.float64)
+        keep = cell_populations >= self._min_population_cutoff(people_per_dot, lod_level)
+        pops = cell_populations[keep]
+        cell_lats = np.asarray(lats, dtype=np.float64)[keep].tolist()
+        cell_lons = np.asarray(lons, dtype=np.float64)[keep].tolist()
+
+        # 0 = rural, 1 = town, 2 = city
+        type_codes = np.searchsorted(
+            [
+                self.continuity_config.rural_to_town_threshold,
+                self.continuity_config.town_to_city_threshold,
+            ],
+            pops,
+            side="right",
+        )
+        settlement_types = ("rural", "town", "city")
+
+        dot_lats: List[float] = []
+        dot_lons: List[float] = []
+        if self.settlement_registry is None:
+            dot_pops: List[float] = []
+            for pop, lat, lon, code in zip(
+                pops.tolist(), cell_lats, cell_lons, type_codes.tolist()
+            ):
+                for dot_lat, dot_lon, dot_pop in self._create_random_dots(
+                    pop, lat, lon, cellsize, people_per_dot,
+                    settlement_types[code], lod_level,
+                ):
+                    dot_lats.append(dot_lat)
+                    dot_lons.append(dot_lon)
+                    dot_pops.append(dot_pop)
+            return (
+                np.array(dot_lats, dtype=np.float64),
+                np.array(dot_lons, dtype=np.float64),
+                np.array(dot_pops, dtype=np.float64),
+            )
+
+        num_dots = np.ones(len(pops), dtype=np.int64)
+        for code, settlement_type in enumerate(settlement_types):
+            of_type = type_codes == code
+            effective_people_per_dot, max_dots = self._dot_count_rule(
+                settlement_type, people_per_dot, lod_level
+            )
+            counts = np.floor(pops[of_type] / effective_people_per_dot)
+            if max_dots is not None:
+                counts = np.minimum(counts, max_dots)
+            num_dots[of_type] = np.maximum(counts, 1)
+
+        get_positions = self.settlement_registry.get_deterministic_positions
+        for lat, lon, count, code in zip(
+            cell_lats, cell_lons, num_dots.tolist(), type_codes.tolist()
+        ):
+            for position in get_positions(
+                lat, lon, cellsize, count, settlement_types[code]
+            ):
+                dot_lats.append(position.coordinates.latitude)
+                dot_lons.append(position.coordinates.longitude)
+        return (
+            np.array(dot_lats, dtype=np.float64),
+            np.array(dot_lons, dtype=np.float64),
+            np.repeat(pops / num_dots, num_dots),
+        )
+
     def _create_deterministic_dots(
         self,
         cell_population: float,
@@ -104,49 +224,13 @@ class DotGenerator:
     ) -> List[tuple]:
         """Create dots using deterministic positioning for settlement
         continuity."""
-        # LOD-aware dot distribution logic
-        # LOD 3 (Detailed zoom ≥6): More granular dots for detailed views
-        # LOD 0-2 (Coarser zoom <6): Fewer dots to avoid clutter
-
-        if lod_level == 3:  # Detailed LOD - show more granular dots
-            if settlement_type == "rural":
-                # Rural at detailed level: standard granularity with a
-                # safety cap
-                num_dots = max(
-                    1, min(20, int(cell_population / people_per_dot))
-                )
-            elif settlement_type == "town":
-                # Towns at detailed level: balanced density
-                effective_people_per_dot = max(people_per_dot * 2, 50)
-                num_dots = max(
-                    1,
-                    min(25, int(cell_population / effective_people_per_dot)),
-                )
-            else:  # city
-                # Cities at detailed level: rich structure without
-                # overwhelming the budget
-                effective_people_per_dot = max(people_per_dot * 4, 100)
-                num_dots = max(
-                    1,
-                    min(75, int(cell_population / effective_people_per_dot)),
-                )
-        else:  # LOD 0-2 - use original aggregated logic to avoid clutter
-            if settlement_type == "rural":
-                num_dots = max(1, int(cell_population / people_per_dot))
-            elif settlement_type == "town":
-                # Towns at coarse LOD: Fewer dots to reduce clutter
-                # 5× more people per dot
-                effective_people_per_dot = people_per_dot * 5
-                num_dots = max(
-                    1, min(5, int(cell_population / effective_people_per_dot))
-                )
-            else:  # city
-                # Cities at coarse LOD: Very few dots to avoid overwhelming the view
-                # 20× more people per dot
-                effective_people_per_dot = people_per_dot * 20
-                num_dots = max(
-                    1, min(3, int(cell_population / effective_people_per_dot))
-                )
+        effective_people_per_dot, max_dots = self._dot_count_rule(
+            settlement_type, people_per_dot, lod_level
+        )
+        num_dots = int(cell_population / effective_people_per_dot)
+        if max_dots is not None:
+            num_dots = min(max_dots, num_dots)
+        num_dots = max(1, num_dots)
 
         population_per_dot = cell_population / num_dots
 
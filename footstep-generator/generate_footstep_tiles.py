@@ -14,15 +14,18 @@ Features:
 """
 
 import argparse
+import contextlib
 import gc
+import io
 import os
 import pathlib
 import platform
 import subprocess
 import tempfile
 import json
-from typing import Dict, List, Optional
-from pmtiles_utils import ensure_pmtiles_for_year
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+from pmtiles_utils import ensure_pmtiles_for_years
 
 # Import core processing functions
 from hyde_tile_processor import (
@@ -34,16 +37,13 @@ from hyde_tile_processor import (
 # Import tile generation functions
 from tile_generator import (
     run_command,
+    set_quiet_tools,
     verify_tiles,
-    write_combined_geojsonl_windows,
-    generate_single_layer_mbtiles,
-    write_geojsonl_temp,
-    generate_mbtiles_for_lod,
-    combine_lod_mbtiles
+    pipe_single_layer_mbtiles,
+    build_lod_mbtiles,
 )
 
 from verify_tiles import verify_single_layer
-from lod_config import LOD_ZOOM_RANGES
 
 
 def generate_year_tiles_combined(asc_file: str, tiles_dir: str, year: int, 
@@ -81,52 +81,31 @@ def generate_year_tiles_combined(asc_file: str, tiles_dir: str, year: int,
     
     print(f"  LOD counts: {lod_counts} | Population: {result.total_population:,.0f}")
     
-    # Generate per-LOD MBTiles
-    lod_tiles: List[str] = []
-    tmp_files: List[str] = []
-    
     try:
-        for lod_level, settlements in sorted(
-            result.lod_data.items(), key=lambda x: getattr(x[0], "value", x[0])
-        ):
-            if not settlements:
-                continue
-                
-            # Write temp GeoJSONL for this LOD
-            tmp_geojsonl = write_geojsonl_temp(settlements, int(getattr(lod_level, "value", lod_level)))
-            tmp_files.append(tmp_geojsonl)
-            
-            minzoom, maxzoom = LOD_ZOOM_RANGES.get(int(getattr(lod_level, "value", lod_level)), (0, 12))
-            target_lod = int(getattr(lod_level, "value", lod_level))
+        # Generate single-layer MBTiles (default, what frontend uses) in the
+        # background: its tippecanoe run is independent of the per-LOD ones
+        single_layer_job = None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            if single_layer:
+                if force:
+                    final_path.unlink(missing_ok=True)
+                if force or not final_path.exists():
+                    # Use LOD windows for clean zoom transitions
+                    single_layer_job = executor.submit(
+                        pipe_single_layer_mbtiles, result.lod_data, str(final_path)
+                    )
             
             # Generate per-LOD MBTiles
-            lod_out = tiles_dir_path / f"humans_{year}_lod_{target_lod}.mbtiles"
-            if lod_out.exists() and force:
-                lod_out.unlink()
-            
-            if not lod_out.exists() or force:
-                ok = generate_mbtiles_for_lod(tmp_geojsonl, str(lod_out), target_lod, minzoom, maxzoom)
-                if not ok:
-                    return None
-            else:
-                print(f"  ↪ Skipping LOD {target_lod}: {lod_out.name} already exists")
-            
-            lod_tiles.append(str(lod_out))
+            lod_tiles = build_lod_mbtiles(result.lod_data, str(tiles_dir_path), year, force=force)
+            single_layer_ok = single_layer_job.result() if single_layer_job is not None else False
+        if lod_tiles is None:
+            return None
         
         success = True
         
-        # Generate single-layer MBTiles (default, what frontend uses)
         if single_layer:
-            # Use LOD windows for clean zoom transitions
-            combined_geojsonl = write_combined_geojsonl_windows(result.lod_data)
-            tmp_files.append(combined_geojsonl)
-            
-            if final_path.exists() and force:
-                final_path.unlink()
-                
-            if not final_path.exists() or force:
-                ok = generate_single_layer_mbtiles(combined_geojsonl, str(final_path))
-                if not ok:
+            if single_layer_job is not None:
+                if not single_layer_ok:
                     success = False
                 else:
                     # Verify output
@@ -147,18 +126,49 @@ def generate_year_tiles_combined(asc_file: str, tiles_dir: str, year: int,
             return None
             
     finally:
-        # Always clean up temp files
-        for tmp_file in tmp_files:
-            try:
-                os.unlink(tmp_file)
-            except OSError:
-                pass
-        
         # Clean up result to free memory
         del result
         gc.collect()
 
 
+def build_year(asc_file: str, tiles_dir: str, year: int, force: bool = False,
+               single_layer: bool = True, verify: bool = False, strict: bool = False) -> bool:
+    """Build one year's MBTiles. Returns True on success.
+
+    PMTiles are not converted here; main converts every built year in one pass.
+    """
+    result = generate_year_tiles_combined(
+        asc_file, tiles_dir, year,
+        force=force,
+        single_layer=single_layer,
+        verify=verify,
+        strict=strict
+    )
+    if not result:
+        print(f"  ✗ Failed to build tiles for year {year}")
+        return False
+    return True
+
+
+def _build_year_captured(*args) -> Tuple[bool, str, Optional[int]]:
+    """Run build_year in a worker process, returning its status and captured log.
+
+    Only Python-level output is redirected; workers run with quiet tools so
+    tippecanoe/tile-join write to temp logs whose tail is printed (and so
+    captured) on failure. A SystemExit is returned as its exit code (else None)
+    together with the log rather than raised.
+    """
+    buf = io.StringIO()
+    exit_code = None
+    with contextlib.redirect_stdout(buf):
+        try:
+            ok = build_year(*args)
+        except SystemExit as e:
+            ok = False
+            exit_code = 0 if e.code is None else e.code
+    return ok, buf.getvalue(), exit_code
+
+
 def main():
     """Main tile generation routine."""
     print("🗺️ Footsteps Tile Generator")
@@ -196,11 +206,18 @@ def main():
     group2.add_argument("--pmtiles", dest="pmtiles", action="store_true", help="Also write .pmtiles next to .mbtiles (default)")
     group2.add_argument("--no-pmtiles", dest="pmtiles", action="store_false", help="Do not write .pmtiles outputs")
     parser.set_defaults(pmtiles=True)
+    parser.add_argument("--quiet", action="store_true",
+                       help="Hide tippecanoe/tile-join progress output unless a command fails "
+                            "(always the case with --jobs > 1)")
+    parser.add_argument("--jobs", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                       help="Number of years to build in parallel (default: half the CPU count, "
+                            "since tippecanoe runs its own threads)")
     
     args = parser.parse_args()
+    set_quiet_tools(args.quiet)
     
     # Discover available HYDE files
-    hyde_map = find_hyde_files(args.raw_dir)
+    hyde_map = find_hyde_files(args.raw_dir, cache_dir=args.tiles_dir)
     if not hyde_map:
         print("✗ No HYDE ASC files found. Please download data first.")
         print(f"  Expected location: {args.raw_dir}")
@@ -233,38 +250,73 @@ def main():
     # Process years efficiently
     built = 0
     failed = 0
+    jobs = max(1, args.jobs)
+    # Years are built without PMTiles; conversion is left to a single parallel
+    # pass over every built year afterwards, which also runs when --strict stops early
+    convert_pmtiles = args.single_layer and args.pmtiles
+    built_years = []
+    build_args = [
+        (hyde_map[year], args.tiles_dir, year, args.force, args.single_layer,
+         args.verify, args.strict)
+        for year in target_years
+    ]
     
-    for i, year in enumerate(target_years, 1):
-        print(f"\n[{i}/{len(target_years)}] Year {year}")
-        
-        asc_file = hyde_map[year]
-        result = generate_year_tiles_combined(
-            asc_file, args.tiles_dir, year,
-            force=args.force,
-            single_layer=args.single_layer,
-            verify=args.verify,
-            strict=args.strict
-        )
-        
-        if result:
-            built += 1
-            # Optionally convert to PMTiles without reprocessing
-            if args.single_layer and args.pmtiles:
-                pm = ensure_pmtiles_for_year(args.tiles_dir, year)
+    try:
+        if jobs == 1 or len(build_args) <= 1:
+            # Build years one at a time to bound memory
+            for i, year_args in enumerate(build_args, 1):
+                print(f"\n[{i}/{len(target_years)}] Year {year_args[2]}")
+            
+                if build_year(*year_args):
+                    built += 1
+                    built_years.append(year_args[2])
+                else:
+                    failed += 1
+                    if args.strict:
+                        return 1
+            
+                # Report memory after each year
+                if i % 5 == 0 or i == len(target_years):
+                    current_memory = get_memory_usage()
+                    print(f"  Memory: {current_memory}")
+        else:
+            # Years are independent (distinct ASC input, distinct outputs), so fan them
+            # out across processes. Each worker's log is captured and printed once the
+            # year finishes to keep output from different years from interleaving.
+            # Tools inherit the worker's fds, which redirect_stdout cannot capture, so
+            # workers always run them quiet: progress is dropped, failures are logged
+            print(f"Building {len(build_args)} years with {jobs} parallel jobs...")
+            with ProcessPoolExecutor(
+                max_workers=jobs, initializer=set_quiet_tools, initargs=(True,)
+            ) as executor:
+                futures = {
+                    executor.submit(_build_year_captured, *year_args): year_args[2]
+                    for year_args in build_args
+                }
+                for i, future in enumerate(as_completed(futures), 1):
+                    ok, log, exit_code = future.result()
+                    print(f"\n[{i}/{len(target_years)}] Year {futures[future]}")
+                    print(log, end="")
+                    if exit_code is not None:
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        return exit_code
+                    if ok:
+                        built += 1
+                        built_years.append(futures[future])
+                    else:
+                        failed += 1
+                        if args.strict:
+                            executor.shutdown(wait=True, cancel_futures=True)
+                            return 1
+            print(f"  Memory: {get_memory_usage()}")
+    finally:
+        if convert_pmtiles and built_years:
+            print(f"\nConverting {len(built_years)} years to PMTiles...")
+            for year, pm in ensure_pmtiles_for_years(args.tiles_dir, sorted(built_years)).items():
                 if pm:
                     print(f"  ✓ Year {year} PMTiles ready: {pm}")
                 else:
-                    print("  ⚠️  PMTiles conversion failed. Install `pmtiles` CLI or `pip install pmtiles`.")
-        else:
-            failed += 1
-            print(f"  ✗ Failed to build tiles for year {year}")
-            if args.strict:
-                return 1
-        
-        # Report memory after each year
-        if i % 5 == 0 or i == len(target_years):
-            current_memory = get_memory_usage()
-            print(f"  Memory: {current_memory}")
+                    print(f"  ⚠️  Year {year} PMTiles conversion failed. Install `pmtiles` CLI or `pip install pmtiles`.")
     
     # Summary
     print(f"\n✓ Completed: {built} built, {failed} failed")
@@ -11,12 +11,21 @@ tile generation use the combined generate_footstep_tiles.py script.
 """
 
 import argparse
+import contextlib
+import functools
 import gc
+import hashlib
+import io
+import itertools
+import json
 import os
 import pathlib
 import platform
 import subprocess
-from typing import Dict, List, Optional, Tuple, Any
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple, Any, Union
 
 # Optional memory monitoring
 try:
@@ -39,6 +48,7 @@ from models import (
     LODLevel,
     ProcessingResult,
     ProcessingStatistics,
+    SettlementBatch,
     SettlementContinuityConfig,
 )
 from pyproj import Geod
@@ -49,6 +59,10 @@ from typing import Iterable
 # Geodetic calculator for accurate area calculations
 geod = Geod(ellps="WGS84")
 
+# WGS84 semi-minor axis and first eccentricity for the closed-form cell areas
+_WGS84_B = geod.a * (1 - geod.f)
+_WGS84_E = float(np.sqrt(geod.es))
+
 # Core processing functions use dynamic HYDE file discovery
 
 
@@ -66,9 +80,132 @@ def get_memory_usage() -> str:
         return "memory check failed"
 
 
+def _authalic_q(lat_deg: np.ndarray) -> np.ndarray:
+    """Ellipsoid area function q(phi): b^2/2 * dlon * dq is the area between two parallels."""
+    sin_lat = np.sin(np.radians(lat_deg))
+    e_sin = _WGS84_E * sin_lat
+    return sin_lat / (1 - e_sin * e_sin) + np.arctanh(e_sin) / _WGS84_E
+
+
+def cell_band_areas_km2(lats: np.ndarray, cellsize: float) -> np.ndarray:
+    """Area in km² of a cellsize x cellsize WGS84 cell centered on each latitude.
+
+    Closed-form area of the quadrangle bounded by two meridians and two parallels;
+    within ~1e-6 of geod.polygon_area_perimeter on the same corners, without a
+    pyproj call per cell.
+    """
+    lats = np.asarray(lats, dtype=float)
+    dq = _authalic_q(lats + cellsize / 2) - _authalic_q(lats - cellsize / 2)
+    return np.abs(np.radians(cellsize) * _WGS84_B ** 2 / 2 * dq) / 1_000_000
+
+
+@functools.lru_cache(maxsize=4)
+def _grid_axes(
+    ncols: int, nrows: int, xllcorner: float, yllcorner: float, cellsize: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Cell-center longitudes, row latitudes and row areas (km²) of a grid geometry.
+
+    Rows are in file order (north first). Every HYDE year shares one geometry, so
+    these are built once per process; the arrays are read-only.
+    """
+    # Longitude runs from west to east (xllcorner to xllcorner + ncols*cellsize)
+    lons = np.linspace(
+        xllcorner + cellsize / 2,
+        xllcorner + (ncols - 1) * cellsize + cellsize / 2,
+        ncols,
+    )
+    # HYDE ASCII grids list data rows from north (top) to south (bottom), so row
+    # index i (0-based from the file) has latitude
+    #   lat = yllcorner + (nrows - i - 0.5) * cellsize
+    # which flips the y-axis correctly. This prevents vertically mirrored or
+    # "up-side-down" placement on the map.
+    row_lats = yllcorner + (nrows - np.arange(nrows) - 0.5) * cellsize
+    # Every cell in a row has the same area
+    row_areas_km2 = cell_band_areas_km2(row_lats, cellsize)
+    for axis in (lons, row_lats, row_areas_km2):
+        axis.flags.writeable = False
+    return lons, row_lats, row_areas_km2
+
+
+# Parsed grid bodies are cached under the output/cache directory (never next to
+# the source rasters) as .grid_cache/<asc name>.<path hash>.npy
+GRID_CACHE_DIRNAME = ".grid_cache"
+
+# Densities are stored as float32: ASC values carry ~6-7 significant digits, and
+# it halves the footprint of the full grid, the largest array per year
+GRID_DTYPE = np.float32
+
+
+def grid_cache_path(cache_dir: str, asc_file: str) -> pathlib.Path:
+    """Path of the parsed-grid cache for asc_file under cache_dir."""
+    key = hashlib.blake2b(
+        os.path.realpath(asc_file).encode("utf-8"), digest_size=8
+    ).hexdigest()
+    return pathlib.Path(cache_dir) / GRID_CACHE_DIRNAME / f"{os.path.basename(asc_file)}.{key}.npy"
+
+
+def _load_grid_cached(
+    asc_file: str, f_asc, shape: Tuple[int, int], cache_dir: Optional[str] = None
+) -> np.ndarray:
+    """Return the parsed ASC grid body, via a binary cache under cache_dir if given.
+
+    Nodata cells keep their sentinel value. f_asc must be positioned just past the
+    header. A cache at least as new as the ASC file, with the header's shape and
+    the grid dtype, is memory-mapped read-only instead of re-parsing the text;
+    otherwise the body is parsed and the cache (re)written. An unwritable cache
+    directory just means no cache.
+    """
+    if cache_dir is None:
+        return np.loadtxt(f_asc, dtype=GRID_DTYPE)
+
+    cache_path = grid_cache_path(cache_dir, asc_file)
+    try:
+        if os.stat(cache_path).st_mtime_ns >= os.stat(asc_file).st_mtime_ns:
+            cached = np.load(cache_path, mmap_mode="r")
+            if cached.dtype == GRID_DTYPE and cached.shape == shape:
+                return cached
+    except (OSError, ValueError):
+        pass
+
+    data = np.loadtxt(f_asc, dtype=GRID_DTYPE)
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".npy.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f_out:
+                np.save(f_out, data)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"    Note: could not cache parsed grid ({e})")
+    return data
+
+
+def _read_header_field(f_asc, *keys: str) -> Tuple[str, str]:
+    """Read one "<key> <value>" ASC header line whose key must be one of keys.
+
+    Returns the lowercased key and the raw value; raises ValueError otherwise.
+    """
+    fields = f_asc.readline().split()
+    if len(fields) != 2 or fields[0].lower() not in keys:
+        raise ValueError(
+            f"Malformed ASC header: expected {' or '.join(keys)}, got {' '.join(fields)!r}"
+        )
+    return fields[0].lower(), fields[1]
+
+
 def hyde_grid_to_tile_points(
-    asc_file: str, year: int, people_per_dot: int = 100, lod_processor: Optional[LODProcessor] = None
-) -> List[dict]:
+    asc_file: str,
+    year: int,
+    people_per_dot: int = 100,
+    lod_processor: Optional[LODProcessor] = None,
+    exact_area: bool = False,
+    columnar: bool = False,
+    cache_dir: Optional[str] = None,
+) -> Union[List[dict], Dict[str, np.ndarray]]:
     """
     Convert a HYDE ASC file to tile-ready settlement points.
 
@@ -76,78 +213,79 @@ def hyde_grid_to_tile_points(
         asc_file: Path to HYDE ASC file (e.g., popd_1850AD.asc)
         year: Year for this data
         people_per_dot: Number of people each dot represents
+        exact_area: Compute each cell's area with a geodesic pyproj call instead
+            of the per-row closed-form areas (slow; for validation)
+        columnar: Return lon/lat/population arrays instead of one dict per dot
+        cache_dir: Directory for the parsed-grid cache (default: no cache)
 
     Returns:
-        List of dicts with fields: lon, lat, population, year, type
+        List of dicts with fields: lon, lat, population, year, type; or with
+        columnar=True a dict of lon, lat and population arrays
     """
+    empty_result = (
+        {name: np.empty(0) for name in ("lon", "lat", "population")} if columnar else []
+    )
     print(f"  Processing year {year}...")
 
     try:
         # Read ASC file directly for consistent processing
         print(f"    Reading ASCII grid {os.path.basename(asc_file)}")
         with open(asc_file, "r", encoding="utf-8") as f_asc:
-            # ----- Parse header (first 6 lines) -----
-            header = {}
-            for _ in range(6):  # Standard ASCII grid header lines
-                line = f_asc.readline().strip()
-                key, value = line.split()
-                header[key.lower()] = float(value) if "." in value else int(value)
-
-            # Extract grid parameters
-            ncols = int(header["ncols"])
-            nrows = int(header["nrows"])
-            xllcorner = header["xllcorner"]
-            yllcorner = header["yllcorner"]
-            cellsize = header["cellsize"]
-            nodata_value = header.get("nodata_value", -9999)
+            # ----- Parse header: five fixed "<key> <value>" lines, then optional nodata -----
+            ncols = int(_read_header_field(f_asc, "ncols")[1])
+            nrows = int(_read_header_field(f_asc, "nrows")[1])
+            x_key, x_value = _read_header_field(f_asc, "xllcorner", "xllcenter")
+            y_key, y_value = _read_header_field(f_asc, "yllcorner", "yllcenter")
+            cellsize = float(_read_header_field(f_asc, "cellsize")[1])
+            # *llcenter gives the center of the lower-left cell, half a cell in from its corner
+            xllcorner = float(x_value) - (cellsize / 2 if x_key == "xllcenter" else 0)
+            yllcorner = float(y_value) - (cellsize / 2 if y_key == "yllcenter" else 0)
+            body_start = f_asc.tell()
+            nodata_line = f_asc.readline().split()
+            # Parsed in the grid's dtype so the sentinel compares equal to grid cells
+            if nodata_line and nodata_line[0].lower() == "nodata_value":
+                nodata_value = GRID_DTYPE(nodata_line[1])
+            else:
+                # No nodata line: that was the first data row
+                f_asc.seek(body_start)
+                nodata_value = GRID_DTYPE(-9999)
 
             print(f"    Grid: {ncols}x{nrows}, cellsize: {cellsize}°")
 
-            # Parse data efficiently by streaming directly from the file
-            data = np.loadtxt(f_asc, dtype=float)
+            # Parse data by streaming directly from the file, or map the cached parse
+            data = _load_grid_cached(asc_file, f_asc, (nrows, ncols), cache_dir)
             if data.shape != (nrows, ncols):
                 print(
                     f"    WARNING: Parsed grid shape {data.shape} != expected ({nrows}, {ncols})"
                 )
 
-        # Replace nodata with NaN
-        data[data == nodata_value] = np.nan
-
-        # Create coordinate arrays
-        # Longitude runs from west to east (xllcorner to xllcorner + ncols*cellsize)
-        lons = np.linspace(
-            xllcorner + cellsize / 2,
-            xllcorner + (ncols - 1) * cellsize + cellsize / 2,
-            ncols,
-        )
-
-        # Latitude: HYDE uses bottom-left origin (yllcorner = -90)
-        # Row 0 is the SOUTHERNMOST row, not the northernmost row
-        # So we need to go from south to north (bottom to top of the grid)
-        lats = np.linspace(
-            yllcorner + cellsize / 2,
-            yllcorner + (nrows - 1) * cellsize + cellsize / 2,
-            nrows,
-        )
+        # Coordinate axes, shared by every year with the same grid geometry
+        lons, row_lats, row_areas_km2 = _grid_axes(ncols, nrows, xllcorner, yllcorner, cellsize)
 
         print(
-            f"    Coordinate bounds: lon [{lons[0]:.2f}, {lons[-1]:.2f}], lat [{lats[0]:.2f}, {lats[-1]:.2f}]"
+            f"    Coordinate bounds: lon [{lons[0]:.2f}, {lons[-1]:.2f}], lat [{row_lats[-1]:.2f}, {row_lats[0]:.2f}]"
         )
         print(
             f"    Grid info: {ncols}x{nrows}, origin=({xllcorner}, {yllcorner}), cellsize={cellsize}"
         )
         print(f"    Expected global bounds: lon [-180, 180], lat [-90, 90]")
 
-        # Find cells with population data
-        valid_mask = ~np.isnan(data) & (data > 0)
+        # Skip extreme polar regions (keeping more of high-lat Europe) by cropping
+        # the grid to the rows between them before scanning; latitude falls
+        # monotonically with row index, so the kept rows are one contiguous band
+        band_rows = np.flatnonzero((row_lats <= 75) & (row_lats >= -70))
+        row_start = int(band_rows[0]) if len(band_rows) else 0
+        row_stop = int(band_rows[-1]) + 1 if len(band_rows) else 0
+
+        # Find populated cells in one pass over the band; nodata cells keep their
+        # sentinel rather than being rewritten to NaN first. The density threshold
+        # filters noise in HYDE data (kept low for all years to retain sparse
+        # populations) and, being positive, also excludes empty cells
+        min_density = 0.001
+        band = data[row_start:row_stop]
+        valid_mask = (band != nodata_value) & (band >= min_density)
         valid_indices = np.where(valid_mask)
 
-        print(f"    Found {len(valid_indices[0])} cells with population data")
-
-        # Process all populated cells (vectorized approach)
-        valid_i = valid_indices[0]
-        valid_j = valid_indices[1]
-
         # Use provided LOD processor or create one if none provided
         if lod_processor is None:
             # Enable settlement continuity by default for better visual continuity
@@ -155,58 +293,35 @@ def hyde_grid_to_tile_points(
             lod_processor = LODProcessor(continuity_config=continuity_config)
 
         # Vectorize coordinate transformations for all valid cells
-        # HYDE ASCII grids list data rows from north (top) to south (bottom).
-        # Therefore row index `i` (0-based from the file) refers to latitude
-        #   lat = yllcorner + (nrows - i - 0.5) * cellsize
-        # which flips the y-axis correctly. This prevents vertically mirrored
-        # or "up-side-down" placement on the map.
-        cell_lats = yllcorner + (nrows - valid_i - 0.5) * cellsize
-        cell_lons = lons[valid_j]
-        cell_densities = data[valid_i, valid_j]
-
-        # Apply vectorized filters
-        # Filter 1: Skip extreme polar regions; keep more of high-lat Europe
-        polar_mask = (cell_lats <= 75) & (cell_lats >= -70)
-        
-        # Filter 2: Apply density threshold to filter noise in HYDE data
-        # Use lower threshold for all years to retain sparse populations
-        min_density = 0.001
-        density_mask = cell_densities >= min_density
-        
-        # Combine all filters
-        valid_mask = polar_mask & density_mask
-        
-        # Apply filters to get final valid cells
-        final_i = valid_i[valid_mask]
-        final_j = valid_j[valid_mask]
-        final_lats = cell_lats[valid_mask]
-        final_lons = cell_lons[valid_mask]
-        final_densities = cell_densities[valid_mask]
-        
-        print(f"    After filtering: {len(final_i)} cells (from {len(valid_i)} with population)")
+        final_i = valid_indices[0] + row_start
+        final_j = valid_indices[1]
+        final_lats = row_lats[final_i]
+        final_lons = lons[final_j]
+        final_densities = band[valid_indices]
+
+        print(
+            f"    Found {len(final_i)} cells with population density >= {min_density} "
+            f"in rows {row_start}-{row_stop} (of {nrows})"
+        )
 
         # Pre-calculate all cell areas and populations using vectorized operations where possible
         print(f"    Calculating areas and populations for {len(final_i)} cells...")
         
-        # Pre-allocate arrays for batch processing
-        cell_areas_km2 = np.zeros(len(final_i))
-        cell_populations = np.zeros(len(final_i))
-        
-        # Calculate areas (geodesic calculation still needs to be done per-cell)
-        for idx in range(len(final_i)):
-            lat, lon = final_lats[idx], final_lons[idx]
-            density = final_densities[idx]
-
-            # Calculate total population in this cell using geodesic area
-            lon_w = lon - cellsize / 2
-            lon_e = lon + cellsize / 2
-            lat_s = lat - cellsize / 2
-            lat_n = lat + cellsize / 2
-            cell_area_m2, _ = geod.polygon_area_perimeter(
-                [lon_w, lon_e, lon_e, lon_w], [lat_s, lat_s, lat_n, lat_n]
-            )
-            cell_areas_km2[idx] = abs(cell_area_m2) / 1_000_000
-            cell_populations[idx] = density * cell_areas_km2[idx]
+        if exact_area:
+            cell_areas_km2 = np.zeros(len(final_i))
+            for idx in range(len(final_i)):
+                lat, lon = final_lats[idx], final_lons[idx]
+                lon_w = lon - cellsize / 2
+                lon_e = lon + cellsize / 2
+                lat_s = lat - cellsize / 2
+                lat_n = lat + cellsize / 2
+                cell_area_m2, _ = geod.polygon_area_perimeter(
+                    [lon_w, lon_e, lon_e, lon_w], [lat_s, lat_s, lat_n, lat_n]
+                )
+                cell_areas_km2[idx] = abs(cell_area_m2) / 1_000_000
+        else:
+            cell_areas_km2 = row_areas_km2[final_i]
+        cell_populations = final_densities * cell_areas_km2
 
         # Apply vectorized population caps
         max_reasonable_populations = cell_areas_km2 * 50000  # 50k people per km² max
@@ -215,75 +330,62 @@ def hyde_grid_to_tile_points(
         total_people = np.sum(cell_populations)
         print(f"    Total population calculated: {total_people:,.0f} people")
 
-        # Initialize dot array manager with estimated capacity
-        from array_manager import estimate_dot_capacity, DotArrayManager
-        estimated_capacity = estimate_dot_capacity(cell_populations, people_per_dot)
-        dot_manager = DotArrayManager(estimated_capacity)
-        print(f"    Estimated dots needed: {estimated_capacity}")
-
-        # Process cells for dot creation
+        # Density-aware dot creation for all cells in one batch
+        # Use LOD 3 (detailed) logic for base settlements to get maximum granularity
         print(f"    Creating dots for {len(final_i)} cells...")
-        for idx in range(len(final_i)):
-            i, j = final_i[idx], final_j[idx]
-            lat, lon = final_lats[idx], final_lons[idx]
-            cell_population = cell_populations[idx]
-
-            # Density-aware dot creation to handle high-concentration areas
-            # Use LOD 3 (detailed) logic for base settlements to get maximum granularity
-            dots_created = lod_processor.create_density_aware_dots(
-                cell_population, lat, lon, cellsize, people_per_dot, lod_level=3
-            )
-
-            for dot_info in dots_created:
-                dot_lat, dot_lon, dot_population = dot_info
-
-                # Validate coordinates are within reasonable bounds
-                if not (-180 <= dot_lon <= 180 and -90 <= dot_lat <= 90):
-                    print(
-                        f"    WARNING: Invalid coordinates: ({dot_lon:.2f}, {dot_lat:.2f}) from cell ({i}, {j})"
-                    )
-                    continue
+        dot_lats, dot_lons, dot_pops = lod_processor.create_density_aware_dots_batch(
+            cell_populations, final_lats, final_lons, cellsize, people_per_dot, lod_level=3
+        )
 
-                # Add dot to managed storage
-                dot_manager.add_dot(dot_lon, dot_lat, dot_population)
+        # Validate coordinates are within reasonable bounds
+        in_bounds = (
+            (dot_lons >= -180) & (dot_lons <= 180) & (dot_lats >= -90) & (dot_lats <= 90)
+        )
+        if not in_bounds.all():
+            # One summary line rather than a print per bad dot
+            bad = np.flatnonzero(~in_bounds)
+            samples = ", ".join(f"({dot_lons[k]:.2f}, {dot_lats[k]:.2f})" for k in bad[:5])
+            print(f"    WARNING: Dropping {len(bad)} dots with invalid coordinates, e.g. {samples}")
+            dot_lats, dot_lons, dot_pops = dot_lats[in_bounds], dot_lons[in_bounds], dot_pops[in_bounds]
 
-        # Convert to final format and get statistics
-        dots = dot_manager.to_dict_list(year)
-        stats = dot_manager.get_statistics()
-        print(f"    Created {stats['count']} dots (estimated {estimated_capacity}, utilization: {stats['utilization']:.1%})")
+        print(f"    Created {len(dot_pops)} dots")
 
-        # Return list of points
-        if dots:
+        # Return the points
+        if len(dot_pops):
             # Add geographic validation by showing sample coordinates
-            sample = dots[: min(5, len(dots))]
-            sample_coords = [(d["lon"], d["lat"]) for d in sample]
+            sample_coords = list(zip(dot_lons[:5].tolist(), dot_lats[:5].tolist()))
             print(f"    Sample coordinates: {sample_coords}")
 
 
             print(
-                f"    Created {len(dots)} settlement points for year {year} ({total_people:,.0f} people)"
+                f"    Created {len(dot_pops)} settlement points for year {year} ({total_people:,.0f} people)"
             )
             
             # Clean up large arrays to free memory
-            del data, lons, lats, valid_mask, valid_indices
-            del cell_lats, cell_lons, cell_densities, final_i, final_j, final_lats, final_lons, final_densities
-            del cell_areas_km2, cell_populations, dot_manager
-            return dots
+            del data, band, valid_mask, valid_indices
+            del final_i, final_j, final_lats, final_lons, final_densities
+            del cell_areas_km2, cell_populations
+            if columnar:
+                return {"lon": dot_lons, "lat": dot_lats, "population": dot_pops}
+            return [
+                {"lon": lon, "lat": lat, "population": pop, "year": year, "type": "settlement"}
+                for lon, lat, pop in zip(dot_lons.tolist(), dot_lats.tolist(), dot_pops.tolist())
+            ]
         else:
             print(f"    No data found for year {year}")
             # Clean up arrays even when no data found
-            del data, lons, lats, valid_mask, valid_indices
-            del cell_lats, cell_lons, cell_densities, final_i, final_j, final_lats, final_lons, final_densities
-            return []
+            del data, band, valid_mask, valid_indices
+            del final_i, final_j, final_lats, final_lons, final_densities
+            return empty_result
 
     except Exception as e:
         print(f"    Error processing {asc_file}: {e}")
         # Clean up any allocated arrays on error
         try:
-            del data, lons, lats
+            del data
         except:
             pass
-        return []
+        return empty_result
 
 
 def _parse_year_from_filename(name: str) -> Optional[int]:
@@ -309,13 +411,140 @@ def _parse_year_from_filename(name: str) -> Optional[int]:
     return None
 
 
-def find_hyde_files(raw_dir: str) -> Dict[int, str]:
+# Discovery results can be persisted in an output/cache directory (never next to the
+# source rasters, which may be read-only) so warm runs skip the walk
+HYDE_INDEX_VERSION = 2
+# Directories modified this close to a scan may change again within the same
+# filesystem timestamp tick, so such a scan is never reused (cf. git's "racy" index)
+_RACY_WINDOW_NS = 1_000_000_000
+
+# In-process scans, keyed by raw_dir and revalidated against directory mtimes
+_HYDE_SCANS: Dict[str, Dict[str, Any]] = {}
+
+
+def hyde_index_path(cache_dir: str, raw_dir: str) -> pathlib.Path:
+    """Path of the persisted discovery index for raw_dir under cache_dir."""
+    key = hashlib.blake2b(
+        os.path.realpath(raw_dir).encode("utf-8"), digest_size=8
+    ).hexdigest()
+    return pathlib.Path(cache_dir) / f".hyde_index_{key}.json"
+
+
+def _hyde_scan_is_current(raw_dir: str, scan: Dict[str, Any]) -> bool:
+    """True if no directory seen by the scan has changed since.
+
+    Adding or removing a file or subdirectory bumps its parent directory's mtime,
+    so checking the mtime of every directory seen by the scan detects any change
+    without listing their entries.
+    """
+    try:
+        if scan["racy"]:
+            return False
+        for rel_dir, mtime_ns in scan["dirs"].items():
+            if os.stat(os.path.join(raw_dir, rel_dir)).st_mtime_ns != mtime_ns:
+                return False
+        return True
+    except (OSError, KeyError, TypeError, AttributeError):
+        return False
+
+
+def _read_hyde_index(cache_dir: str, raw_dir: str) -> Optional[Dict[str, Any]]:
+    """Return the persisted scan of raw_dir, or None if missing, corrupt or stale."""
+    try:
+        with open(hyde_index_path(cache_dir, raw_dir), "rb") as f_index:
+            scan = json.load(f_index)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(scan, dict) or scan.get("version") != HYDE_INDEX_VERSION:
+        return None
+    if scan.get("raw_dir") != os.path.realpath(raw_dir):
+        return None
+    return scan if _hyde_scan_is_current(raw_dir, scan) else None
+
+
+def _write_hyde_index(cache_dir: str, raw_dir: str, scan: Dict[str, Any]) -> None:
+    """Atomically persist a scan of raw_dir under cache_dir; best effort."""
+    path = hyde_index_path(cache_dir, raw_dir)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".json.tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f_out:
+            json.dump(scan, f_out)
+        os.replace(tmp_path, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+
+
+def _scan_hyde_files(raw_dir: str) -> Dict[str, Any]:
+    """Recursively scan raw_dir for HYDE ASC files.
+
+    Returns a scan record holding the sorted (year, path) pairs (paths relative to
+    raw_dir) and the mtime of every directory walked, for later revalidation.
+    """
+    started_ns = time.time_ns()
+    candidates: List[Tuple[int, str]] = []
+    dir_mtimes: Dict[str, int] = {}
+    # os.scandir walk: DirEntry names and types come straight from readdir, without
+    # building a Path per entry. Like rglob, symlinked directories are not followed.
+    pending = [raw_dir]
+    while pending:
+        current = pending.pop()
+        dir_mtimes[os.path.relpath(current, raw_dir)] = os.stat(current).st_mtime_ns
+        with os.scandir(current) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif name.endswith(".asc"):
+                    year = _parse_year_from_filename(name)
+                    if year is not None:
+                        candidates.append((year, os.path.relpath(entry.path, raw_dir)))
+    return {
+        "version": HYDE_INDEX_VERSION,
+        "raw_dir": os.path.realpath(raw_dir),
+        "racy": max(dir_mtimes.values()) >= started_ns - _RACY_WINDOW_NS,
+        "dirs": dir_mtimes,
+        "files": sorted(candidates),
+    }
+
+
+def _hyde_files(
+    raw_dir: str, cache_dir: Optional[str] = None, refresh: bool = False
+) -> List[Tuple[int, str]]:
+    """Sorted (year, path) pairs under raw_dir, reusing a scan while it is current.
+
+    A scan is reused from memory, then from cache_dir's index (if given), as long
+    as no directory under raw_dir has changed since; otherwise raw_dir is walked
+    and the index rewritten.
+    """
+    scan = None if refresh else _HYDE_SCANS.get(raw_dir)
+    if scan is None or not _hyde_scan_is_current(raw_dir, scan):
+        scan = None
+        if cache_dir is not None and not refresh:
+            scan = _read_hyde_index(cache_dir, raw_dir)
+        if scan is None:
+            scan = _scan_hyde_files(raw_dir)
+            if cache_dir is not None:
+                _write_hyde_index(cache_dir, raw_dir, scan)
+        _HYDE_SCANS[raw_dir] = scan
+    return [(year, os.path.join(raw_dir, rel_path)) for year, rel_path in scan["files"]]
+
+
+def find_hyde_files(
+    raw_dir: str, refresh: bool = False, cache_dir: Optional[str] = None
+) -> Dict[int, str]:
     """Discover all HYDE population-density ASC files and return a mapping year->path.
 
     Scans the provided directory (recursively) for files matching
     'popd_<YEAR>(BC|AD).asc' and parses the year accordingly. If multiple files
     for the same year are present (e.g., different scenarios), the first one
-    encountered is used.
+    encountered is used. Scan results are reused while no directory under raw_dir
+    has changed: in memory, and across runs via an index in cache_dir when given
+    (raw_dir itself is never written). Pass refresh=True to force a rescan.
     """
     hyde_files: Dict[int, str] = {}
     hyde_dir = pathlib.Path(raw_dir)
@@ -324,17 +553,10 @@ def find_hyde_files(raw_dir: str) -> Dict[int, str]:
         print(f"Raw data directory not found: {hyde_dir}")
         return hyde_files
 
-    # Recursively search for any matching ASC files
-    candidates: List[Tuple[int, pathlib.Path]] = []
-    for p in hyde_dir.rglob("*.asc"):
-        year = _parse_year_from_filename(p.name)
-        if year is not None:
-            candidates.append((year, p))
-
     # Deduplicate by year, keep first encountered
-    for year, path in sorted(candidates, key=lambda t: (t[0], str(t[1]))):
+    for year, path in _hyde_files(str(hyde_dir), cache_dir, refresh):
         if year not in hyde_files:
-            hyde_files[year] = str(path)
+            hyde_files[year] = path
 
     if hyde_files:
         min_y, max_y = min(hyde_files.keys()), max(hyde_files.keys())
@@ -348,7 +570,8 @@ def find_hyde_files(raw_dir: str) -> Dict[int, str]:
 
 
 def generate_yearly_tile_data(
-    asc_file: str, year: int, output_dir: str, people_per_dot: int = 100, force: bool = False, lod_processor: Optional[LODProcessor] = None
+    asc_file: str, year: int, output_dir: str, people_per_dot: int = 100, force: bool = False, lod_processor: Optional[LODProcessor] = None,
+    exact_area: bool = False,
 ) -> ProcessingResult:
     """
     Generate hierarchical tile data for a single year from HYDE grid data.
@@ -359,6 +582,7 @@ def generate_yearly_tile_data(
         output_dir: Directory to save processed data
         people_per_dot: Number of people each dot represents
         force: If True, overwrite existing files; if False, skip if files exist
+        exact_area: Use per-cell geodesic areas (see hyde_grid_to_tile_points)
 
     Returns:
         ProcessingResult with LOD data and statistics
@@ -384,47 +608,50 @@ def generate_yearly_tile_data(
         lod_processor = LODProcessor(config=lod_config, continuity_config=continuity_config)
 
     # First convert ASC to settlements using shared LOD processor
-    points = hyde_grid_to_tile_points(asc_file, year, people_per_dot_effective, lod_processor)
+    points = hyde_grid_to_tile_points(
+        asc_file, year, people_per_dot_effective, lod_processor, exact_area=exact_area,
+        columnar=True, cache_dir=output_dir,
+    )
     # Normalize to list of dicts to support tests that patch this to return a GeoDataFrame
     points_list: List[dict] = []
+    columns: Optional[Dict[str, np.ndarray]] = None
     try:
         # Pandas/GeoPandas DataFrame-like objects expose `.empty` and `.itertuples()`
         is_df_like = hasattr(points, "empty") and hasattr(points, "itertuples")
     except Exception:
         is_df_like = False
 
-    if isinstance(points, list):
+    if isinstance(points, dict):
+        columns = points
+    elif isinstance(points, list):
         points_list = points
     elif is_df_like:  # type: ignore[truthy-bool]
-        if getattr(points, "empty", True):
-            points_list = []
-        else:
+        if not getattr(points, "empty", True):
+            import shapely
+
             cols = list(getattr(points, "columns", []))
-            has_geom = "geometry" in cols
-            for row in points.itertuples(index=False):  # type: ignore[attr-defined]
-                # Prefer geometry.x/y if present; fallback to lon/lat columns
-                lon_val = None
-                lat_val = None
-                if has_geom:
-                    geom = getattr(row, "geometry", None)
-                    if geom is not None:
-                        # shapely Point exposes .x/.y
-                        lon_val = getattr(geom, "x", None)
-                        lat_val = getattr(geom, "y", None)
-                if lon_val is None or lat_val is None:
-                    lon_val = getattr(row, "lon", None)
-                    lat_val = getattr(row, "lat", None)
-                if lon_val is None or lat_val is None:
-                    continue
-                points_list.append(
-                    {
-                        "lon": float(lon_val),
-                        "lat": float(lat_val),
-                        "population": float(getattr(row, "population", 0.0)),
-                        "year": int(getattr(row, "year", year)),
-                        "type": str(getattr(row, "type", "settlement")),
-                    }
-                )
+            n = len(points)
+            # Prefer geometry x/y if present; fallback to lon/lat columns
+            lon = np.full(n, np.nan)
+            lat = np.full(n, np.nan)
+            if "geometry" in cols:
+                geometries = np.asarray(points["geometry"], dtype=object)
+                lon = shapely.get_x(geometries)
+                lat = shapely.get_y(geometries)
+            if "lon" in cols and "lat" in cols:
+                missing = np.isnan(lon) | np.isnan(lat)
+                lon[missing] = points["lon"].to_numpy(np.float64)[missing]
+                lat[missing] = points["lat"].to_numpy(np.float64)[missing]
+            located = ~(np.isnan(lon) | np.isnan(lat))
+            population = (
+                points["population"].to_numpy(np.float64)
+                if "population" in cols else np.zeros(n)
+            )
+            columns = {
+                "lon": lon[located],
+                "lat": lat[located],
+                "population": population[located],
+            }
     else:
         # Unknown type; attempt a best-effort conversion
         try:
@@ -432,7 +659,16 @@ def generate_yearly_tile_data(
         except Exception:
             points_list = []
 
-    if len(points_list) == 0:
+    if columns is None:
+        n = len(points_list)
+        columns = {
+            name: np.fromiter((d[name] for d in points_list), np.float64, n)
+            for name in ("lon", "lat", "population")
+        }
+    del points, points_list
+
+    point_count = len(columns["population"])
+    if point_count == 0:
         print(f"    No data found for year {year}")
         return ProcessingResult(
             year=year,
@@ -441,31 +677,23 @@ def generate_yearly_tile_data(
             processing_stats={"error": "No data found"},
         )
 
-    # Convert GeoDataFrame to HumanSettlement objects
-    settlements = []
+    # Convert points to a structure-of-arrays settlement batch
     cellsize = 0.083333  # HYDE 3.5 approximate resolution
 
-    for d in points_list:
-        try:
-            settlement = HumanSettlement(
-                coordinates=Coordinates(longitude=float(d["lon"]), latitude=float(d["lat"])),
-                population=float(d["population"]),
-                year=int(d["year"]),
-                settlement_type=str(d.get("type", "settlement")),
-                source_resolution=cellsize,
-            )
-            settlements.append(settlement)
-        except Exception as e:
-            print(f"    Warning: Skipping invalid settlement: {e}")
-            continue
+    settlements = SettlementBatch.from_arrays(
+        columns["lon"], columns["lat"], columns["population"], year, cellsize
+    )
+    skipped = point_count - len(settlements)
+    if skipped:
+        print(f"    Warning: Skipped {skipped} invalid settlements (out-of-range coordinates or non-positive population)")
 
-    print(f"    Converted {len(settlements)} point features to settlement objects")
+    print(f"    Converted {len(settlements)} point features to settlement arrays")
 
     # Create hierarchical LOD data
     lod_data = lod_processor.create_hierarchical_lods(settlements)
 
     # Calculate total population
-    total_population = sum(s.population for s in settlements)
+    total_population = float(settlements.population.sum())
 
     # Tiles-only: no file writes here. LOD data is returned to the caller for tile generation.
 
@@ -488,25 +716,89 @@ def generate_yearly_tile_data(
     )
     
     # Clean up intermediate data structures to free memory
-    del settlements, points_list
+    del settlements, columns
     
     return result
 
 
 
+@functools.lru_cache(maxsize=1)
+def _batch_lod_processor() -> LODProcessor:
+    """LOD processor shared by every year a batch run handles in this process."""
+    # For batch processing, disable continuity to prevent memory accumulation in settlement registry
+    lod_config = LODConfiguration(
+        global_grid_size=1.0,  # REGIONAL LOD - coarse overview (this is where we want randomization!)
+        regional_grid_size=0.5,  # SUBREGIONAL LOD - medium detail  
+        local_grid_size=0.1,   # LOCAL LOD - fine detail
+        min_population_threshold=0.0,  # DISABLED - preserve all population
+    )
+    continuity_config = SettlementContinuityConfig(enable_continuity=False)  # Disable for batch processing
+    return LODProcessor(config=lod_config, continuity_config=continuity_config)
+
+
+def _year_stats(
+    asc_file: str, year: int, output_dir: str, force: bool, exact_area: bool
+) -> Dict[str, Any]:
+    """Process one year and keep only its lightweight statistics."""
+    result = generate_yearly_tile_data(
+        asc_file, year, output_dir, force=force, lod_processor=_batch_lod_processor(),
+        exact_area=exact_area,
+    )
+    return _result_stats(result)
+
+
+def _result_stats(result: ProcessingResult) -> Dict[str, Any]:
+    """Reduce a year's ProcessingResult to the statistics callers keep across years."""
+    return {
+        "year": result.year,
+        "total_population": result.total_population,
+        "lod_counts": {
+            (level.name if hasattr(level, 'name') else f"LOD_{level}"): len(settlements) 
+            for level, settlements in result.lod_data.items()
+        },
+        "processing_stats": result.processing_stats
+    }
+
+
+def _year_stats_captured(
+    asc_file: str, year: int, output_dir: str, force: bool, exact_area: bool
+) -> Tuple[Optional[Dict[str, Any]], str]:
+    """Run _year_stats in a worker process, returning its stats (None on error) and log."""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        try:
+            stats = _year_stats(asc_file, year, output_dir, force, exact_area)
+            print(f"    Worker memory after year {year}: {get_memory_usage()}")
+        except Exception as e:
+            print(f"  Error processing {asc_file}: {e}")
+            stats = None
+    return stats, buf.getvalue()
+
+
+def _init_year_worker() -> None:
+    """Give each worker its own legacy RNG state (forked workers inherit the parent's)."""
+    np.random.seed()
+
+
 def generate_all_tile_data(
-    raw_dir: str, output_dir: str, force: bool = False
+    raw_dir: str, output_dir: str, force: bool = False, exact_area: bool = False,
+    jobs: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Generate tile data for all HYDE years with hierarchical LODs.
     
     Memory-optimized version that only retains processing statistics,
-    not the full LOD data, to prevent memory accumulation.
+    not the full LOD data, to prevent memory accumulation. Years are
+    independent, so they are processed in parallel worker processes.
 
     Args:
         raw_dir: Directory containing HYDE ASC files
         output_dir: Directory to save processed data
         force: If True, overwrite existing files; if False, skip existing files
+        exact_area: Use per-cell geodesic areas (see hyde_grid_to_tile_points)
+        jobs: Worker processes (default: half the CPU count; 1 processes years
+            in-process). Bounded because each worker holds a whole year's grid,
+            dots and LOD objects at once, so memory grows with every extra worker
 
     Returns:
         List of lightweight processing statistics for each year
@@ -515,7 +807,7 @@ def generate_all_tile_data(
     print(f"🌍 {mode} tile data with hierarchical LODs...")
     print("  (Creating multiple resolution levels for tile performance)")
 
-    hyde_files = find_hyde_files(raw_dir)
+    hyde_files = find_hyde_files(raw_dir, cache_dir=output_dir)
     print(f"Found {len(hyde_files)} HYDE files for target years")
 
     if not hyde_files:
@@ -524,17 +816,6 @@ def generate_all_tile_data(
             "Please ensure HYDE data is available in data/raw/hyde-3.5/."
         )
 
-    # Create shared LOD processor for all years to reduce overhead
-    # For batch processing, disable continuity to prevent memory accumulation in settlement registry
-    lod_config = LODConfiguration(
-        global_grid_size=1.0,  # REGIONAL LOD - coarse overview (this is where we want randomization!)
-        regional_grid_size=0.5,  # SUBREGIONAL LOD - medium detail  
-        local_grid_size=0.1,   # LOCAL LOD - fine detail
-        min_population_threshold=0.0,  # DISABLED - preserve all population
-    )
-    continuity_config = SettlementContinuityConfig(enable_continuity=False)  # Disable for batch processing
-    shared_lod_processor = LODProcessor(config=lod_config, continuity_config=continuity_config)
-    
     # Only keep lightweight statistics, not full LOD data
     processed_stats = []
     total_population_all_years = 0.0
@@ -542,39 +823,44 @@ def generate_all_tile_data(
     # Report initial memory usage
     initial_memory = get_memory_usage()
     print(f"  Starting memory usage: {initial_memory}")
-    
-    for year in sorted(hyde_files.keys()):
-        asc_file = hyde_files[year]
-        try:
-            # Process year and get full result using shared LOD processor
-            result = generate_yearly_tile_data(asc_file, year, output_dir, force=force, lod_processor=shared_lod_processor)
-            
-            # Extract only essential statistics
-            year_stats = {
-                "year": result.year,
-                "total_population": result.total_population,
-                "lod_counts": {
-                    (level.name if hasattr(level, 'name') else f"LOD_{level}"): len(settlements) 
-                    for level, settlements in result.lod_data.items()
-                },
-                "processing_stats": result.processing_stats
-            }
+
+    years = sorted(hyde_files.keys())
+    jobs = max(1, min(jobs or (os.cpu_count() or 2) // 2, len(years)))
+    if jobs == 1:
+        for year in years:
+            asc_file = hyde_files[year]
+            try:
+                year_stats = _year_stats(asc_file, year, output_dir, force, exact_area)
+            except Exception as e:
+                print(f"  Error processing {asc_file}: {e}")
+                continue
             processed_stats.append(year_stats)
-            total_population_all_years += result.total_population
-            
-            # Explicitly free the large LOD data from memory
-            del result
-            
+            total_population_all_years += year_stats["total_population"]
+
             # Force garbage collection after each year to free memory
             gc.collect()
-            
+
             # Report memory usage after processing this year
             current_memory = get_memory_usage()
             print(f"    Memory after year {year}: {current_memory}")
-
-        except Exception as e:
-            print(f"  Error processing {asc_file}: {e}")
-            continue
+    else:
+        # Only paths and flags cross the process boundary; each worker builds its
+        # own LOD processor. Logs are printed in year order as years complete.
+        print(f"  Processing {len(years)} years with {jobs} parallel jobs...")
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_year_worker) as executor:
+            results = executor.map(
+                _year_stats_captured,
+                [hyde_files[year] for year in years],
+                years,
+                itertools.repeat(output_dir),
+                itertools.repeat(force),
+                itertools.repeat(exact_area),
+            )
+            for year_stats, log in results:
+                print(log, end="")
+                if year_stats is not None:
+                    processed_stats.append(year_stats)
+                    total_population_all_years += year_stats["total_population"]
 
     # Print summary statistics
     print(f"\n✓ Processed {len(processed_stats)} years with hierarchical LODs")
@@ -603,6 +889,18 @@ def main():
         type=int,
         help="Process specific years (e.g., --years 1850 1900 or --years -1000 0 1850)"
     )
+    parser.add_argument(
+        "--exact-area",
+        action="store_true",
+        help="Compute cell areas with per-cell geodesic pyproj calls (slow; for validating the closed-form areas)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Years to process in parallel when processing all years (default: half the "
+             "CPU count, since each worker holds a whole year in memory)"
+    )
     args = parser.parse_args()
 
     # Resolve paths relative to this script so it works from any CWD
@@ -618,7 +916,7 @@ def main():
 
     # Filter to specific years if requested
     if args.years is not None:
-        hyde_files = find_hyde_files(str(raw_dir))
+        hyde_files = find_hyde_files(str(raw_dir), cache_dir=str(output_dir))
         
         # Validate all requested years exist
         missing_years = [year for year in args.years if year not in hyde_files]
@@ -639,18 +937,15 @@ def main():
             print(f"\n[{i}/{year_count}] Processing year {year}...")
             asc_file = hyde_files[year]
             try:
-                result = generate_yearly_tile_data(asc_file, year, str(output_dir), force=args.force)
-                results.append(result)
-                
-                # Handle both LODLevel enum and integer keys
-                counts = {}
-                for level, setts in result.lod_data.items():
-                    try:
-                        level_name = level.name if hasattr(level, 'name') else f"LOD_{level}"
-                    except AttributeError:
-                        level_name = f"LOD_{level}"
-                    counts[level_name] = len(setts)
-                print(f"✓ Year {year}: {counts} | Population: {result.total_population:,.0f}")
+                result = generate_yearly_tile_data(
+                    asc_file, year, str(output_dir), force=args.force, exact_area=args.exact_area
+                )
+                # Keep only statistics so memory stays bounded by a single year's LODs
+                year_stats = _result_stats(result)
+                del result
+                gc.collect()
+                results.append(year_stats)
+                print(f"✓ Year {year}: {year_stats['lod_counts']} | Population: {year_stats['total_population']:,.0f}")
                 
             except Exception as e:
                 print(f"❌ Error processing year {year}: {e}")
@@ -661,7 +956,10 @@ def main():
         # Process all years
         processing_mode = "force mode" if args.force else "incremental mode (skipping existing)"
         print(f"Using hierarchical LOD processing as default (population-preserving) in {processing_mode}...")
-        results = generate_all_tile_data(str(raw_dir), str(output_dir), force=args.force)
+        results = generate_all_tile_data(
+            str(raw_dir), str(output_dir), force=args.force, exact_area=args.exact_area,
+            jobs=args.jobs,
+        )
 
     # Only show summary for all-year processing
     if args.years is None:
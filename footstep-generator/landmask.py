@@ -72,3 +72,26 @@ def is_land(lat: float, lon: float) -> bool:
         return _LAND_GEOMETRY.contains(Point(lon, lat))
     except Exception:
         return True
+
+
+def is_land_array(lats, lons):
+    """Vectorized is_land: boolean array, True where (lat, lon) lies on land.
+
+    Tests every point against the landmask in one GEOS call. Falls back to all
+    True if the landmask is not available.
+    """
+    import numpy as np
+
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    if _LAND_GEOMETRY is None:
+        return np.ones(lats.shape, dtype=bool)
+    try:
+        import shapely  # type: ignore
+
+        # shapely.prepared.prep wraps the geometry; contains_xy wants the geometry
+        geometry = getattr(_LAND_GEOMETRY, "context", _LAND_GEOMETRY)
+        shapely.prepare(geometry)
+        return shapely.contains_xy(geometry, lons, lats)
+    except Exception:
+        return np.ones(lats.shape, dtype=bool)
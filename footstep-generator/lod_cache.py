@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of computed LOD data, keyed by the source HYDE ASC file.
+
+Computing hierarchical LODs from an ASC grid is the expensive step of a tile build.
+Re-runs with a different --years subset, or rebuilds after a tippecanoe tweak, can
+reuse the previous result as long as the ASC file and LOD pipeline are unchanged.
+Each year is stored as one uncompressed .npz of per-LOD columns.
+"""
+
+import hashlib
+import os
+import pathlib
+import tempfile
+from typing import Any, Dict, List
+
+import numpy as np
+
+from models import AggregatedSettlement, LODLevel, trusted_aggregated_settlement
+
+# Bump whenever LOD processing changes in a way that alters its output
+LOD_CACHE_VERSION = 2
+LOD_CACHE_DIRNAME = ".lod_cache"
+
+# (npz column suffix, dtype) in the order settlements are flattened
+_COLUMNS = (
+    ("lon", np.float64),
+    ("lat", np.float64),
+    ("population", np.float64),
+    ("year", np.int64),
+    ("grid_size", np.float64),
+    ("source_dots", np.int64),
+    ("density", np.float64),
+)
+
+
+def lod_cache_key(asc_file: str, year: int) -> str:
+    """Content-address a year's LODs by ASC identity (path, mtime, size) and cache version."""
+    st = os.stat(asc_file)
+    ident = f"{os.path.realpath(asc_file)}|{st.st_mtime_ns}|{st.st_size}|{year}|v{LOD_CACHE_VERSION}"
+    return hashlib.blake2b(ident.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def lod_cache_path(tiles_dir: str, asc_file: str, year: int) -> pathlib.Path:
+    """Path of the cache entry for (asc_file, year) under tiles_dir."""
+    key = lod_cache_key(asc_file, year)
+    return pathlib.Path(tiles_dir) / LOD_CACHE_DIRNAME / f"lods_{year}_{key}.npz"
+
+
+def save_lod_data(path: pathlib.Path, lod_data: Dict[Any, List[AggregatedSettlement]]) -> None:
+    """Atomically write lod_data to path, replacing stale entries for the same year."""
+    arrays: Dict[str, np.ndarray] = {}
+    for level, settlements in lod_data.items():
+        lv = int(getattr(level, "value", level))
+        rows = [
+            (
+                s.coordinates.longitude,
+                s.coordinates.latitude,
+                s.total_population,
+                s.year,
+                s.grid_size_degrees,
+                s.source_dot_count,
+                s.average_density,
+            )
+            for s in settlements
+        ]
+        table = np.array(rows, dtype=np.float64).reshape(-1, len(_COLUMNS))
+        for i, (name, dtype) in enumerate(_COLUMNS):
+            arrays[f"lod{lv}_{name}"] = table[:, i].astype(dtype)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".npz.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f_out:
+            np.savez(f_out, **arrays)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    # Entries for this year under an older key can never be hit again
+    year_prefix = path.name.rsplit("_", 1)[0] + "_"
+    for stale in path.parent.glob(f"{year_prefix}*.npz"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+
+def load_lod_data(path: pathlib.Path) -> Dict[LODLevel, List[AggregatedSettlement]]:
+    """Rebuild the LOD -> AggregatedSettlement mapping stored by save_lod_data."""
+    lod_data: Dict[LODLevel, List[AggregatedSettlement]] = {}
+    with np.load(path) as data:
+        levels = sorted({int(name.split("_", 1)[0][3:]) for name in data.files})
+        for lv in levels:
+            level = LODLevel(lv)
+            columns = [data[f"lod{lv}_{name}"].tolist() for name, _ in _COLUMNS]
+            # Entries are only ever written from validated LOD output
+            lod_data[level] = [
+                trusted_aggregated_settlement(lon, lat, pop, year, level, grid, src, density)
+                for lon, lat, pop, year, grid, src, density in zip(*columns)
+            ]
+    return lod_data
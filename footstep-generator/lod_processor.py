@@ -5,21 +5,64 @@ Implements hierarchical spatial aggregation for performance optimization.
 """
 
 import numpy as np
-import pandas as pd
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from models import (
     LODLevel,
-    Coordinates,
     HumanSettlement,
+    SettlementBatch,
     AggregatedSettlement,
     LODConfiguration,
     ProcessingStatistics,
     SettlementContinuityConfig,
+    trusted_aggregated_settlement,
+    validate_batch,
 )
 from settlement_registry import SettlementRegistry
 from dot_generator import DotGenerator
 
 
+# SplitMix64 finalizer constants (Steele, Lea & Flood, "Fast splittable
+# pseudorandom number generators", 2014)
+_MASK64 = (1 << 64) - 1
+_SPLITMIX_GAMMA = 0x9E3779B97F4A7C15
+_SPLITMIX_MUL_1 = 0xBF58476D1CE4E5B9
+_SPLITMIX_MUL_2 = 0x94D049BB133111EB
+
+
+def _splitmix64(z):
+    """One SplitMix64 step: z + gamma, then the 64-bit finalizer.
+
+    Works on non-negative Python ints below 2**64 and elementwise on uint64 arrays
+    (whose arithmetic wraps at 64 bits, matching the masks).
+    """
+    z = (z + _SPLITMIX_GAMMA) & _MASK64
+    z = ((z ^ (z >> 30)) * _SPLITMIX_MUL_1) & _MASK64
+    z = ((z ^ (z >> 27)) * _SPLITMIX_MUL_2) & _MASK64
+    return z ^ (z >> 31)
+
+
+def _cell_seed(x, y, year: int):
+    """31-bit randomization seed of grid cell (x, y) in year.
+
+    SplitMix64 chained over x, y and year taken as 64-bit two's complement:
+    seed = splitmix64(splitmix64(splitmix64(x) ^ y) ^ year) & 0x7FFFFFFF.
+    x and y are Python ints or int64 arrays (elementwise); the result has the
+    same form. Fixed by this definition alone, so tile positions do not depend
+    on the interpreter.
+    """
+    if isinstance(x, np.ndarray):
+        x = x.astype(np.int64).view(np.uint64)
+        y = y.astype(np.int64).view(np.uint64)
+        h = _splitmix64(x)
+        h = _splitmix64(h ^ y)
+        h = _splitmix64(h ^ (year & _MASK64))
+        return (h & 0x7FFFFFFF).astype(np.int64)
+    h = _splitmix64(x & _MASK64)
+    h = _splitmix64(h ^ (y & _MASK64))
+    h = _splitmix64(h ^ (year & _MASK64))
+    return h & 0x7FFFFFFF
+
+
 class LODProcessor:
     """Processes human settlement data into hierarchical Level-of-Detail datasets."""
 
@@ -41,14 +84,18 @@ class LODProcessor:
         )
 
     def create_hierarchical_lods(
-        self, settlements: List[HumanSettlement]
+        self, settlements: Union[List[HumanSettlement], SettlementBatch]
     ) -> Dict[LODLevel, List[AggregatedSettlement]]:
         """
         Create hierarchical Level-of-Detail datasets using Pydantic models.
         Aggregates population data into progressively larger grid cells.
 
+        Materializes every level at once; callers that write levels out one by
+        one should prefer ``stream_lods`` to keep peak memory bounded.
+
         Args:
-            settlements: List of individual settlements from HYDE data
+            settlements: Individual settlements from HYDE data, as objects or
+                a SettlementBatch
 
         Returns:
             Dictionary mapping LOD levels to aggregated settlements
@@ -56,27 +103,103 @@ class LODProcessor:
         if not settlements:
             return {level: [] for level in LODLevel}
 
-        # Extract year from first settlement (all should be same year)
-        year = settlements[0].year
-
+        if not isinstance(settlements, SettlementBatch):
+            settlements = SettlementBatch.from_settlements(settlements)
+        validate_batch(settlements)
         lod_results = {}
+        lod_totals = {}
+        for lod_level, aggregated, lod_total in self._build_lods(settlements):
+            lod_results[lod_level] = aggregated
+            lod_totals[lod_level] = lod_total
+
+        # Validate population conservation
+        self._validate_population_conservation(settlements, lod_results, lod_totals)
+
+        return lod_results
+
+    def stream_lods(
+        self,
+        settlements: Union[List[HumanSettlement], SettlementBatch],
+        validate: bool = True,
+    ) -> Iterator[Tuple[LODLevel, List[AggregatedSettlement]]]:
+        """
+        Yield hierarchical LOD datasets one level at a time.
+
+        Each level is built only when requested, so a caller that writes a level
+        and drops its reference before advancing holds a single level in memory
+        instead of all four.
+
+        Args:
+            settlements: Individual settlements from HYDE data, as objects or
+                a SettlementBatch
+            validate: Check population conservation for each level as it is yielded
+
+        Yields:
+            (LOD level, aggregated settlements) pairs, DETAILED first
+        """
+        if not settlements:
+            for level in LODLevel:
+                yield level, []
+            return
+
+        batch = (
+            settlements
+            if isinstance(settlements, SettlementBatch)
+            else SettlementBatch.from_settlements(settlements)
+        )
+        # One vectorized check up front; the levels below build settlements unchecked
+        validate_batch(batch)
+        original_total = float(batch.population.sum()) if validate else 0.0
+
+        for lod_level, aggregated, lod_total in self._build_lods(batch):
+            if validate:
+                self._validate_lod_conservation(
+                    lod_level, aggregated, original_total, lod_total
+                )
+            yield lod_level, aggregated
+            del aggregated
+
+    def _build_lods(
+        self, batch: SettlementBatch
+    ) -> Iterator[Tuple[LODLevel, List[AggregatedSettlement], float]]:
+        """
+        Build each LOD level of a validated, non-empty batch on demand.
+
+        Yields:
+            (LOD level, aggregated settlements, level population total) triples,
+            DETAILED first. Totals are summed over the level's population array
+            rather than its settlement objects.
+        """
+        # Extract year from first settlement (all should be same year)
+        year = int(batch.year[0])
 
         # LOD 3 (DETAILED): Use original settlements
-        lod_results[LODLevel.DETAILED] = [
-            AggregatedSettlement(
-                coordinates=settlement.coordinates,
-                total_population=settlement.population,
-                year=settlement.year,
-                lod_level=LODLevel.DETAILED,
-                grid_size_degrees=settlement.source_resolution,
-                source_dot_count=1,
-                average_density=settlement.population
-                / (
-                    (settlement.source_resolution * 111.32) ** 2
-                ),  # Rough km² conversion
+        densities = batch.population / (
+            (batch.source_resolution * 111.32) ** 2
+        )  # Rough km² conversion
+        # The batch was range-checked on construction, so skip per-object checks
+        detailed = [
+            trusted_aggregated_settlement(
+                lon,
+                lat,
+                population,
+                settlement_year,
+                LODLevel.DETAILED,
+                resolution,
+                1,
+                density,
+            )
+            for lon, lat, population, settlement_year, resolution, density in zip(
+                batch.lon.tolist(),
+                batch.lat.tolist(),
+                batch.population.tolist(),
+                batch.year.tolist(),
+                batch.source_resolution.tolist(),
+                densities.tolist(),
             )
-            for settlement in settlements
         ]
+        yield LODLevel.DETAILED, detailed, float(batch.population.sum())
+        del detailed
 
         # Define grid sizes for each LOD level
         # Map the 3 available config fields to 4 LOD levels
@@ -86,76 +209,73 @@ class LODProcessor:
             LODLevel.LOCAL: self.config.local_grid_size          # Finest: 0.05°
         }
 
-        # Convert settlement data to NumPy arrays for vector operations
-        lons = np.array([s.coordinates.longitude for s in settlements])
-        lats = np.array([s.coordinates.latitude for s in settlements])
-        populations = np.array([s.population for s in settlements])
+        lons = batch.lon
+        lats = batch.lat
+        populations = batch.population
 
         for lod_level, grid_size in grid_configs.items():
             print(f"    Creating {lod_level.name} LOD (grid: {grid_size}°)...")
 
             # Compute grid indices via vector operations
-            x_idx = np.round(lons / grid_size).astype(int)
-            y_idx = np.round(lats / grid_size).astype(int)
-
-            # Aggregate populations and counts using pandas grouping
-            df = pd.DataFrame(
-                {
-                    "x_idx": x_idx,
-                    "y_idx": y_idx,
-                    "population": populations,
-                }
-            )
-            grouped = (
-                df.groupby(["x_idx", "y_idx"], sort=False)
-                .agg(
-                    total_population=("population", "sum"),
-                    source_dots=("population", "size"),
-                )
-                .reset_index()
-            )
+            x_idx = np.round(lons / grid_size).astype(np.int64)
+            y_idx = np.round(lats / grid_size).astype(np.int64)
+
+            # Implicit grid index: fold (x, y) into a single int64 key so each
+            # occupied cell is found with one np.unique pass, then sum
+            # populations and counts per cell with bincount
+            x_min = int(x_idx.min())
+            y_min = int(y_idx.min())
+            width = int(x_idx.max()) - x_min + 1
+            cell_keys = (y_idx - y_min) * width + (x_idx - x_min)
+            unique_keys, inverse = np.unique(cell_keys, return_inverse=True)
+            cell_populations = np.bincount(inverse, weights=populations)
+            cell_counts = np.bincount(inverse)
+            cell_x = unique_keys % width + x_min
+            cell_y = unique_keys // width + y_min
 
             aggregated_settlements: List[AggregatedSettlement] = []
             cell_area_km2 = (grid_size * 111.32) ** 2  # Rough conversion to km²
 
-            for row in grouped.itertuples(index=False):
-                # Apply deterministic spatial randomization to break grid artifacts
-                # Apply to all aggregated LODs (0, 1, 2) but not DETAILED (3)
-                if lod_level in (LODLevel.REGIONAL, LODLevel.SUBREGIONAL, LODLevel.LOCAL):
-                    grid_x, grid_y = self._apply_spatial_randomization(
-                        row.x_idx, row.y_idx, grid_size, year
-                    )
-                else:
-                    # Keep exact grid positioning for DETAILED LOD (source data)
-                    grid_x = row.x_idx * grid_size
-                    grid_y = row.y_idx * grid_size
-                    
-                avg_density = row.total_population / cell_area_km2
-                try:
-                    aggregated = AggregatedSettlement(
-                        coordinates=Coordinates(longitude=grid_x, latitude=grid_y),
-                        total_population=row.total_population,
-                        year=year,
-                        lod_level=lod_level,
-                        grid_size_degrees=grid_size,
-                        source_dot_count=row.source_dots,
-                        average_density=avg_density,
+            # Apply deterministic spatial randomization to break grid artifacts
+            # (all aggregated LODs 0-2; DETAILED keeps the source positions)
+            cell_lons, cell_lats = self._apply_spatial_randomization_batch(
+                cell_x, cell_y, grid_size, year
+            )
+            cell_densities = cell_populations / cell_area_km2
+
+            # Randomized positions are clipped to the valid coordinate range and
+            # populations, counts and densities are positive by construction, so
+            # every cell becomes a settlement without per-object validation
+            for grid_x, grid_y, total_population, source_dots, avg_density in zip(
+                cell_lons.tolist(),
+                cell_lats.tolist(),
+                cell_populations.tolist(),
+                cell_counts.tolist(),
+                cell_densities.tolist(),
+            ):
+                aggregated_settlements.append(
+                    trusted_aggregated_settlement(
+                        grid_x,
+                        grid_y,
+                        total_population,
+                        year,
+                        lod_level,
+                        grid_size,
+                        source_dots,
+                        avg_density,
                     )
-                    aggregated_settlements.append(aggregated)
-                except Exception as e:
-                    print(f"      Warning: Skipping invalid aggregated settlement: {e}")
-                    continue
+                )
 
-            lod_results[lod_level] = aggregated_settlements
             print(
                 f"      → {len(aggregated_settlements)} aggregated settlements "
-                f"(from {len(settlements)} original)"
+                f"(from {len(batch)} original)"
             )
-
-        # Validate population conservation
-        self._validate_population_conservation(settlements, lod_results)
-
-        return lod_results
+            yield (
+                lod_level,
+                aggregated_settlements,
+                float(cell_populations.sum()),
+            )
+            del aggregated_settlements
 
     def create_density_aware_dots(
         self,
@@ -191,6 +311,31 @@ class LODProcessor:
             lod_level=lod_level,
         )
 
+    def create_density_aware_dots_batch(
+        self,
+        cell_populations: np.ndarray,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        cellsize: float,
+        people_per_dot: int,
+        lod_level: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Create dots for many cells at once; same dots as calling
+        create_density_aware_dots per cell, in order.
+
+        Returns:
+            (lat, lon, population) arrays with one entry per dot
+        """
+        return self.dot_generator.create_density_aware_dots_batch(
+            cell_populations=cell_populations,
+            lats=lats,
+            lons=lons,
+            cellsize=cellsize,
+            people_per_dot=people_per_dot,
+            lod_level=lod_level,
+        )
+
     def _create_deterministic_dots(
         self,
         cell_population: float,
@@ -305,42 +450,61 @@ class LODProcessor:
 
     def _validate_population_conservation(
         self,
-        original_settlements: List[HumanSettlement],
+        original_settlements: Union[List[HumanSettlement], SettlementBatch],
         lod_results: Dict[LODLevel, List[AggregatedSettlement]],
+        lod_totals: Optional[Dict[LODLevel, float]] = None,
     ):
         """
         Validate that LOD aggregation preserves total population.
         Raises ValueError if significant population loss is detected.
+        lod_totals supplies precomputed per-level totals where known.
         """
         if not original_settlements:
             return
 
-        original_total = sum(s.population for s in original_settlements)
+        if isinstance(original_settlements, SettlementBatch):
+            original_total = float(original_settlements.population.sum())
+        else:
+            original_total = sum(s.population for s in original_settlements)
 
         print("    Population Conservation Validation:")
         print(f"      Original total: {original_total:.0f} people")
 
         for lod_level, aggregated in lod_results.items():
-            lod_total = sum(s.total_population for s in aggregated)
-            conservation_ratio = (
-                lod_total / original_total if original_total > 0 else 1.0
+            self._validate_lod_conservation(
+                lod_level, aggregated, original_total, (lod_totals or {}).get(lod_level)
             )
 
-            print(
-                f"      {lod_level.name}: {lod_total:.0f} people "
-                f"({conservation_ratio:.1%} conserved, {len(aggregated)} points)"
-            )
+        print("      Population conservation validated")
 
-            # Require 99%+ population conservation
-            # (allow for tiny floating point errors)
-            if conservation_ratio < 0.99:
-                raise ValueError(
-                    f"LOD {lod_level.name} lost "
-                    f"{(1-conservation_ratio):.1%} of population! "
-                    f"({lod_total:.0f} vs {original_total:.0f})"
-                )
+    def _validate_lod_conservation(
+        self,
+        lod_level: LODLevel,
+        aggregated: List[AggregatedSettlement],
+        original_total: float,
+        lod_total: Optional[float] = None,
+    ):
+        """
+        Validate that a single LOD level preserves the original population.
+        Raises ValueError if significant population loss is detected.
+        """
+        if lod_total is None:
+            lod_total = sum(s.total_population for s in aggregated)
+        conservation_ratio = lod_total / original_total if original_total > 0 else 1.0
 
-        print("      Population conservation validated")
+        print(
+            f"      {lod_level.name}: {lod_total:.0f} people "
+            f"({conservation_ratio:.1%} conserved, {len(aggregated)} points)"
+        )
+
+        # Require 99%+ population conservation
+        # (allow for tiny floating point errors)
+        if conservation_ratio < 0.99:
+            raise ValueError(
+                f"LOD {lod_level.name} lost "
+                f"{(1-conservation_ratio):.1%} of population! "
+                f"({lod_total:.0f} vs {original_total:.0f})"
+            )
 
     def estimate_performance_impact(
         self, settlements: List[HumanSettlement], target_lod: LODLevel
@@ -393,7 +557,7 @@ class LODProcessor:
         """
         # Create seed from original coordinates and year only
         # This ensures same settlement gets same offset across all LOD levels
-        seed = hash((x_idx, y_idx, year)) & 0x7FFFFFFF  # Fast hash, ensure positive
+        seed = _cell_seed(int(x_idx), int(y_idx), int(year))
         
         # Use seed for deterministic but pseudo-random offset
         # Simple linear congruential generator for fast randomization
@@ -419,3 +583,25 @@ class LODProcessor:
         final_y = max(-90.0, min(90.0, final_y))
         
         return final_x, final_y
+
+    def _apply_spatial_randomization_batch(
+        self, x_idx: np.ndarray, y_idx: np.ndarray, grid_size: float, year: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized ``_apply_spatial_randomization`` over arrays of grid indices.
+
+        Produces bit-identical positions to the per-cell version.
+
+        Returns:
+            Tuple of (longitudes, latitudes) arrays
+        """
+        seed = _cell_seed(x_idx, y_idx, int(year))
+        seed_x = (seed * 1103515245 + 12345) & 0x7FFFFFFF
+        seed_y = (seed * 134775813 + 67890) & 0x7FFFFFFF
+        offset_x = (seed_x / 0x7FFFFFFF) - 0.5
+        offset_y = (seed_y / 0x7FFFFFFF) - 0.5
+
+        offset_range = grid_size * 0.25
+        final_x = x_idx * grid_size + offset_x * offset_range
+        final_y = y_idx * grid_size + offset_y * offset_range
+        return np.clip(final_x, -180.0, 180.0), np.clip(final_y, -90.0, 90.0)
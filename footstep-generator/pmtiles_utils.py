@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import contextlib
+import gzip
 import os
 import shutil
 import subprocess
-from typing import Optional
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from verify_tiles import connect_readonly
 
 
 def have_pmtiles_cli() -> bool:
@@ -21,35 +30,125 @@ def convert_mbtiles_to_pmtiles(in_mbtiles: str, out_pmtiles: str) -> bool:
     """
     # 1) Prefer CLI
     if have_pmtiles_cli():
+        # Output is captured (not inherited) so conversions running in parallel
+        # worker processes cannot interleave on the terminal; shown on failure
         try:
-            subprocess.run(["pmtiles", "convert", in_mbtiles, out_pmtiles], check=True)
+            subprocess.run(
+                ["pmtiles", "convert", in_mbtiles, out_pmtiles],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                check=True,
+            )
             return True
-        except subprocess.CalledProcessError:
+        except subprocess.CalledProcessError as e:
+            output = e.stdout.decode("utf-8", errors="replace").strip()
+            if output:
+                print(f"  pmtiles convert failed: {output[-2000:]}")
             return False
 
     # 2) Python fallback
     try:
-        # Lazy import to avoid hard dependency in environments without pmtiles
-        from pmtiles.convert import mbtiles_to_pmtiles  # type: ignore
-
-        mbtiles_to_pmtiles(in_mbtiles, out_pmtiles)
+        stream_mbtiles_to_pmtiles(in_mbtiles, out_pmtiles)
         return True
     except Exception:
         return False
 
 
+def stream_mbtiles_to_pmtiles(in_mbtiles: str, out_pmtiles: str) -> None:
+    """Convert MBTiles to PMTiles with the `pmtiles` Python package.
+
+    Only the small (tile id, z, x, y) keys are read and sorted in memory; each blob
+    is then fetched by its (z, x, y) key in PMTiles tile-id order, so the archive
+    comes out clustered without holding every tile at once. Tiles are addressed by
+    key rather than rowid because `tiles` is often a view over map/images (e.g.
+    deduplicated tile-join output), where rowid is NULL. The MBTiles is opened
+    read-only with mmap'd page reads.
+    """
+    # Lazy import to avoid hard dependency in environments without pmtiles
+    from pmtiles.convert import mbtiles_to_header_json  # type: ignore
+    from pmtiles.tile import zxy_to_tileid  # type: ignore
+    from pmtiles.writer import write  # type: ignore
+
+    with contextlib.closing(connect_readonly(in_mbtiles)) as con:
+        metadata = dict(con.execute("SELECT name, value FROM metadata"))
+        is_pbf = metadata.get("format") == "pbf"
+
+        cur = con.execute("SELECT zoom_level, tile_column, tile_row FROM tiles")
+        keys = cur.fetchall()
+        # MBTiles rows are TMS; PMTiles ids are XYZ
+        tileids = np.array(
+            [zxy_to_tileid(z, x, (1 << z) - 1 - y) for z, x, y in keys], dtype=np.uint64
+        )
+        order = np.argsort(tileids, kind="stable")
+
+        query = (
+            "SELECT tile_data FROM tiles"
+            " WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?"
+        )
+        with write(out_pmtiles) as writer:
+            for i in order.tolist():
+                data = con.execute(query, keys[i]).fetchone()[0]
+                # PMTiles vector tiles must be gzip-compressed
+                if is_pbf and data[0:2] != b"\x1f\x8b":
+                    data = gzip.compress(data, mtime=0)
+                writer.write_tile(int(tileids[i]), data)
+            header, json_metadata = mbtiles_to_header_json(metadata)
+            writer.finalize(header, json_metadata)
+
+
 def ensure_pmtiles_for_year(tiles_dir: str, year: int) -> Optional[str]:
     """Create humans_{year}.pmtiles next to humans_{year}.mbtiles if source exists.
 
+    An existing PMTiles file is reused only while it is at least as new as the
+    MBTiles, so a --force rebuild also refreshes it. Conversion writes to a temp
+    file that is renamed into place, so a failed run never leaves a partial file
+    that a later run would take as up to date.
+
     Returns the PMTiles path on success, or None on failure.
     """
     mb = os.path.join(tiles_dir, f"humans_{year}.mbtiles")
     pm = os.path.join(tiles_dir, f"humans_{year}.pmtiles")
-    if not os.path.exists(mb):
+    try:
+        mb_mtime = os.stat(mb).st_mtime_ns
+    except FileNotFoundError:
         return None
-    # Skip if exists
-    if os.path.exists(pm):
-        return pm
-    ok = convert_mbtiles_to_pmtiles(mb, pm)
+    # Skip if up to date
+    try:
+        if os.stat(pm).st_mtime_ns >= mb_mtime:
+            return pm
+    except FileNotFoundError:
+        pass
+    fd, tmp = tempfile.mkstemp(dir=tiles_dir, prefix=f".humans_{year}.", suffix=".pmtiles")
+    os.close(fd)
+    try:
+        ok = convert_mbtiles_to_pmtiles(mb, tmp)
+        if ok:
+            shutil.copymode(mb, tmp)  # mkstemp files are owner-only
+            os.replace(tmp, pm)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
     return pm if ok else None
 
+
+def ensure_pmtiles_for_years(
+    tiles_dir: str, years: Iterable[int], max_workers: Optional[int] = None
+) -> Dict[int, Optional[str]]:
+    """Run ensure_pmtiles_for_year for several years in parallel processes.
+
+    Each year's conversion is independent. The pmtiles CLI spreads a single
+    conversion over several cores itself, so the default pool is half the CPU
+    count when it is available and the full count for the Python fallback.
+
+    Returns a mapping of year to PMTiles path (None where conversion failed).
+    """
+    years = list(years)
+    if max_workers is None:
+        cpus = os.cpu_count() or 1
+        max_workers = max(1, cpus // 2) if have_pmtiles_cli() else cpus
+    max_workers = min(max_workers, len(years))
+    if max_workers <= 1:
+        return {year: ensure_pmtiles_for_year(tiles_dir, year) for year in years}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(years, executor.map(partial(ensure_pmtiles_for_year, tiles_dir), years)))
@@ -4,11 +4,36 @@ Process city data into settlement points for the globe visualization.
 Converts Reba urban gazetteer and estimated rural population into point features.
 """
 
+import bisect
+import contextlib
+import io
+import os
 import pathlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Tuple
-from landmask import is_land
+from typing import List, Dict, Any, Optional, Tuple
+from landmask import is_land_array
+
+# Optional fast JSON encoder for GeoJSON output
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pd.eval fuses the row filter into one pass when numexpr is installed
+try:
+    import numexpr  # noqa: F401
+    HAVE_NUMEXPR = True
+except ImportError:
+    HAVE_NUMEXPR = False
+
+# Rows kept by load_reba_cities, evaluated over its lat/lon/population columns
+VALID_CITY_EXPR = "(abs(lat) <= 90) & (abs(lon) <= 180) & (population > 0)"
+
+# Root seed for dot placement, so repeated runs write identical output
+DEFAULT_SEED = 42
 
 # Population estimation parameters - consistent with HYDE processing
 PERSONS_PER_DOT = 100  # Always 100 people per settlement point for consistency
@@ -26,6 +51,20 @@ POP_ESTIMATES = {
     2020: 7_800_000_000,
 }
 
+# Sorted lookup tables for the year -> estimate scans in rural_dot_arrays
+_POP_ESTIMATE_YEARS = sorted(POP_ESTIMATES)
+_POP_ESTIMATE_VALUES = [POP_ESTIMATES[y] for y in _POP_ESTIMATE_YEARS]
+
+# Urban share of the population: URBAN_RATIOS[i] applies below URBAN_RATIO_CUTS[i]
+URBAN_RATIO_CUTS = [-5000, 0, 1800, 1950]
+URBAN_RATIOS = [
+    0.05,  # 5% urban
+    0.1,   # 10% urban
+    0.15,  # 15% urban
+    0.30,  # 30% urban
+    0.55,  # 55% urban (modern times)
+]
+
 # Inhabitable regions (lat_min, lat_max, lon_min, lon_max, weight)
 INHABITABLE_REGIONS = [
     (10, 70, -10, 60, 3),      # Europe & Western Asia
@@ -36,10 +75,22 @@ INHABITABLE_REGIONS = [
     (-45, -10, 110, 180, 1),   # Australia
 ]
 
-# Precompute region probabilities for rural dot placement
+# Precompute region bounds and probabilities for rural dot placement
+_REGION_BOUNDS = np.array([region[:4] for region in INHABITABLE_REGIONS], dtype=np.float64)
 _REGION_WEIGHTS = [region[4] for region in INHABITABLE_REGIONS]
 _TOTAL_REGION_WEIGHT = sum(_REGION_WEIGHTS)
 REGION_PROBABILITIES = [w / _TOTAL_REGION_WEIGHT for w in _REGION_WEIGHTS]
+# Cumulative distribution for inverse-CDF region sampling (last edge pinned to 1)
+_REGION_CDF = np.cumsum(REGION_PROBABILITIES)
+_REGION_CDF[-1] = 1.0
+
+# Accepted CSV header names per column, canonical name first
+CITY_COLUMN_ALIASES = {
+    'lat': ('lat', 'latitude'),
+    'lon': ('lon', 'longitude'),
+    'population': ('population', 'pop'),
+    'year': ('year', 'date'),
+}
 
 def get_persons_per_dot(year: int) -> int:
     """Get the number of people each point represents for a given year."""
@@ -63,33 +114,45 @@ def load_reba_cities(raw_dir: str) -> pd.DataFrame:
     print(f"  Found: {csv_file}")
     
     try:
-        # Load the CSV (adjust column names based on actual file structure)
-        df = pd.read_csv(csv_file)
-        
-        # Expected columns: name, lat, lon, year, population
-        # Rename columns if necessary
-        column_mapping = {
-            'latitude': 'lat',
-            'longitude': 'lon',
-            'pop': 'population',
-            'date': 'year'
-        }
-        
-        for old_name, new_name in column_mapping.items():
-            if old_name in df.columns:
-                df = df.rename(columns={old_name: new_name})
+        # Expected columns: name, lat, lon, year, population. Resolve them from the
+        # header first so only those columns are parsed, with explicit dtypes
+        header = pd.read_csv(csv_file, nrows=0).columns
+        source_columns = {}
+        for col, candidates in CITY_COLUMN_ALIASES.items():
+            for candidate in candidates:
+                if candidate in header:
+                    source_columns[col] = candidate
+                    break
         
-        # Filter and clean data
         required_cols = ['lat', 'lon', 'year', 'population']
-        missing_cols = [col for col in required_cols if col not in df.columns]
+        missing_cols = [col for col in required_cols if col not in source_columns]
         
         if missing_cols:
             raise ValueError(f"Missing required columns {missing_cols} in CSV file.")
         
-        # Clean the data
+        usecols = list(source_columns.values())
+        if 'name' in header:
+            usecols.append('name')
+        df = pd.read_csv(
+            csv_file,
+            engine='c',
+            usecols=usecols,
+            dtype={source_columns['lat']: 'float64', source_columns['lon']: 'float64'},
+        )
+        df = df.rename(columns={src: col for col, src in source_columns.items()})
+        
+        # Clean the data: drop incomplete rows first, then filter once on a fused mask
         df = df.dropna(subset=required_cols)
-        df = df[df['population'] > 0]
-        df = df[(df['lat'].abs() <= 90) & (df['lon'].abs() <= 180)]
+        columns = {col: df[col].to_numpy() for col in ('lat', 'lon', 'population')}
+        if HAVE_NUMEXPR:
+            mask = pd.eval(VALID_CITY_EXPR, local_dict=columns, engine='numexpr')
+        else:
+            mask = (
+                (np.abs(columns['lat']) <= 90)
+                & (np.abs(columns['lon']) <= 180)
+                & (columns['population'] > 0)
+            )
+        df = df[mask]
         
         print(f"  Loaded {len(df)} city records")
         return df
@@ -98,21 +161,61 @@ def load_reba_cities(raw_dir: str) -> pd.DataFrame:
         raise RuntimeError(f"Error loading Reba data: {e}")
 
 
-def population_to_dots(population: int, year: int, lat: float, lon: float, 
-                      city_name: str, spread_radius: float = 0.1) -> List[Dict]:
+# Per-dot fields, stored column-wise (one array per field) while a year is built
+DOT_FIELDS = ('lat', 'lon', 'year', 'population', 'city', 'type')
+
+
+def _dot_columns(lat, lon, year, population, city, dot_type) -> Dict[str, np.ndarray]:
+    """Bundle per-dot arrays into a column dict, broadcasting scalar fields."""
+    n = len(lat)
+    return {
+        'lat': lat,
+        'lon': lon,
+        'year': np.full(n, year),
+        'population': np.full(n, population),
+        'city': np.full(n, city, dtype=object),
+        'type': np.full(n, dot_type, dtype=object),
+    }
+
+
+def _concat_dot_columns(parts: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Concatenate several column dicts field by field."""
+    if not parts:
+        return {
+            'lat': np.empty(0), 'lon': np.empty(0),
+            'year': np.empty(0, dtype=np.int64), 'population': np.empty(0, dtype=np.int64),
+            'city': np.empty(0, dtype=object), 'type': np.empty(0, dtype=object),
+        }
+    return {field: np.concatenate([part[field] for part in parts]) for field in DOT_FIELDS}
+
+
+def _columns_to_dots(columns: Dict[str, np.ndarray]) -> List[Dict]:
+    """Expand a column dict into the list-of-dicts form of settlement points."""
+    values = [columns[field].tolist() for field in DOT_FIELDS]
+    return [dict(zip(DOT_FIELDS, row)) for row in zip(*values)]
+
+
+def population_to_dot_arrays(population: int, year: int, lat: float, lon: float,
+                             city_name: str, spread_radius: float = 0.1,
+                             rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
     """
-    Convert a city population to individual settlement points.
-    
+    Convert a city population to settlement points, one array per field.
+
+    Draws all offsets in a single RNG call; the random stream is consumed in the
+    same order as drawing a latitude then a longitude offset per dot.
+
     Args:
         population: Total population
         year: Year for this data
         lat, lon: City center coordinates
         city_name: Name of the city
         spread_radius: How spread out the dots should be (degrees)
-    
+        rng: Random generator (default: the legacy global np.random state)
+
     Returns:
-        List of settlement point feature dicts
+        Dict mapping each of DOT_FIELDS to an array with one entry per dot
     """
+    rng = np.random if rng is None else rng
     persons_per_dot = get_persons_per_dot(year)
     num_dots = max(1, population // persons_per_dot)
     
@@ -121,107 +224,366 @@ def population_to_dots(population: int, year: int, lat: float, lon: float,
         num_dots = 1000
         persons_per_dot = population // num_dots
     
-    dots = []
+    if num_dots <= 1:
+        # A single dot sits on the city center; no random draw needed
+        dot_lat = np.array([max(-90, min(90, lat))], dtype=np.float64)
+        dot_lon = np.array([max(-180, min(180, lon))], dtype=np.float64)
+        return _dot_columns(dot_lat, dot_lon, year, persons_per_dot, city_name, 'urban')
     
-    for i in range(num_dots):
-        # Scatter dots around the city center
-        # Use normal distribution for realistic clustering
-        offset_lat = np.random.normal(0, spread_radius / 3)
-        offset_lon = np.random.normal(0, spread_radius / 3)
-        
-        dot_lat = lat + offset_lat
-        dot_lon = lon + offset_lon
-        
-        # Ensure coordinates are valid
-        dot_lat = max(-90, min(90, dot_lat))
-        dot_lon = max(-180, min(180, dot_lon))
-        
-        dots.append({
-            'lat': dot_lat,
-            'lon': dot_lon,
-            'year': year,
-            'population': persons_per_dot,
-            'city': city_name,
-            'type': 'urban'
-        })
+    # Scatter dots around the city center
+    # Use normal distribution for realistic clustering
+    offsets = rng.normal(0, spread_radius / 3, size=(int(num_dots), 2))
     
-    return dots
+    # Ensure coordinates are valid
+    dot_lat = np.clip(lat + offsets[:, 0], -90, 90)
+    dot_lon = np.clip(lon + offsets[:, 1], -180, 180)
+    
+    return _dot_columns(dot_lat, dot_lon, year, persons_per_dot, city_name, 'urban')
 
-def add_rural_population(dots: List[Dict], year: int, total_world_pop: int) -> List[Dict]:
+
+def city_dot_arrays(cities: pd.DataFrame, year: int, spread_radius: float = 0.1,
+                    rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
     """
-    Add estimated rural settlement points based on world population estimates.
+    Convert every city of one year to settlement points in a single vectorized pass.
+
+    Equivalent to concatenating population_to_dot_arrays over the rows of cities
+    (including the RNG stream), but city centers are expanded to their dots with
+    np.repeat and all offsets come from one draw.
+
+    Args:
+        cities: The year's cities with population, lat, lon and optionally name
+        year: Year for this data
+        spread_radius: How spread out the dots should be (degrees)
+        rng: Random generator (default: the legacy global np.random state)
+
+    Returns:
+        Dict mapping each of DOT_FIELDS to an array with one entry per dot
     """
-    print(f"  Adding rural population for year {year}...")
+    rng = np.random if rng is None else rng
+    populations = cities['population'].to_numpy()
+    persons_per_dot = get_persons_per_dot(year)
+    num_dots = np.maximum(1, populations // persons_per_dot)
     
-    # Estimate urban vs rural ratio based on year
-    if year < -5000:
-        urban_ratio = 0.05  # 5% urban
-    elif year < 0:
-        urban_ratio = 0.1   # 10% urban
-    elif year < 1800:
-        urban_ratio = 0.15  # 15% urban
-    elif year < 1950:
-        urban_ratio = 0.30  # 30% urban
+    # Limit dots for performance (max ~1000 dots per city)
+    capped = num_dots > 1000
+    num_dots = np.minimum(num_dots, 1000).astype(np.int64)
+    dot_populations = np.where(capped, populations // 1000, persons_per_dot)
+    
+    # Single-dot cities (most ancient ones) sit on their center and draw nothing;
+    # only dots of multi-dot cities get a random offset
+    scattered = np.repeat(num_dots > 1, num_dots)
+    offsets = np.zeros((len(scattered), 2))
+    offsets[scattered] = rng.normal(0, spread_radius / 3, size=(int(scattered.sum()), 2))
+    dot_lat = np.clip(np.repeat(cities['lat'].to_numpy(), num_dots) + offsets[:, 0], -90, 90)
+    dot_lon = np.clip(np.repeat(cities['lon'].to_numpy(), num_dots) + offsets[:, 1], -180, 180)
+    
+    if 'name' in cities.columns:
+        names = np.repeat(cities['name'].to_numpy(dtype=object), num_dots)
     else:
-        urban_ratio = 0.55  # 55% urban (modern times)
+        names = np.full(len(dot_lat), 'Unknown', dtype=object)
     
-    # Calculate current urban population from existing dots
-    urban_pop = sum(dot['population'] for dot in dots if dot.get('type') == 'urban')
+    return {
+        'lat': dot_lat,
+        'lon': dot_lon,
+        'year': np.full(len(dot_lat), year),
+        'population': np.repeat(dot_populations, num_dots),
+        'city': names,
+        'type': np.full(len(dot_lat), 'urban', dtype=object),
+    }
+
+
+def population_to_dots(population: int, year: int, lat: float, lon: float, 
+                      city_name: str, spread_radius: float = 0.1,
+                      rng: Optional[np.random.Generator] = None) -> List[Dict]:
+    """
+    Convert a city population to individual settlement points.
+    
+    Args:
+        population: Total population
+        year: Year for this data
+        lat, lon: City center coordinates
+        city_name: Name of the city
+        spread_radius: How spread out the dots should be (degrees)
+        rng: Random generator (default: the legacy global np.random state)
+    
+    Returns:
+        List of settlement point feature dicts
+    """
+    return _columns_to_dots(
+        population_to_dot_arrays(population, year, lat, lon, city_name, spread_radius, rng)
+    )
+
+
+def rural_dot_arrays(year: int, urban_pop: int, total_world_pop: int,
+                     rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+    """
+    Estimated rural settlement points for a year, one array per field.
+
+    Args:
+        year: Year for this data
+        urban_pop: Population already placed as urban dots
+        total_world_pop: World population, or 0 to estimate it
+        rng: Random generator (default: the legacy global np.random state)
+    """
+    rng = np.random if rng is None else rng
+    print(f"  Adding rural population for year {year}...")
+    
+    # Estimate urban vs rural ratio based on year
+    urban_ratio = URBAN_RATIOS[bisect.bisect_right(URBAN_RATIO_CUTS, year)]
     
     # Estimate total population if not provided
     if total_world_pop == 0:
         if urban_pop > 0:
             total_world_pop = int(urban_pop / urban_ratio)
         else:
-            years = sorted(POP_ESTIMATES.keys())
-            for est_year in years:
-                if year <= est_year:
-                    total_world_pop = POP_ESTIMATES[est_year]
-                    break
-            else:
-                total_world_pop = POP_ESTIMATES[years[-1]]
+            # First estimate at or after year, else the latest one
+            idx = bisect.bisect_left(_POP_ESTIMATE_YEARS, year)
+            total_world_pop = _POP_ESTIMATE_VALUES[min(idx, len(_POP_ESTIMATE_VALUES) - 1)]
     
     rural_pop = total_world_pop - urban_pop
     
     if rural_pop <= 0:
-        return dots
+        return _concat_dot_columns([])
     
     # Create rural dots (scattered globally)
     persons_per_dot = get_persons_per_dot(year)
     num_rural_dots = min(rural_pop // persons_per_dot, 5000)  # Limit for performance
 
+    # Sample regions and positions for every missing dot at once, keep the ones
+    # on land, and redraw only the shortfall
+    lats = np.empty(num_rural_dots)
+    lons = np.empty(num_rural_dots)
     accepted = 0
     while accepted < num_rural_dots:
-        region = np.random.choice(len(INHABITABLE_REGIONS), p=REGION_PROBABILITIES)
-        lat_min, lat_max, lon_min, lon_max, _ = INHABITABLE_REGIONS[region]
-
-        rural_lat = np.random.uniform(lat_min, lat_max)
-        rural_lon = np.random.uniform(lon_min, lon_max)
-
-        if not is_land(rural_lat, rural_lon):
-            continue
-
-        dots.append({
-            'lat': rural_lat,
-            'lon': rural_lon,
-            'year': year,
-            'population': persons_per_dot,
-            'city': 'rural',
-            'type': 'rural'
-        })
-        accepted += 1
+        needed = num_rural_dots - accepted
+        regions = np.searchsorted(_REGION_CDF, rng.random(needed), side='right')
+        bounds = _REGION_BOUNDS[regions]
+
+        rural_lat = rng.uniform(bounds[:, 0], bounds[:, 1])
+        rural_lon = rng.uniform(bounds[:, 2], bounds[:, 3])
+
+        on_land = is_land_array(rural_lat, rural_lon)
+        rural_lat = rural_lat[on_land]
+        rural_lon = rural_lon[on_land]
+        lats[accepted:accepted + len(rural_lat)] = rural_lat
+        lons[accepted:accepted + len(rural_lon)] = rural_lon
+        accepted += len(rural_lat)
     
+    return _dot_columns(lats, lons, year, persons_per_dot, 'rural', 'rural')
+
+
+def add_rural_population(dots: List[Dict], year: int, total_world_pop: int,
+                         rng: Optional[np.random.Generator] = None) -> List[Dict]:
+    """
+    Add estimated rural settlement points based on world population estimates.
+    """
+    # Calculate current urban population from existing dots
+    urban_pop = sum(dot['population'] for dot in dots if dot.get('type') == 'urban')
+    dots.extend(_columns_to_dots(rural_dot_arrays(year, urban_pop, total_world_pop, rng)))
     return dots
 
-def process_cities_to_dots(raw_dir: str, output_dir: str) -> str:
+def _compact_dot_columns(columns: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """Downcast a year's dot columns before they are pickled back and written.
+
+    Years fit in int16 (the supported range is -15000..2100, see models.MIN_YEAR)
+    and per-dot populations in int32; city and type repeat
+    heavily, so they become categoricals (dictionary-encoded in Parquet).
+    """
+    compact: Dict[str, Any] = dict(columns)
+    compact['year'] = columns['year'].astype(np.int16)
+    if np.issubdtype(columns['population'].dtype, np.integer):
+        compact['population'] = columns['population'].astype(np.int32)
+    compact['city'] = pd.Categorical(columns['city'])
+    compact['type'] = pd.Categorical(columns['type'], categories=['urban', 'rural'])
+    return compact
+
+
+def _process_year(year: int, year_cities: pd.DataFrame,
+                  seed: np.random.SeedSequence) -> Tuple[Dict[str, np.ndarray], str]:
+    """Build one year's urban and rural dots, returning the columns and captured log.
+
+    Runs in a worker process; seed is the year's own child SeedSequence, so every
+    year draws from an independent stream regardless of which worker runs it.
+    """
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        rng = np.random.default_rng(seed)
+        print(f"Processing year {year}...")
+        
+        # Convert all of the year's cities to dots at once
+        urban = city_dot_arrays(year_cities, year, rng=rng)
+        
+        # Add rural population
+        rural = rural_dot_arrays(year, urban['population'].sum(), 0, rng=rng)
+        year_dots = _compact_dot_columns(_concat_dot_columns([urban, rural]))
+        print(f"  Created {len(year_dots['lat'])} points for year {year}")
+    return year_dots, buf.getvalue()
+
+
+OUTPUT_FORMATS = ("geojson", "parquet")
+
+# FeatureCollection framing as GDAL's GeoJSON driver writes it, so the streamed
+# file reads like one written by a single to_file call
+_GEOJSON_HEADER = (
+    b'{\n"type": "FeatureCollection",\n"name": "%s",\n'
+    b'"crs": { "type": "name", "properties": { "name": "urn:ogc:def:crs:OGC:1.3:CRS84" } },\n'
+    b'"features": [\n'
+)
+_GEOJSON_FOOTER = b"\n]\n}\n"
+
+# GeoParquet 1.0 file metadata; with no "crs" member readers assume OGC:CRS84 (lon/lat)
+_GEOPARQUET_METADATA = {
+    "version": "1.0.0",
+    "primary_column": "geometry",
+    "columns": {"geometry": {"encoding": "WKB", "geometry_types": ["Point"]}},
+}
+
+
+# Features per orjson.dumps call, bounding the intermediate dicts held at once
+GEOJSON_BATCH_ROWS = 65536
+
+
+def _encode_geojson_features(columns: Dict[str, np.ndarray]) -> bytes:
+    """Encode one year's dots as comma-separated GeoJSON features (no framing).
+
+    With orjson the features are serialized straight from the columns in
+    GEOJSON_BATCH_ROWS chunks (shortest round-trip floats, one chunk per line).
+    Otherwise pyogrio writes them as GeoJSON text sequence into memory (one feature
+    per line, full coordinate precision as the GeoJSON driver uses), then newlines
+    become the FeatureCollection separators.
     """
-    Process city data and create settlement points GeoJSON.
+    if orjson is not None:
+        values = [
+            np.asarray(columns[field]).tolist()
+            for field in ('lon', 'lat', 'year', 'population', 'city', 'type')
+        ]
+        chunks = []
+        for start in range(0, len(values[0]), GEOJSON_BATCH_ROWS):
+            stop = start + GEOJSON_BATCH_ROWS
+            batch = [
+                {
+                    'type': 'Feature',
+                    'properties': {'year': year, 'population': population,
+                                   'city': city, 'type': dot_type},
+                    'geometry': {'type': 'Point', 'coordinates': [lon, lat]},
+                }
+                for lon, lat, year, population, city, dot_type
+                in zip(*(column[start:stop] for column in values))
+            ]
+            chunks.append(orjson.dumps(batch)[1:-1])
+        return b",\n".join(chunks)
+
+    import geopandas as gpd
+    import pyogrio
+    import shapely
+
+    # Create point geometries in one vectorized GEOS call
+    geometries = shapely.points(columns['lon'], columns['lat'])
+    
+    # Create properties
+    properties = {
+        'year': columns['year'],
+        'population': columns['population'],
+        'city': columns['city'],
+        'type': columns['type']
+    }
+    
+    gdf = gpd.GeoDataFrame(properties, geometry=geometries, crs='EPSG:4326')
+    buf = io.BytesIO()
+    pyogrio.write_dataframe(
+        gdf, buf, driver='GeoJSONSeq', layer_options={'COORDINATE_PRECISION': 15}
+    )
+    return buf.getvalue().rstrip(b"\n").replace(b"\n", b",\n")
+
+
+class _GeoJSONDotWriter:
+    """Append years of dots to a GeoJSON FeatureCollection."""
+
+    def __init__(self, f_out, name: str):
+        self.f_out = f_out
+        self.count = 0
+        f_out.write(_GEOJSON_HEADER % name.encode())
+
+    def write_year(self, columns: Dict[str, np.ndarray]) -> None:
+        if self.count:
+            self.f_out.write(b",\n")
+        self.f_out.write(_encode_geojson_features(columns))
+        self.count += len(columns['lat'])
+
+    def close(self) -> None:
+        self.f_out.write(_GEOJSON_FOOTER)
+
+
+class _GeoParquetDotWriter:
+    """Append years of dots to a zstd-compressed GeoParquet file, one row group each."""
+
+    def __init__(self, f_out, name: str):
+        self.f_out = f_out
+        self.count = 0
+        self.writer = None
+
+    def write_year(self, columns: Dict[str, np.ndarray]) -> None:
+        import json
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        import shapely
+
+        table = pa.table({
+            'year': pa.array(columns['year']),
+            'population': pa.array(columns['population']),
+            'city': pa.array(columns['city']),
+            'type': pa.array(columns['type']),
+            'geometry': pa.array(
+                shapely.to_wkb(shapely.points(columns['lon'], columns['lat'])),
+                type=pa.binary(),
+            ),
+        })
+        if self.writer is None:
+            schema = table.schema.with_metadata(
+                {b"geo": json.dumps(_GEOPARQUET_METADATA).encode()}
+            )
+            self.writer = pq.ParquetWriter(
+                self.f_out, schema, compression='zstd', compression_level=3
+            )
+        self.writer.write_table(table.cast(self.writer.schema))
+        self.count += len(columns['lat'])
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+
+
+def process_cities_to_dots(raw_dir: str, output_dir: str, jobs: Optional[int] = None,
+                           seed: Optional[int] = DEFAULT_SEED,
+                           output_format: str = "geojson") -> str:
+    """
+    Process city data and create settlement points GeoJSON (or GeoParquet).
+    
+    Years are independent, so they are built in parallel worker processes. Each
+    year's dots are appended to the output as soon as they are ready, so only a
+    few years are ever held in memory.
+    
+    Args:
+        raw_dir: Directory searched for the Reba gazetteer CSV
+        output_dir: Directory for city_settlements.parquet / .geojson
+        jobs: Worker processes (default: CPU count; 1 builds years in-process)
+        seed: Root seed for dot placement (None for a fresh random run)
+        output_format: One of OUTPUT_FORMATS; parquet requires pyarrow
     
     Returns:
-        Path to output GeoJSON file
+        Path to the output file
     """
-    import geopandas as gpd
-    from shapely.geometry import Point
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format {output_format!r}; expected one of {OUTPUT_FORMATS}")
+    if output_format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "GeoParquet output requires pyarrow; install it or use output_format='geojson'"
+            ) from e
+    writer_cls = _GeoParquetDotWriter if output_format == "parquet" else _GeoJSONDotWriter
+    suffix = ".parquet" if output_format == "parquet" else ".geojson"
 
     print("🏙️ Processing cities to settlement points...")
     
@@ -234,60 +596,58 @@ def process_cities_to_dots(raw_dir: str, output_dir: str) -> str:
             "to download the datasets."
         )
     
-    all_dots = []
-    
-    # Process cities by year
-    years = sorted(cities_df['year'].unique())
+    # Process cities by year: one groupby pass instead of a full-column mask per year
+    groups = list(cities_df.groupby('year', sort=True))
+    years = [year for year, _ in groups]
+    year_frames = [year_cities for _, year_cities in groups]
+    del groups
+    # One independent child stream per year, so output depends only on seed
+    seeds = np.random.SeedSequence(seed).spawn(len(years))
     
-    for year in years:
-        print(f"Processing year {year}...")
-        
-        year_cities = cities_df[cities_df['year'] == year]
-        
-        # Convert cities to dots
-        year_dots = []
-        for _, city in year_cities.iterrows():
-            city_dots = population_to_dots(
-                city['population'], 
-                year, 
-                city['lat'], 
-                city['lon'], 
-                city.get('name', 'Unknown')
-            )
-            year_dots.extend(city_dots)
-        
-        # Add rural population
-        year_dots = add_rural_population(year_dots, year, 0)
+    output_path = pathlib.Path(output_dir) / f"city_settlements{suffix}"
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, prefix=".city_settlements.", suffix=suffix)
+    try:
+        jobs = max(1, min(jobs or os.cpu_count() or 1, len(years)))
+        with os.fdopen(fd, "wb") as f_out, contextlib.ExitStack() as stack:
+            if jobs == 1:
+                year_results = map(_process_year, years, year_frames, seeds)
+            else:
+                # Executor.map yields in year order, so the output stays deterministic
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=jobs))
+                year_results = executor.map(_process_year, years, year_frames, seeds)
+            writer = writer_cls(f_out, output_path.stem)
+            for year_dots, log in year_results:
+                print(log, end="")
+                if len(year_dots['lat']):
+                    writer.write_year(year_dots)
+                del year_dots
+            writer.close()
         
-        all_dots.extend(year_dots)
-        print(f"  Created {len(year_dots)} points for year {year}")
+        if not writer.count:
+            raise ValueError("No settlement points could be created from the available data.")
+        os.chmod(tmp_path, 0o644)  # mkstemp files are owner-only
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
     
-    # Convert to GeoDataFrame
-    if all_dots:
-        # Create point geometries
-        geometries = [Point(dot['lon'], dot['lat']) for dot in all_dots]
-        
-        # Create properties
-        properties = {
-            'year': [dot['year'] for dot in all_dots],
-            'population': [dot['population'] for dot in all_dots],
-            'city': [dot['city'] for dot in all_dots],
-            'type': [dot['type'] for dot in all_dots]
-        }
-        
-        gdf = gpd.GeoDataFrame(properties, geometry=geometries, crs='EPSG:4326')
-        
-        # Save as GeoJSON
-        output_path = pathlib.Path(output_dir) / "city_settlements.geojson"
-        gdf.to_file(output_path, driver='GeoJSON')
-        
-        print(f"✓ Saved {len(gdf)} settlement points to {output_path}")
-        return str(output_path)
-    else:
-        raise ValueError("No settlement points could be created from the available data.")
+    print(f"✓ Saved {writer.count} settlement points to {output_path}")
+    return str(output_path)
 
 def main():
     """Main processing routine."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert Reba cities into settlement points")
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="geojson",
+        help="Output format: city_settlements.geojson (default) or "
+             "city_settlements.parquet (GeoParquet; requires pyarrow)",
+    )
+    args = parser.parse_args()
+
     # Resolve paths relative to this script so it works from any CWD
     script_dir = pathlib.Path(__file__).resolve().parent
     raw_dir = script_dir.parent / "data" / "raw"
@@ -297,9 +657,11 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Process cities to dots
-    geojson_path = process_cities_to_dots(str(raw_dir), str(output_dir))
+    output_path = process_cities_to_dots(
+        str(raw_dir), str(output_dir), output_format=args.format
+    )
     
-    print(f"\n✓ Settlement points data ready: {geojson_path}")
+    print(f"\n✓ Settlement points data ready: {output_path}")
     print("\nNext: Run generate_footstep_tiles.py to generate vector tiles")
 
 if __name__ == "__main__":
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
-from landmask import is_land
+from landmask import is_land, is_land_array
 from models import Coordinates
 
 
@@ -31,6 +31,11 @@ class SettlementRegistry:
     def __init__(self):
         self._position_cache: Dict[str, List[SettlementPosition]] = {}
         self._geo_hash_precision = 6  # Number of decimal places for coordinate hashing
+        # Single counter-based bit generator re-keyed per cell. Philox streams are
+        # fully determined by (key, counter), so re-keying is cheap pure compute
+        # and avoids building a fresh SeedSequence + Generator for every cell.
+        self._bit_generator = np.random.Philox(key=0)
+        self._rng = np.random.Generator(self._bit_generator)
 
     def get_geographic_cell_id(
         self, lat: float, lon: float, cellsize: float, settlement_type: str = "rural"
@@ -113,17 +118,39 @@ class SettlementRegistry:
         Returns:
             List of deterministic settlement positions
         """
-        # Create deterministic seed from cell coordinates and initialize a single
-        # RNG for the entire cell. Using numpy's Generator avoids the overhead of
-        # repeatedly constructing ``RandomState`` instances while still
-        # providing deterministic sequences.
+        # Create deterministic seed from cell coordinates and key the shared
+        # Philox stream with it, so every cell gets an independent but
+        # reproducible sequence regardless of processing order.
         seed = int(hashlib.md5(cell_id.encode()).hexdigest()[:8], 16) % (2**31)
-        rng = np.random.default_rng(seed)
+        rng = self._rng_for_seed(seed)
 
         positions = []
 
         if settlement_type == "rural" or num_positions <= 3:
-            # Rural areas: Use random-like distribution but deterministic
+            # Rural areas: Use random-like distribution but deterministic.
+            # Draw every (lat, lon) offset pair at once - the same values the
+            # per-position loop below draws first - and keep them if all land.
+            offsets = rng.uniform(-cellsize / 2, cellsize / 2, size=(num_positions, 2))
+            settlement_lats = lat + offsets[:, 0]
+            settlement_lons = lon + offsets[:, 1]
+            if is_land_array(settlement_lats, settlement_lons).all():
+                settlement_lats = np.clip(settlement_lats, -90, 90).tolist()
+                settlement_lons = np.clip(settlement_lons, -180, 180).tolist()
+                return [
+                    SettlementPosition(
+                        coordinates=Coordinates(
+                            longitude=settlement_lon, latitude=settlement_lat
+                        ),
+                        cell_id=cell_id,
+                        position_index=i,
+                    )
+                    for i, (settlement_lat, settlement_lon) in enumerate(
+                        zip(settlement_lats, settlement_lons)
+                    )
+                ]
+
+            # Some draw landed in water: replay the stream with per-position retries
+            rng = self._rng_for_seed(seed)
             for i in range(num_positions):
                 attempts = 0
                 while True:
@@ -276,6 +303,21 @@ class SettlementRegistry:
 
         return positions
 
+    def _rng_for_seed(self, seed: int) -> np.random.Generator:
+        """Reset the shared Philox generator to the stream keyed by ``seed``."""
+        self._bit_generator.state = {
+            "bit_generator": "Philox",
+            "state": {
+                "counter": np.zeros(4, dtype=np.uint64),
+                "key": np.array([seed, 0], dtype=np.uint64),
+            },
+            "buffer": np.zeros(4, dtype=np.uint64),
+            "buffer_pos": 4,
+            "has_uint32": 0,
+            "uinteger": 0,
+        }
+        return self._rng
+
     def clear_cache(self):
         """Clear the position cache to free memory."""
         self._position_cache.clear()
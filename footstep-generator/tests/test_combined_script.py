@@ -55,6 +55,33 @@ def test_combined_script_discovery():
         assert "Found" in output  # Should show it found some HYDE files
 
 
+
+def test_strict_failure_still_converts_built_years(monkeypatch):
+    """A --strict stop converts the years that already built to PMTiles."""
+    import sys
+    sys.path.append(str(pathlib.Path(__file__).parent.parent))
+    import generate_footstep_tiles
+
+    converted: List[int] = []
+    monkeypatch.setattr(
+        generate_footstep_tiles, "find_hyde_files",
+        lambda raw_dir, **kwargs: {1000: "a.asc", 1500: "b.asc", 1800: "c.asc"},
+    )
+    monkeypatch.setattr(
+        generate_footstep_tiles, "build_year", lambda asc_file, tiles_dir, year, *args: year != 1500
+    )
+    monkeypatch.setattr(
+        generate_footstep_tiles, "ensure_pmtiles_for_years",
+        lambda tiles_dir, years: converted.extend(years) or {y: None for y in years},
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        monkeypatch.setattr(
+            sys, "argv",
+            ["generate_footstep_tiles.py", "--tiles-dir", tmp, "--strict", "--jobs", "1"],
+        )
+        assert generate_footstep_tiles.main() == 1
+    assert converted == [1000]
+
 def test_combined_script_imports():
     """Test that the combined script imports work correctly."""
     # This is a basic import test
@@ -233,6 +233,65 @@ class TestDeterministicPositioning:
         assert cache_stats["cached_cells"] > 0
         assert cache_stats["total_cached_positions"] > 0
     
+    def test_positions_independent_of_processing_order(self):
+        """Test that per-cell RNG streams do not depend on which cells ran first."""
+        registry_a = SettlementRegistry()
+        registry_b = SettlementRegistry()
+
+        # Warm registry_b with an unrelated cell so its shared generator has advanced
+        registry_b.get_deterministic_positions(10.0, 10.0, self.test_cellsize, 7, "rural")
+
+        positions_a = registry_a.get_deterministic_positions(
+            self.test_lat, self.test_lon, self.test_cellsize, 5, "rural"
+        )
+        positions_b = registry_b.get_deterministic_positions(
+            self.test_lat, self.test_lon, self.test_cellsize, 5, "rural"
+        )
+
+        assert [p.coordinates for p in positions_a] == [p.coordinates for p in positions_b]
+
+    @pytest.mark.parametrize("lod_level", [3, None])
+    def test_batch_dots_match_per_cell_dots(self, lod_level):
+        """Test that batched dot creation equals per-cell calls concatenated in order."""
+        pops = np.array([0.2, 3.0, 250.0, 999.99, 1000.0, 7500.0, 10000.0, 250000.0])
+        lats = self.test_lat + np.arange(len(pops)) * self.test_cellsize
+        lons = self.test_lon + np.arange(len(pops)) * self.test_cellsize
+
+        expected = [
+            dot
+            for pop, lat, lon in zip(pops, lats, lons)
+            for dot in self.processor.create_density_aware_dots(
+                pop, lat, lon, self.test_cellsize, self.people_per_dot, lod_level
+            )
+        ]
+        dot_lats, dot_lons, dot_pops = self.processor.create_density_aware_dots_batch(
+            pops, lats, lons, self.test_cellsize, self.people_per_dot, lod_level
+        )
+
+        assert list(zip(dot_lats, dot_lons, dot_pops)) == expected
+
+    def test_positions_pinned_for_fixed_cell(self):
+        """Test that a fixed cell draws its positions from Philox keyed by the cell seed."""
+        registry = SettlementRegistry()
+        cellsize = 0.083333
+        # Inland cell (southern Germany), so the all-land fast path is taken
+        positions = registry.get_deterministic_positions(48.0, 10.0, cellsize, 3, "rural")
+
+        assert registry.get_geographic_cell_id(48.0, 10.0, cellsize, "rural") == "e22fc1b2c2e4"
+        expected = [
+            (47.99127125788702, 9.99912197738557),
+            (47.965717649701034, 10.02091823532585),
+            (48.02111247915233, 9.96152642336416),
+        ]
+        actual = [(p.coordinates.latitude, p.coordinates.longitude) for p in positions]
+        assert actual == pytest.approx(expected, abs=1e-12)
+
+        # Same values as a fresh Philox stream keyed by the cell seed
+        offsets = np.random.Generator(np.random.Philox(key=1124952948)).uniform(
+            -cellsize / 2, cellsize / 2, size=(3, 2)
+        )
+        assert actual == pytest.approx(list(zip(48.0 + offsets[:, 0], 10.0 + offsets[:, 1])), abs=1e-12)
+
     def test_continuity_config_thresholds(self):
         """Test that continuity configuration thresholds are respected."""
         # Create processor with custom thresholds
@@ -20,6 +20,7 @@ from models import (
     LODLevel,
     Coordinates,
     HumanSettlement,
+    SettlementBatch,
     AggregatedSettlement,
     LODConfiguration,
     ProcessingStatistics,
@@ -192,6 +193,59 @@ class TestDataProcessingPipeline:
                 0.9 <= population_ratio <= 1.1
             ), f"Population not conserved at {lod_level}: {population_ratio:.3f}"
 
+    def test_stream_lods_matches_hierarchical_lods(self):
+        """Test that streaming LOD levels yields the same data as the dict API."""
+        processor = LODProcessor()
+        settlements = self.create_test_settlements(count=40, year=800)
+
+        lod_data = processor.create_hierarchical_lods(settlements)
+        streamed = list(processor.stream_lods(settlements))
+
+        assert [level for level, _ in streamed][0] == LODLevel.DETAILED
+        assert {level for level, _ in streamed} == set(lod_data)
+        for level, aggregated in streamed:
+            assert len(aggregated) == len(lod_data[level])
+            assert sum(s.total_population for s in aggregated) == pytest.approx(
+                sum(s.total_population for s in lod_data[level])
+            )
+
+    def test_settlement_batch_matches_settlement_objects(self):
+        """Test that a SettlementBatch yields the same LODs as HumanSettlement objects."""
+        processor = LODProcessor()
+        settlements = self.create_test_settlements(count=40, year=800)
+        points = [
+            {
+                "lon": s.coordinates.longitude,
+                "lat": s.coordinates.latitude,
+                "population": s.population,
+            }
+            for s in settlements
+        ]
+        # Invalid dots are dropped, as HumanSettlement validation would
+        points.append({"lon": 10.0, "lat": 10.0, "population": 0.0})
+        points.append({"lon": 200.0, "lat": 10.0, "population": 5.0})
+
+        batch = SettlementBatch.from_points(points, 800, settlements[0].source_resolution)
+        assert len(batch) == len(settlements)
+
+        from_objects = processor.create_hierarchical_lods(settlements)
+        from_batch = processor.create_hierarchical_lods(batch)
+        assert set(from_batch) == set(from_objects)
+        for level, aggregated in from_objects.items():
+            assert from_batch[level] == aggregated
+
+    def test_stream_lods_rejects_invalid_batch(self):
+        """Test that a hand-built batch is range-checked before LODs are built."""
+        batch = SettlementBatch(
+            lon=np.array([10.0, 190.0]),
+            lat=np.array([5.0, 5.0]),
+            population=np.array([100.0, 100.0]),
+            year=np.array([800, 800], dtype=np.int16),
+            source_resolution=np.array([0.1, 0.1]),
+        )
+        with pytest.raises(ValueError, match="Longitude"):
+            list(LODProcessor().stream_lods(batch))
+
     def test_density_aware_dot_creation(self):
         """Test density-aware dot creation for different population levels."""
         processor = LODProcessor()
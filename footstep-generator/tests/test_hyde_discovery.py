@@ -3,8 +3,10 @@
 Tests for dynamic HYDE ASC file discovery.
 """
 
-import tempfile
+import os
 import pathlib
+import tempfile
+import time
 
 
 def test_find_hyde_files_dynamic():
@@ -24,3 +26,44 @@ def test_find_hyde_files_dynamic():
         assert -3700 in mapping
         assert len(mapping) == 2
 
+
+
+def test_find_hyde_files_picks_up_new_files():
+    from hyde_tile_processor import find_hyde_files
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = pathlib.Path(tmp)
+        (root / "popd_1000AD.asc").write_text("dummy")
+        assert set(find_hyde_files(str(root))) == {1000}
+
+        # A file added after the first scan is seen without an explicit refresh
+        (root / "popd_1500AD.asc").write_text("dummy")
+        assert set(find_hyde_files(str(root))) == {1000, 1500}
+        assert set(find_hyde_files(str(root), refresh=True)) == {1000, 1500}
+
+
+def test_find_hyde_files_index_tracks_directory_changes():
+    from hyde_tile_processor import _read_hyde_index, find_hyde_files, hyde_index_path
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = pathlib.Path(tmp) / "raw"
+        cache = pathlib.Path(tmp) / "cache"
+        (root / "sub").mkdir(parents=True)
+        (root / "sub" / "popd_1000AD.asc").write_text("dummy")
+        # Age the directories so the scan is not considered racy
+        old = time.time() - 60
+        for d in (root / "sub", root):
+            os.utime(d, (old, old))
+
+        first = find_hyde_files(str(root), cache_dir=str(cache))
+        assert hyde_index_path(str(cache), str(root)).exists()
+        # The raw data directory is never written to
+        assert sorted(p.name for p in root.iterdir()) == ["sub"]
+        # A warm run (fresh process) reads the index instead of walking the tree
+        index = _read_hyde_index(str(cache), str(root))
+        assert [(y, str(root / rel)) for y, rel in index["files"]] == list(first.items())
+
+        # Adding a file to a nested directory invalidates the index
+        (root / "sub" / "popd_1500AD.asc").write_text("dummy")
+        assert _read_hyde_index(str(cache), str(root)) is None
+        assert set(find_hyde_files(str(root), cache_dir=str(cache))) == {1000, 1500}
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk LOD data cache.
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import pathlib
+from dataclasses import asdict
+
+from models import AggregatedSettlement, Coordinates, LODLevel
+from lod_cache import load_lod_data, lod_cache_path, save_lod_data
+
+
+def _settlement(lon: float, lat: float, pop: float, level: LODLevel) -> AggregatedSettlement:
+    return AggregatedSettlement(
+        coordinates=Coordinates(longitude=lon, latitude=lat),
+        total_population=pop,
+        year=-1000,
+        lod_level=level,
+        grid_size_degrees=0.5,
+        source_dot_count=3,
+        average_density=12.5,
+    )
+
+
+class TestLODCache:
+    """Round-trip and invalidation behaviour of the LOD cache."""
+
+    def test_round_trip_preserves_settlements(self):
+        lod_data = {
+            LODLevel.REGIONAL: [_settlement(10.25, 45.5, 1234.5, LODLevel.REGIONAL)],
+            LODLevel.LOCAL: [
+                _settlement(-70.1, -12.0, 50.0, LODLevel.LOCAL),
+                _settlement(139.7, 35.7, 90000.0, LODLevel.LOCAL),
+            ],
+            LODLevel.DETAILED: [],
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "lods.npz"
+            save_lod_data(path, lod_data)
+            loaded = load_lod_data(path)
+
+        assert set(loaded) == set(lod_data)
+        for level, settlements in lod_data.items():
+            assert [asdict(s) for s in loaded[level]] == [asdict(s) for s in settlements]
+
+    def test_key_changes_with_source_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            asc = pathlib.Path(tmp) / "popd_1000BC.asc"
+            asc.write_text("ncols 1\n")
+            first = lod_cache_path(tmp, str(asc), -1000)
+            save_lod_data(first, {LODLevel.REGIONAL: []})
+
+            asc.write_text("ncols 1\nnrows 1\n")
+            second = lod_cache_path(tmp, str(asc), -1000)
+            assert second != first
+
+            # Writing the new entry evicts the stale one for the same year
+            save_lod_data(second, {LODLevel.REGIONAL: []})
+            assert second.exists()
+            assert not first.exists()
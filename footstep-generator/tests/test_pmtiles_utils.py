@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the Python MBTiles -> PMTiles fallback conversion.
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gzip
+import sqlite3
+import tempfile
+
+import pytest
+
+from pmtiles_utils import stream_mbtiles_to_pmtiles
+
+# (z, x, y) in MBTiles TMS row order -> payload
+_TILES = {
+    (0, 0, 0): b"world",
+    (1, 0, 0): b"south-west",
+    (1, 1, 1): b"north-east",
+    (2, 3, 2): b"detail",
+}
+
+
+def _write_mbtiles(path: str, as_view: bool) -> None:
+    con = sqlite3.connect(path)
+    con.execute("CREATE TABLE metadata (name TEXT, value TEXT)")
+    con.executemany(
+        "INSERT INTO metadata VALUES (?, ?)",
+        [("format", "pbf"), ("minzoom", "0"), ("maxzoom", "2")],
+    )
+    rows = [(z, x, y, gzip.compress(data, mtime=0)) for (z, x, y), data in _TILES.items()]
+    if as_view:
+        # tile-join style deduplicated layout: tiles is a view over map/images
+        con.execute(
+            "CREATE TABLE map (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_id TEXT)"
+        )
+        con.execute("CREATE TABLE images (tile_data BLOB, tile_id TEXT)")
+        con.executemany(
+            "INSERT INTO map VALUES (?, ?, ?, ?)",
+            [(z, x, y, f"t{i}") for i, (z, x, y, _) in enumerate(rows)],
+        )
+        con.executemany(
+            "INSERT INTO images VALUES (?, ?)",
+            [(blob, f"t{i}") for i, (_, _, _, blob) in enumerate(rows)],
+        )
+        con.execute(
+            "CREATE VIEW tiles AS SELECT map.zoom_level AS zoom_level, "
+            "map.tile_column AS tile_column, map.tile_row AS tile_row, "
+            "images.tile_data AS tile_data "
+            "FROM map JOIN images ON images.tile_id = map.tile_id"
+        )
+    else:
+        con.execute(
+            "CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB)"
+        )
+        con.executemany("INSERT INTO tiles VALUES (?, ?, ?, ?)", rows)
+    con.commit()
+    con.close()
+
+
+@pytest.mark.parametrize("as_view", [False, True], ids=["table", "view"])
+def test_stream_mbtiles_to_pmtiles_round_trip(as_view):
+    pytest.importorskip("pmtiles")
+    from pmtiles.reader import MmapSource, Reader
+
+    with tempfile.TemporaryDirectory() as tmp:
+        mb = os.path.join(tmp, "in.mbtiles")
+        pm = os.path.join(tmp, "out.pmtiles")
+        _write_mbtiles(mb, as_view)
+
+        stream_mbtiles_to_pmtiles(mb, pm)
+
+        with open(pm, "rb") as f:
+            reader = Reader(MmapSource(f))
+            for (z, x, y), data in _TILES.items():
+                # PMTiles addresses tiles in XYZ; MBTiles rows are TMS
+                tile = reader.get(z, x, (1 << z) - 1 - y)
+                assert gzip.decompress(tile) == data
@@ -6,7 +6,10 @@ import pytest
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from process_cities import load_reba_cities, population_to_dots, add_rural_population
+from process_cities import (
+    load_reba_cities, population_to_dots, population_to_dot_arrays, city_dot_arrays,
+    add_rural_population, process_cities_to_dots, DOT_FIELDS,
+)
 
 
 def test_load_reba_cities(tmp_path):
@@ -73,3 +76,75 @@ def test_add_rural_population_ratio_and_limit():
     rural_limit = [d for d in dots_limit if d['type'] == 'rural']
     assert len(rural_limit) == 5000
 
+
+
+def test_city_dot_arrays_matches_per_city_dots():
+    cities = pd.DataFrame({
+        'name': ['A', 'B', 'C'],
+        'lat': [10.0, -89.99, 45.0],
+        'lon': [20.0, 179.99, -3.0],
+        'population': [250, 40, 250000],
+        'year': [1500, 1500, 1500],
+    })
+
+    np.random.seed(7)
+    fused = city_dot_arrays(cities, 1500)
+    np.random.seed(7)
+    per_city = [
+        population_to_dot_arrays(c.population, 1500, c.lat, c.lon, c.name)
+        for c in cities.itertuples(index=False)
+    ]
+
+    assert len(fused['lat']) == 2 + 1 + 1000
+    for field in DOT_FIELDS:
+        expected = np.concatenate([part[field] for part in per_city])
+        assert fused[field].tolist() == expected.tolist()
+
+
+def test_process_cities_to_dots_formats_agree(tmp_path):
+    gpd = pytest.importorskip('geopandas')
+    pytest.importorskip('pyarrow')
+    raw = tmp_path / 'raw'
+    raw.mkdir()
+    pd.DataFrame({
+        'name': ['A', 'B', 'C'],
+        'lat': [10.0, 20.0, -30.0],
+        'lon': [20.0, 40.0, 150.0],
+        'population': [250, 1000, 500],
+        'year': [1500, 1500, 1900],
+    }).to_csv(raw / 'sample_hup_data.csv', index=False)
+
+    geojson = gpd.read_file(process_cities_to_dots(str(raw), str(tmp_path), jobs=1, output_format='geojson'))
+    parquet = gpd.read_parquet(process_cities_to_dots(str(raw), str(tmp_path), jobs=1, output_format='parquet'))
+
+    assert len(parquet) == len(geojson) > 0
+    assert sorted(parquet['year'].unique()) == [1500, 1900]
+    assert parquet['city'].tolist() == geojson['city'].tolist()
+    assert parquet.geometry.x.tolist() == pytest.approx(geojson.geometry.x.tolist())
+
+
+def test_single_dot_city_sits_on_center():
+    np.random.seed(3)
+    expected_next = np.random.random()
+    np.random.seed(3)
+    dots = population_to_dots(150, 1500, 12.5, -7.25, 'Hamlet')
+
+    assert len(dots) == 1
+    assert (dots[0]['lat'], dots[0]['lon']) == (12.5, -7.25)
+    assert dots[0]['population'] == 100
+    # No random numbers are consumed for a single dot
+    assert np.random.random() == expected_next
+
+
+def test_process_cities_to_dots_parquet_requires_pyarrow(tmp_path, monkeypatch):
+    raw = tmp_path / 'raw'
+    raw.mkdir()
+    pd.DataFrame({
+        'name': ['A'], 'lat': [10.0], 'lon': [20.0], 'population': [250], 'year': [1500],
+    }).to_csv(raw / 'sample_hup_data.csv', index=False)
+    # A None entry makes `import pyarrow` raise ImportError
+    monkeypatch.setitem(sys.modules, 'pyarrow', None)
+
+    with pytest.raises(ImportError, match='pyarrow'):
+        process_cities_to_dots(str(raw), str(tmp_path), jobs=1, output_format='parquet')
+    assert not list(tmp_path.glob('city_settlements*'))
@@ -9,7 +9,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import numpy as np
-from lod_processor import LODProcessor
+from lod_processor import LODProcessor, _cell_seed
 from models import LODConfiguration, SettlementContinuityConfig
 
 
@@ -145,6 +145,50 @@ def test_performance_comparison():
     print("✅ Performance test passed!")
 
 
+
+def _reference_splitmix64(z):
+    """SplitMix64 written out on Python ints, independently of lod_processor."""
+    mask = (1 << 64) - 1
+    z = (z + 0x9E3779B97F4A7C15) & mask
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & mask
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & mask
+    return z ^ (z >> 31)
+
+
+def test_cell_seed_is_chained_splitmix64():
+    """Test that cell seeds follow their documented definition, as ints and as arrays."""
+    mask = (1 << 64) - 1
+    # First output of SplitMix64 seeded with 0
+    assert _reference_splitmix64(0) == 0xE220A8397B1DCDAF
+
+    cells = [(0, 0, 0), (10, 20, 1000), (-5, 15, -10000), (-1, -2, -1), (1799, -900, 1850)]
+    x_idx = np.array([x for x, _, _ in cells])
+    y_idx = np.array([y for _, y, _ in cells])
+    for i, (x, y, year) in enumerate(cells):
+        h = _reference_splitmix64(x & mask)
+        h = _reference_splitmix64(h ^ (y & mask))
+        h = _reference_splitmix64(h ^ (year & mask))
+        expected = h & 0x7FFFFFFF
+        assert _cell_seed(x, y, year) == expected
+        assert _cell_seed(x_idx, y_idx, year)[i] == expected
+
+
+def test_batch_randomization_matches_per_cell():
+    """Test that the vectorized randomization reproduces the per-cell positions exactly."""
+    processor = LODProcessor()
+    rng = np.random.default_rng(7)
+    x_idx = np.concatenate([rng.integers(-1800, 1800, 2000), [-1, -2, 0, 1]])
+    y_idx = np.concatenate([rng.integers(-900, 900, 2000), [-1, 0, -1, -2]])
+
+    for grid_size, year in [(1.0, -10000), (0.5, -1), (0.1, 0), (0.25, 1850)]:
+        lons, lats = processor._apply_spatial_randomization_batch(x_idx, y_idx, grid_size, year)
+        expected = [
+            processor._apply_spatial_randomization(x, y, grid_size, year)
+            for x, y in zip(x_idx.tolist(), y_idx.tolist())
+        ]
+        assert list(zip(lons.tolist(), lats.tolist())) == expected
+
+
 if __name__ == "__main__":
     try:
         print("🚀 Running spatial randomization tests...\n")
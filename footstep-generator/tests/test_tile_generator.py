@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for how tile_generator drives external tools (tippecanoe) through pipes.
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import builtins
+import subprocess
+import threading
+import time
+
+import pytest
+
+import tile_generator
+from models import AggregatedSettlement, Coordinates, LODLevel
+
+
+def _settlements(n: int):
+    return [
+        AggregatedSettlement(
+            coordinates=Coordinates(longitude=float(i % 360) - 180.0, latitude=0.0),
+            total_population=100.0,
+            year=1000,
+            lod_level=LODLevel.LOCAL,
+            grid_size_degrees=0.1,
+            source_dot_count=1,
+            average_density=1.0,
+        )
+        for i in range(n)
+    ]
+
+
+def _run_with_deadline(fn, timeout: float = 10.0):
+    result = {}
+    thread = threading.Thread(target=lambda: result.setdefault("ok", fn()), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "tile build hung"
+    return result["ok"]
+
+
+def test_fifo_csv_does_not_hang_when_tool_exits_before_writer_opens(monkeypatch):
+    """A tool that exits at once must not leave the FIFO writer blocked in open()."""
+
+    def slow_open(*args, **kwargs):
+        # The writer thread reaches open() only after the tool has already exited
+        time.sleep(0.3)
+        return builtins.open(*args, **kwargs)
+
+    monkeypatch.setattr(tile_generator, "open", slow_open, raising=False)
+    monkeypatch.setattr(tile_generator, "_lod_tippecanoe_cmd", lambda *args: ["false"])
+
+    ok = _run_with_deadline(
+        lambda: tile_generator.fifo_csv_mbtiles_for_lod(
+            _settlements(10), "unused.mbtiles", 3, 0, 1
+        )
+    )
+    assert ok is False
+
+
+def test_fifo_csv_does_not_hang_when_tool_never_reads(monkeypatch):
+    """A tool that exits without reading must not leave the writer blocked mid-write."""
+    monkeypatch.setattr(tile_generator, "_lod_tippecanoe_cmd", lambda *args: ["true"])
+
+    # Far more than a pipe buffer's worth of CSV
+    ok = _run_with_deadline(
+        lambda: tile_generator.fifo_csv_mbtiles_for_lod(
+            _settlements(20_000), "unused.mbtiles", 3, 0, 1
+        )
+    )
+    assert ok is True
+
+
+def test_run_command_piped_kills_child_when_feed_raises(monkeypatch):
+    """An error while feeding stdin must not leave the tool running unreaped."""
+    spawned = []
+    real_popen = subprocess.Popen
+
+    def recording_popen(*args, **kwargs):
+        proc = real_popen(*args, **kwargs)
+        spawned.append(proc)
+        return proc
+
+    monkeypatch.setattr(tile_generator.subprocess, "Popen", recording_popen)
+
+    def bad_feed(stdin):
+        stdin.write(b"partial")
+        raise UnicodeEncodeError("utf-8", "x", 0, 1, "unencodable feature")
+
+    with pytest.raises(UnicodeEncodeError):
+        tile_generator.run_command_piped(["sleep", "30"], "sleep", bad_feed)
+
+    (proc,) = spawned
+    assert proc.returncode is not None and proc.returncode < 0
@@ -203,7 +203,11 @@ class TestVectorizationOptimizations:
             # Get vectorized results (disable LOD processor dot creation for fair comparison)
             with patch('hyde_tile_processor.LODProcessor') as mock_lod:
                 mock_processor = mock_lod.return_value
-                mock_processor.create_density_aware_dots.side_effect = lambda pop, lat, lon, *args, **kwargs: [(lat, lon, pop)] if pop >= people_per_dot / 2 else []
+                def one_dot_per_cell(pops, lats, lons, *args, **kwargs):
+                    keep = pops >= people_per_dot / 2
+                    return lats[keep], lons[keep], pops[keep]
+
+                mock_processor.create_density_aware_dots_batch.side_effect = one_dot_per_cell
                 
                 vectorized_dots = hyde_grid_to_tile_points(asc_file, year, people_per_dot)
             
@@ -415,7 +419,84 @@ class TestVectorizationOptimizations:
         print(f"    Filter speedup: {loop_filter_time/vectorized_filter_time:.2f}x")
         
         print("  ✓ Vectorized array operations verified")
-    
+
+    def test_grid_cache_round_trip(self):
+        """Test that a cached grid parse is reused and matches the text parse."""
+        from hyde_tile_processor import grid_cache_path, hyde_grid_to_tile_points
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            raw_dir = pathlib.Path(temp_dir) / "raw"
+            cache_dir = str(pathlib.Path(temp_dir) / "cache")
+            raw_dir.mkdir()
+            asc_file = create_test_asc_file(raw_dir, 1500, size=(20, 20))
+            first = hyde_grid_to_tile_points(asc_file, 1500, 100, cache_dir=cache_dir)
+            assert grid_cache_path(cache_dir, asc_file).exists()
+            # The raw data directory is never written to
+            assert os.listdir(raw_dir) == [os.path.basename(asc_file)]
+
+            second = hyde_grid_to_tile_points(asc_file, 1500, 100, cache_dir=cache_dir)
+            assert second == first
+
+    def test_grid_cache_shape_mismatch_reparses(self):
+        """Test that a cached grid whose shape disagrees with the header is not used."""
+        from hyde_tile_processor import GRID_DTYPE, grid_cache_path, hyde_grid_to_tile_points
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asc_file = create_test_asc_file(pathlib.Path(temp_dir), 1500, size=(20, 20))
+            expected = hyde_grid_to_tile_points(asc_file, 1500, 100, columnar=True)
+
+            cache_path = grid_cache_path(temp_dir, asc_file)
+            cache_path.parent.mkdir()
+            np.save(cache_path, np.zeros((3, 4), dtype=GRID_DTYPE))
+            result = hyde_grid_to_tile_points(asc_file, 1500, 100, columnar=True, cache_dir=temp_dir)
+            for name in ("lon", "lat", "population"):
+                np.testing.assert_array_equal(result[name], expected[name])
+            # The stale entry was replaced by the fresh parse
+            assert np.load(cache_path).shape == (20, 20)
+
+    def test_asc_header_keys_are_checked(self):
+        """Test that *llcenter headers are shifted to corners and unexpected keys are rejected."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = pathlib.Path(temp_dir)
+            asc_file = create_test_asc_file(temp_path, 1500, size=(20, 20))
+            lines = pathlib.Path(asc_file).read_text().splitlines(keepends=True)
+            expected = hyde_grid_to_tile_points(asc_file, 1500, 100, columnar=True)
+
+            half = 0.083333333 / 2
+            centered = temp_path / "centered.asc"
+            centered.write_text(
+                "".join(lines[:2])
+                + f"xllcenter {-20 + half!r}\nyllcenter {-35 + half!r}\n"
+                + "".join(lines[4:])
+            )
+            result = hyde_grid_to_tile_points(str(centered), 1500, 100, columnar=True)
+            assert len(result["lon"]) == len(expected["lon"]) > 0
+            np.testing.assert_allclose(result["lon"], expected["lon"])
+            np.testing.assert_allclose(result["lat"], expected["lat"])
+
+            # Swapped xllcorner/yllcorner lines must not be read positionally
+            swapped = temp_path / "swapped.asc"
+            swapped.write_text("".join(lines[:2] + [lines[3], lines[2]] + lines[4:]))
+            assert len(hyde_grid_to_tile_points(str(swapped), 1500, 100, columnar=True)["lon"]) == 0
+
+    def test_closed_form_cell_areas_match_geodesic(self):
+        """Test that per-row closed-form cell areas agree with pyproj's geodesic areas."""
+        from pyproj import Geod
+        from hyde_tile_processor import cell_band_areas_km2
+
+        geod = Geod(ellps="WGS84")
+        cellsize = 0.083333333
+        lats = np.array([-69.96, -30.0, 0.04, 45.5, 74.96])
+
+        areas = cell_band_areas_km2(lats, cellsize)
+        for lat, area in zip(lats, areas):
+            lon_w, lon_e = 10 - cellsize / 2, 10 + cellsize / 2
+            lat_s, lat_n = lat - cellsize / 2, lat + cellsize / 2
+            exact_m2, _ = geod.polygon_area_perimeter(
+                [lon_w, lon_e, lon_e, lon_w], [lat_s, lat_s, lat_n, lat_n]
+            )
+            assert abs(area / (abs(exact_m2) / 1_000_000) - 1) < 1e-6
+
     def test_pre_allocation_effectiveness(self):
         """Test that pre-allocation reduces memory reallocations."""
         print("📦 Testing pre-allocation effectiveness...")
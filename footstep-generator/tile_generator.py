@@ -15,100 +15,236 @@ Features:
  - Hierarchical output: produces both per-LOD artifacts and combined yearly tiles
 """
 
+import contextlib
+import csv
+import io
 import os
 import pathlib
 import subprocess
 import json
 import re
+import shutil
+import sqlite3
 import tempfile
+import threading
 import math
 import hashlib
 import platform
-from typing import List, Dict, Any, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+# Optional fast JSON encoder for GeoJSONL and metadata output
+try:
+    import orjson
+
+    def _json_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+
+    def _json_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _json_line(obj: Any) -> bytes:
+        return (json.dumps(obj) + "\n").encode("utf-8")
+
+    def _json_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 from pmtiles_utils import ensure_pmtiles_for_year
 
 # Import processing functions to compute LODs in-memory
 from hyde_tile_processor import find_hyde_files, generate_yearly_tile_data
-from verify_tiles import verify_single_layer
+from verify_tiles import connect_readonly, verify_single_layer
+from lod_cache import load_lod_data, lod_cache_path, save_lod_data
+
+# When True, external tool output is kept out of the terminal and only shown if the
+# tool fails; otherwise tippecanoe/tile-join stream their progress straight through
+QUIET_TOOLS = False
+
+def set_quiet_tools(quiet: bool) -> None:
+    """Toggle QUIET_TOOLS (also used as the initializer for parallel year workers)."""
+    global QUIET_TOOLS
+    QUIET_TOOLS = quiet
+
+@contextlib.contextmanager
+def _tool_log():
+    """Yield the stdout/stderr target for an external tool.
+
+    None (inherit the parent's streams) normally. In quiet mode a temp file, so the
+    output costs no memory however long the job runs and can be shown on failure.
+    """
+    if not QUIET_TOOLS:
+        yield None
+        return
+    with tempfile.TemporaryFile() as log:
+        yield log
+
+# Failed tools' errors are at the end of their log; tippecanoe progress output
+# before them can run to hundreds of MB, so only this much of the tail is shown
+TOOL_LOG_TAIL_BYTES = 1 << 13
+
+def _print_tool_log(log) -> None:
+    if log is None:
+        return
+    size = log.seek(0, os.SEEK_END)
+    log.seek(max(0, size - TOOL_LOG_TAIL_BYTES))
+    error = log.read().decode("utf-8", errors="replace")
+    if size > TOOL_LOG_TAIL_BYTES:
+        # Drop the partial first line and say how much was skipped
+        error = f"[... last {TOOL_LOG_TAIL_BYTES // 1024} KiB of {size // 1024} KiB log]\n" + error.partition("\n")[2]
+    error = error.strip()
+    if error:
+        print(f"  Error: {error}")
+
+def _spawn_argv(cmd: List[str]) -> List[str]:
+    """Resolve cmd[0] to an absolute path so the tool can be started via posix_spawn.
+
+    Popen only takes CPython's posix_spawn fast path (no fork of this possibly
+    multi-GB process) when the executable has a directory component, close_fds is
+    off and no std stream is a pipe end in 0-2. Leaving fds open is safe: Python
+    opens files non-inheritable (PEP 446).
+    """
+    exe = shutil.which(cmd[0])
+    return [exe, *cmd[1:]] if exe else cmd
 
-def run_command(cmd: List[str], description: str) -> bool:
+def run_command(
+    cmd: List[str], description: str, env: Optional[Dict[str, str]] = None
+) -> bool:
     """Run a shell command and return success status."""
     print(f"Running: {description}")
     print(f"  Command: {' '.join(cmd)}")
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        with _tool_log() as log:
+            try:
+                subprocess.run(
+                    _spawn_argv(cmd),
+                    stdin=subprocess.DEVNULL,
+                    stdout=log,
+                    stderr=log,
+                    close_fds=False,
+                    env=env,
+                    check=True,
+                )
+            except subprocess.CalledProcessError as e:
+                print(f"  ✗ Failed: {e}")
+                _print_tool_log(log)
+                return False
         print(f"  ✓ Success")
-        if result.stdout:
-            print(f"  Output: {result.stdout.strip()}")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"  ✗ Failed: {e}")
-        if e.stderr:
-            print(f"  Error: {e.stderr.strip()}")
+    except FileNotFoundError:
+        print(f"  ✗ Command not found: {cmd[0]}")
+        print("  Make sure tippecanoe is installed: brew install tippecanoe")
         return False
+
+PIPE_BUFFER_SIZE = 1 << 16  # write features into tippecanoe's stdin in 64 KiB chunks
+
+def run_command_piped(
+    cmd: List[str],
+    description: str,
+    feed: Callable[[BinaryIO], None],
+    env: Optional[Dict[str, str]] = None,
+) -> bool:
+    """Run a command whose input is streamed through stdin by feed(stdin)."""
+    print(f"Running: {description}")
+    print(f"  Command: {' '.join(cmd)} < stdin")
+
+    try:
+        # Quiet-mode output goes to a temp file rather than a pipe so it can never
+        # fill up and stall the child while we are still feeding it
+        with _tool_log() as log:
+            proc = subprocess.Popen(
+                _spawn_argv(cmd),
+                stdin=subprocess.PIPE,
+                stdout=log,
+                stderr=log,
+                close_fds=False,
+                env=env,
+                bufsize=PIPE_BUFFER_SIZE,
+            )
+            try:
+                with proc.stdin:
+                    feed(proc.stdin)
+            except BrokenPipeError:
+                pass  # the child exited early; its status and log say why
+            except BaseException:
+                # Don't leave the child running on a half-fed (and half-written) output
+                proc.kill()
+                proc.wait()
+                raise
+            returncode = proc.wait()
+            if returncode != 0:
+                print(f"  ✗ Failed: {cmd[0]} exited with status {returncode}")
+                _print_tool_log(log)
+                return False
     except FileNotFoundError:
         print(f"  ✗ Command not found: {cmd[0]}")
         print("  Make sure tippecanoe is installed: brew install tippecanoe")
         return False
+    print(f"  ✓ Success")
+    return True
 
-def create_metadata_json(output_dir: str) -> None:
-    """Create metadata JSON for the tileset."""
-    config = {
-        "tilejson": "2.2.0",
+# Static TileJSON metadata for the tileset
+TILESET_METADATA: Dict[str, Any] = {
+    "tilejson": "2.2.0",
         "name": "Globe of Humans",
         "description": "Human settlement visualization from 100,000 BCE to 2025 CE",
         "version": "1.0.0",
-        "attribution": "HYDE 3.5, Reba et al.",
-        "minzoom": 0,
-        "maxzoom": 12,
-        "bounds": [-180, -85, 180, 85],
-        "center": [0, 0, 2],
-        "layers": [
-            {
-                "id": "settlements",
-                "description": "Aggregated human settlements by LOD",
-                "minzoom": 0,
-                "maxzoom": 12,
-                "fields": {
-                    "population": "Number",
-                    "year": "Number",
-                    "lod_level": "Number",
-                    "grid_size": "Number",
-                    "source_dots": "Number",
-                    "density": "Number"
-                }
+    "attribution": "HYDE 3.5, Reba et al.",
+    "minzoom": 0,
+    "maxzoom": 12,
+    "bounds": [-180, -85, 180, 85],
+    "center": [0, 0, 2],
+    "layers": [
+        {
+            "id": "settlements",
+            "description": "Aggregated human settlements by LOD",
+            "minzoom": 0,
+            "maxzoom": 12,
+            "fields": {
+                "population": "Number",
+                "year": "Number",
+                "lod_level": "Number",
+                "grid_size": "Number",
+                "source_dots": "Number",
+                "density": "Number"
             }
-        ]
-    }
+        }
+    ]
+}
 
+def create_metadata_json(output_dir: str) -> None:
+    """Create metadata JSON for the tileset."""
     metadata_file = os.path.join(output_dir, "tileset_metadata.json")
-    with open(metadata_file, 'w') as f:
-        json.dump(config, f, indent=2)
+    with open(metadata_file, 'wb') as f:
+        f.write(_json_pretty(TILESET_METADATA))
     
     print(f"✓ Created metadata: {metadata_file}")
 
 def verify_tiles(tiles_file: str) -> bool:
     """Verify the generated tiles file."""
-    if not pathlib.Path(tiles_file).exists():
+    # One stat() for both the existence and the size check
+    try:
+        size_bytes = os.stat(tiles_file).st_size
+    except FileNotFoundError:
         print(f"  ✗ Tiles file not found: {tiles_file}")
         return False
     
     # Check file size
-    size_mb = pathlib.Path(tiles_file).stat().st_size / (1024 * 1024)
+    size_mb = size_bytes / (1024 * 1024)
     print(f"  ✓ Tiles file size: {size_mb:.1f} MB")
     
     # Try to get info about the tileset
     try:
-        result = subprocess.run(
-            ["sqlite3", tiles_file, "SELECT name FROM sqlite_master WHERE type='table';"],
-            capture_output=True, text=True, check=True
-        )
-        tables = result.stdout.strip().split('\n')
+        # Read-only, in-process: no sqlite3 CLI fork/exec just to list tables
+        with contextlib.closing(connect_readonly(tiles_file)) as con:
+            tables = [
+                row[0]
+                for row in con.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            ]
         print(f"  ✓ Tables found: {', '.join(tables)}")
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("  ? Could not verify tiles (sqlite3 not available)")
+    except sqlite3.Error as e:
+        print(f"  ? Could not verify tiles ({e})")
         return True  # Assume it's okay
 
 # ---------------------------
@@ -118,48 +254,116 @@ def verify_tiles(tiles_file: str) -> bool:
 # Import centralized LOD configuration
 from lod_config import LOD_ZOOM_RANGES
 
+GEOJSONL_BUFFER_SIZE = 1 << 20  # coalesce per-feature writes into 1 MiB syscalls
+# Base per-feature minzoom by LOD level; finer levels start at z6
+_LOD_BASE_MINZOOM = {0: 0, 1: 4, 2: 5}
+
+# Rough upper bound on encoded bytes per feature, used to size temp files up front
+TEMP_BYTES_PER_FEATURE = 400
+
+def resolve_temp_dir(estimated_bytes: int = 0) -> Optional[str]:
+    """Pick the directory for transient tippecanoe input files.
+
+    FOOTSTEPS_TMPDIR wins when set. Otherwise prefer /dev/shm (tmpfs) so these
+    write-once/read-once files never hit disk, falling back to the default temp
+    dir (None) when /dev/shm is missing or lacks room for estimated_bytes.
+    """
+    override = os.environ.get("FOOTSTEPS_TMPDIR")
+    if override:
+        return override
+    if os.path.isdir("/dev/shm"):
+        try:
+            stats = os.statvfs("/dev/shm")
+        except OSError:
+            return None
+        # Leave headroom for other years being built in parallel
+        if stats.f_bavail * stats.f_frsize > 2 * estimated_bytes:
+            return "/dev/shm"
+    return None
+
+def write_geojsonl_features(f_out: BinaryIO, settlements, lod_level: int) -> None:
+    """Encode AggregatedSettlement list as GeoJSONL features into a binary stream."""
+    # Bind hot-loop callables to locals once instead of resolving them per feature
+    write = f_out.write
+    encode = _json_line
+    base_minzoom = _LOD_BASE_MINZOOM.get
+    for s in settlements:
+        coords = s.coordinates
+        pop = s.total_population
+        lv = int(getattr(s.lod_level, "value", lod_level))
+        # Assign per-feature minzoom based on LOD and population importance
+        tz = base_minzoom(lv, 6)
+        if tz and pop > 20000:
+            tz -= 1
+        write(encode({
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [coords.longitude, coords.latitude],
+            },
+            "properties": {
+                "population": pop,
+                "year": s.year,
+                "type": "settlement",
+                "lod_level": lv,
+                "grid_size": s.grid_size_degrees,
+                "source_dots": s.source_dot_count,
+                "density": s.average_density,
+            },
+            "tippecanoe": {"minzoom": tz, "maxzoom": 12},
+        }))
+
 def write_geojsonl_temp(settlements, lod_level: int) -> str:
     """Write AggregatedSettlement list to a temporary GeoJSONL file and return its path."""
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix=".geojsonl")
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        suffix=".geojsonl", dir=resolve_temp_dir(len(settlements) * TEMP_BYTES_PER_FEATURE)
+    )
     os.close(tmp_fd)
-    with open(tmp_path, "w", encoding="utf-8") as f_out:
-        for s in settlements:
-            feature = {
-                "type": "Feature",
-                "geometry": {
-                    "type": "Point",
-                    "coordinates": [s.coordinates.longitude, s.coordinates.latitude],
-                },
-                "properties": {
-                    "population": s.total_population,
-                    "year": s.year,
-                    "type": "settlement",
-                    "lod_level": getattr(s.lod_level, "value", s.lod_level),
-                    "grid_size": s.grid_size_degrees,
-                    "source_dots": s.source_dot_count,
-                    "density": s.average_density,
-                },
-            }
-            # Assign per-feature minzoom based on LOD and population importance
-            lv = int(getattr(s.lod_level, "value", lod_level))
-            if lv == 0:
-                tz = 0
-            elif lv == 1:
-                tz = 4
-            elif lv == 2:
-                tz = 5
-            else:
-                tz = 6
-            try:
-                if float(s.total_population) > 20000:
-                    tz = max(0, tz - 1)
-            except Exception:
-                pass
-            feature["tippecanoe"] = {"minzoom": tz, "maxzoom": 12}
-            f_out.write(json.dumps(feature))
-            f_out.write("\n")
+    with open(tmp_path, "wb", buffering=GEOJSONL_BUFFER_SIZE) as f_out:
+        write_geojsonl_features(f_out, settlements, lod_level)
+    return tmp_path
+
+# Column order for CSV input; tippecanoe takes lon/lat as geometry and the rest as properties
+CSV_COLUMNS = ["lon", "lat", "population", "year", "type", "lod_level", "grid_size", "source_dots", "density"]
+
+def write_csv_features(f_out, settlements, lod_level: int) -> None:
+    """Encode AggregatedSettlement list as CSV rows (with header) into a text stream.
+
+    CSV is cheaper to produce and for tippecanoe to parse than GeoJSONL, but it has
+    no per-feature tippecanoe zoom overrides: features span the LOD's full zoom range.
+    """
+    writer = csv.writer(f_out)
+    writer.writerow(CSV_COLUMNS)
+    writer.writerows(
+        (
+            s.coordinates.longitude,
+            s.coordinates.latitude,
+            s.total_population,
+            s.year,
+            "settlement",
+            int(getattr(s.lod_level, "value", lod_level)),
+            s.grid_size_degrees,
+            s.source_dot_count,
+            s.average_density,
+        )
+        for s in settlements
+    )
+
+def write_csv_temp(settlements, lod_level: int) -> str:
+    """Write AggregatedSettlement list to a temporary CSV file and return its path."""
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        suffix=".csv", dir=resolve_temp_dir(len(settlements) * TEMP_BYTES_PER_FEATURE)
+    )
+    os.close(tmp_fd)
+    with open(tmp_path, "w", encoding="utf-8", newline="", buffering=GEOJSONL_BUFFER_SIZE) as f_out:
+        write_csv_features(f_out, settlements, lod_level)
     return tmp_path
 
+# Only formats tippecanoe can't read from stdin (it assumes GeoJSON there) need a
+# named input: a FIFO where the platform has them, else a temp file
+LOD_INPUT_FORMATS = ("geojsonl", "csv")
+HAVE_MKFIFO = hasattr(os, "mkfifo")
+
 def _wm_tile(lon: float, lat: float, z: int) -> tuple:
     x = int((lon + 180.0) / 360.0 * (1 << z))
     lat_rad = math.radians(lat)
@@ -212,9 +416,12 @@ def write_combined_geojsonl(lod_map: Dict[Any, List[Any]]) -> str:
             for i in ranked[:target]:
                 if z < minzoom[i]:
                     minzoom[i] = z
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix=".geojsonl")
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        suffix=".geojsonl", dir=resolve_temp_dir(len(detailed) * TEMP_BYTES_PER_FEATURE)
+    )
     os.close(tmp_fd)
-    with open(tmp_path, "w", encoding="utf-8") as f_out:
+    with open(tmp_path, "wb", buffering=GEOJSONL_BUFFER_SIZE) as f_out:
+        write = f_out.write
         for i, d in enumerate(detailed):
             feature = {
                 "type": "Feature",
@@ -230,10 +437,43 @@ def write_combined_geojsonl(lod_map: Dict[Any, List[Any]]) -> str:
                 },
                 "tippecanoe": {"minzoom": int(minzoom[i]), "maxzoom": 12},
             }
-            f_out.write(json.dumps(feature))
-            f_out.write("\n")
+            write(_json_line(feature))
     return tmp_path
 
+def write_combined_windows_features(f_out: BinaryIO, lod_map: Dict[Any, List[Any]]) -> None:
+    """Encode all LODs as single-layer GeoJSONL features with LOD zoom windows."""
+    # Use centralized single-layer LOD windows
+    from lod_config import SINGLE_LAYER_LOD_WINDOWS
+    lod_windows = SINGLE_LAYER_LOD_WINDOWS
+
+    write = f_out.write
+    encode = _json_line
+    for lod_level, settlements in sorted(
+        lod_map.items(), key=lambda x: int(getattr(x[0], "value", x[0]))
+    ):
+        lv = int(getattr(lod_level, "value", lod_level))
+        minz, maxz = lod_windows.get(lv, (6, 12))
+        for s in settlements:
+            coords = s.coordinates
+            feature = {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": [coords.longitude, coords.latitude],
+                },
+                "properties": {
+                    "population": s.total_population,
+                    "year": s.year,
+                    "type": "settlement",
+                    "lod_level": lv,
+                    "grid_size": s.grid_size_degrees,
+                    "source_dots": s.source_dot_count,
+                    "density": s.average_density,
+                },
+                "tippecanoe": {"minzoom": minz, "maxzoom": maxz},
+            }
+            write(encode(feature))
+
 def write_combined_geojsonl_windows(lod_map: Dict[Any, List[Any]]) -> str:
     """Write a single-layer GeoJSONL using population-preserving LOD windows.
 
@@ -241,48 +481,41 @@ def write_combined_geojsonl_windows(lod_map: Dict[Any, List[Any]]) -> str:
     given zoom, exactly one LOD is visible and its features' populations sum to the
     true total (conservation).
     """
-    # Use centralized single-layer LOD windows
-    from lod_config import SINGLE_LAYER_LOD_WINDOWS
-    lod_windows = SINGLE_LAYER_LOD_WINDOWS
-
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix=".geojsonl")
+    feature_count = sum(len(settlements) for settlements in lod_map.values())
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        suffix=".geojsonl", dir=resolve_temp_dir(feature_count * TEMP_BYTES_PER_FEATURE)
+    )
     os.close(tmp_fd)
-    with open(tmp_path, "w", encoding="utf-8") as f_out:
-        for lod_level, settlements in sorted(
-            lod_map.items(), key=lambda x: int(getattr(x[0], "value", x[0]))
-        ):
-            lv = int(getattr(lod_level, "value", lod_level))
-            minz, maxz = lod_windows.get(lv, (6, 12))
-            for s in settlements:
-                feature = {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [s.coordinates.longitude, s.coordinates.latitude],
-                    },
-                    "properties": {
-                        "population": s.total_population,
-                        "year": s.year,
-                        "type": "settlement",
-                        "lod_level": lv,
-                        "grid_size": s.grid_size_degrees,
-                        "source_dots": s.source_dot_count,
-                        "density": s.average_density,
-                    },
-                    "tippecanoe": {"minzoom": minz, "maxzoom": maxz},
-                }
-                f_out.write(json.dumps(feature))
-                f_out.write("\n")
+    with open(tmp_path, "wb", buffering=GEOJSONL_BUFFER_SIZE) as f_out:
+        write_combined_windows_features(f_out, lod_map)
     return tmp_path
 
-def generate_mbtiles_for_lod(
-    input_geojsonl: str,
-    out_mbtiles: str,
-    lod_level: int,
-    minzoom: int,
-    maxzoom: int,
-) -> bool:
-    """Run tippecanoe for a single LOD with strict population preservation."""
+TIPPECANOE_FEATURES_PER_THREAD = 50_000
+
+def tippecanoe_env(feature_count: int) -> Optional[Dict[str, str]]:
+    """Environment capping tippecanoe's threads for an input of feature_count features.
+
+    Small (mostly historical) inputs run single-threaded; larger ones get one thread
+    per TIPPECANOE_FEATURES_PER_THREAD features up to the CPU count. Keeps several
+    LODs or years running side by side from oversubscribing the cores. Returns None
+    (inherit) when the user already set TIPPECANOE_MAX_THREADS.
+    """
+    if "TIPPECANOE_MAX_THREADS" in os.environ:
+        return None
+    threads = max(1, min(os.cpu_count() or 1, feature_count // TIPPECANOE_FEATURES_PER_THREAD))
+    return {**os.environ, "TIPPECANOE_MAX_THREADS": str(threads)}
+
+def _input_feature_count(input_path: str) -> int:
+    """Estimate the feature count of a tippecanoe input file from its size."""
+    try:
+        return os.path.getsize(input_path) // TEMP_BYTES_PER_FEATURE
+    except OSError:
+        return 0
+
+def _lod_tippecanoe_cmd(
+    out_mbtiles: str, lod_level: int, minzoom: int, maxzoom: int
+) -> List[str]:
+    """Build the tippecanoe command for one LOD, without an input path."""
     cmd = [
         "tippecanoe",
         "-o", out_mbtiles,
@@ -291,15 +524,140 @@ def generate_mbtiles_for_lod(
         "--no-feature-limit",
         "--no-tile-size-limit",
         "--force",
+        # Our GeoJSONL has one feature per line, so tippecanoe can split parsing
+        # across threads (CSV input is always read serially and ignores this)
+        "--read-parallel",
         "-l", f"humans_lod_{lod_level}",
-        input_geojsonl,
     ]
     # Keep many more points visible at the first LOD 3 zoom (z=6)
     # to avoid a perceived drop in density when switching from LOD 2 (z=5).
     # Droprate 1 significantly reduces point thinning at lower zooms.
     if lod_level == 3:
         cmd[1:1] = ["-r", "1"]
-    return run_command(cmd, f"LOD {lod_level} tiles (z{minzoom}-{maxzoom})")
+    return cmd
+
+def generate_mbtiles_for_lod(
+    input_path: str,
+    out_mbtiles: str,
+    lod_level: int,
+    minzoom: int,
+    maxzoom: int,
+) -> bool:
+    """Run tippecanoe for a single LOD with strict population preservation.
+
+    input_path may be GeoJSONL or CSV; tippecanoe picks the parser from the extension.
+    """
+    cmd = _lod_tippecanoe_cmd(out_mbtiles, lod_level, minzoom, maxzoom) + [input_path]
+    return run_command(
+        cmd,
+        f"LOD {lod_level} tiles (z{minzoom}-{maxzoom})",
+        env=tippecanoe_env(_input_feature_count(input_path)),
+    )
+
+def pipe_mbtiles_for_lod(
+    settlements,
+    out_mbtiles: str,
+    lod_level: int,
+    minzoom: int,
+    maxzoom: int,
+) -> bool:
+    """Run tippecanoe for a single LOD, streaming GeoJSONL features into its stdin.
+
+    Avoids writing and re-reading a temp file for the largest artifacts in the pipeline.
+    """
+    cmd = _lod_tippecanoe_cmd(out_mbtiles, lod_level, minzoom, maxzoom)
+    return run_command_piped(
+        cmd,
+        f"LOD {lod_level} tiles (z{minzoom}-{maxzoom})",
+        lambda stdin: write_geojsonl_features(stdin, settlements, lod_level),
+        env=tippecanoe_env(len(settlements)),
+    )
+
+# How often fifo_csv_mbtiles_for_lod retries unblocking a stuck FIFO writer
+FIFO_UNBLOCK_INTERVAL_S = 0.05
+
+def fifo_csv_mbtiles_for_lod(
+    settlements,
+    out_mbtiles: str,
+    lod_level: int,
+    minzoom: int,
+    maxzoom: int,
+) -> bool:
+    """Run tippecanoe for a single LOD on CSV streamed through a named pipe.
+
+    tippecanoe only parses CSV from a path ending in .csv, so a FIFO with that name
+    stands in for the temp file: the CSV is encoded while tippecanoe parses it and
+    never touches disk.
+    """
+    fifo_dir = tempfile.mkdtemp(prefix="footsteps_csv_")
+    fifo_path = os.path.join(fifo_dir, f"lod_{lod_level}.csv")
+    os.mkfifo(fifo_path, 0o600)
+
+    def feed() -> None:
+        try:
+            with open(fifo_path, "w", encoding="utf-8", newline="", buffering=PIPE_BUFFER_SIZE) as f_out:
+                write_csv_features(f_out, settlements, lod_level)
+        except BrokenPipeError:
+            pass  # tippecanoe exited early; its status and log say why
+
+    writer = threading.Thread(target=feed, name=f"csv-fifo-lod{lod_level}", daemon=True)
+    writer.start()
+    try:
+        cmd = _lod_tippecanoe_cmd(out_mbtiles, lod_level, minzoom, maxzoom) + [fifo_path]
+        return run_command(
+            cmd,
+            f"LOD {lod_level} tiles (z{minzoom}-{maxzoom})",
+            env=tippecanoe_env(len(settlements)),
+        )
+    finally:
+        # tippecanoe stopped reading (or never opened the pipe): briefly open and
+        # close the read end so the writer's open/write fails instead of blocking
+        # forever. Repeated until the writer exits, since it may not have reached
+        # its own open yet when tippecanoe fails straight away.
+        while writer.is_alive():
+            try:
+                os.close(os.open(fifo_path, os.O_RDONLY | os.O_NONBLOCK))
+            except OSError:
+                pass
+            writer.join(timeout=FIFO_UNBLOCK_INTERVAL_S)
+        shutil.rmtree(fifo_dir, ignore_errors=True)
+
+def _run_lod_job(
+    source,
+    out_mbtiles: str,
+    lod_level: int,
+    minzoom: int,
+    maxzoom: int,
+    input_format: str = "geojsonl",
+) -> bool:
+    if isinstance(source, str):
+        return generate_mbtiles_for_lod(source, out_mbtiles, lod_level, minzoom, maxzoom)
+    if input_format == "csv":
+        return fifo_csv_mbtiles_for_lod(source, out_mbtiles, lod_level, minzoom, maxzoom)
+    return pipe_mbtiles_for_lod(source, out_mbtiles, lod_level, minzoom, maxzoom)
+
+def generate_mbtiles_for_lods(
+    lod_jobs: List[Tuple[Any, str, int, int, int]],
+    max_workers: int = 4,
+    input_format: str = "geojsonl",
+) -> bool:
+    """Run tippecanoe for several LODs concurrently.
+
+    Each job is (source, out_mbtiles, lod_level, minzoom, maxzoom), where source is
+    either an input file path or a list of settlements to stream in as input_format
+    (GeoJSONL via stdin, CSV via a FIFO). The LOD outputs are independent files, and
+    each worker only waits on (or feeds) its tippecanoe child, so a thread pool is
+    enough to overlap them. Returns True if every LOD built.
+    """
+    if not lod_jobs:
+        return True
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(lod_jobs))) as executor:
+        futures = [
+            executor.submit(_run_lod_job, *job, input_format=input_format)
+            for job in lod_jobs
+        ]
+        results = [future.result() for future in futures]
+    return all(results)
 
 def combine_lod_mbtiles(lod_mbtiles: List[str], out_mbtiles: str) -> bool:
     """Combine multiple LOD-specific MBTiles into a single year MBTiles."""
@@ -311,8 +669,9 @@ def combine_lod_mbtiles(lod_mbtiles: List[str], out_mbtiles: str) -> bool:
     ]
     return run_command(cmd, "Combine LOD MBTiles -> yearly tileset")
 
-def generate_single_layer_mbtiles(input_geojsonl: str, out_mbtiles: str) -> bool:
-    cmd = [
+def _single_layer_tippecanoe_cmd(out_mbtiles: str) -> List[str]:
+    """Build the single-layer tippecanoe command, without an input path."""
+    return [
         "tippecanoe",
         "-o", out_mbtiles,
         "-Z", "0",
@@ -320,87 +679,105 @@ def generate_single_layer_mbtiles(input_geojsonl: str, out_mbtiles: str) -> bool
         "--no-feature-limit",
         "--no-tile-size-limit",
         "--force",
+        "--read-parallel",
         "-r", "1",
         "-l", "humans",
-        input_geojsonl,
     ]
-    ok = run_command(cmd, "Single-layer yearly tiles (humans)")
-    if not ok:
-        return False
+
+# Page cache for the index build (negative = KiB): lets the CREATE INDEX sort
+# run in memory instead of spilling to temp files
+INDEX_BUILD_CACHE_KIB = 262144
+
+def _ensure_tiles_index(out_mbtiles: str) -> None:
     # Ensure composite index on tiles to support fast remote lookups via HTTP range
     try:
-        import subprocess
         print("  ▸ Ensuring tiles index (zoom_level, tile_column, tile_row)...")
-        sql = (
-            "CREATE INDEX IF NOT EXISTS idx_tiles_zoom_level_tile_column_tile_row "
-            "ON tiles(zoom_level, tile_column, tile_row); "
-            "ANALYZE;"
-        )
-        subprocess.run(["sqlite3", out_mbtiles, sql], check=True)
+        with contextlib.closing(sqlite3.connect(out_mbtiles)) as con:
+            con.execute(f"PRAGMA cache_size=-{INDEX_BUILD_CACHE_KIB}")
+            con.execute("PRAGMA temp_store=MEMORY")
+            con.executescript(
+                "CREATE INDEX IF NOT EXISTS idx_tiles_zoom_level_tile_column_tile_row "
+                "ON tiles(zoom_level, tile_column, tile_row); "
+                "ANALYZE;"
+            )
         print("  ✓ Tiles index ensured")
     except Exception as e:
         print(f"  ⚠️  Could not ensure tiles index: {e}")
+
+def generate_single_layer_mbtiles(input_geojsonl: str, out_mbtiles: str) -> bool:
+    cmd = _single_layer_tippecanoe_cmd(out_mbtiles) + [input_geojsonl]
+    ok = run_command(
+        cmd,
+        "Single-layer yearly tiles (humans)",
+        env=tippecanoe_env(_input_feature_count(input_geojsonl)),
+    )
+    if not ok:
+        return False
+    _ensure_tiles_index(out_mbtiles)
     return True
 
-def generate_year_tiles(asc_file: str, tiles_dir: str, year: int, force: bool = False) -> Optional[str]:
-    """Generate a single MBTiles for a given year by computing LODs and combining them.
+def pipe_single_layer_mbtiles(lod_map: Dict[Any, List[Any]], out_mbtiles: str) -> bool:
+    """Build the single-layer yearly MBTiles, streaming LOD-windowed features via stdin."""
+    ok = run_command_piped(
+        _single_layer_tippecanoe_cmd(out_mbtiles),
+        "Single-layer yearly tiles (humans)",
+        lambda stdin: write_combined_windows_features(stdin, lod_map),
+        env=tippecanoe_env(sum(len(v) for v in lod_map.values())),
+    )
+    if not ok:
+        return False
+    _ensure_tiles_index(out_mbtiles)
+    return True
 
-    Tiles-only: computes LODs in-memory (no intermediate artifacts), writes temporary GeoJSONL per LOD,
-    builds per-LOD MBTiles with tippecanoe, and combines into a single yearly MBTiles.
-    """
+def build_lod_mbtiles(
+    lod_data: Dict[Any, List[Any]],
+    tiles_dir: str,
+    year: int,
+    force: bool = False,
+    lod_input_format: str = "geojsonl",
+) -> Optional[List[str]]:
+    """Build humans_{year}_lod_{lod}.mbtiles for every non-empty LOD in lod_data.
 
+    Shared by the tile_generator and generate_footstep_tiles year builders. Existing
+    per-LOD files are kept unless force is set; the rest are built concurrently,
+    GeoJSONL piped via stdin (or CSV through a FIFO, see lod_input_format).
+    Returns the per-LOD paths in LOD order, or None if any tippecanoe run failed.
+    """
     tiles_dir_path = pathlib.Path(tiles_dir)
-    tiles_dir_path.mkdir(parents=True, exist_ok=True)
-    final_path = tiles_dir_path / f"humans_{year}.mbtiles"
-
-    if final_path.exists() and not force:
-        print(f"  ↪ Skipping year {year}: {final_path.name} already exists (use --force to overwrite)")
-        return str(final_path)
-
-    # Compute LODs for this year
-    result = generate_yearly_tile_data(asc_file, year, str(tiles_dir_path), force=force)
     lod_tiles: List[str] = []
     tmp_files: List[str] = []
     try:
+        # Serial pre-pass: collect each LOD's input, then run tippecanoe
+        # for all LODs at once
+        lod_jobs: List[Tuple[Any, str, int, int, int]] = []
         for lod_level, settlements in sorted(
-            result.lod_data.items(), key=lambda x: getattr(x[0], "value", x[0])
+            lod_data.items(), key=lambda x: getattr(x[0], "value", x[0])
         ):
             if not settlements:
                 continue
-            # Write temp GeoJSONL for this LOD
-            tmp_geojsonl = write_geojsonl_temp(settlements, int(getattr(lod_level, "value", lod_level)))
-            tmp_files.append(tmp_geojsonl)
-            minzoom, maxzoom = LOD_ZOOM_RANGES.get(int(getattr(lod_level, "value", lod_level)), (0, 12))
             target_lod = int(getattr(lod_level, "value", lod_level))
+            minzoom, maxzoom = LOD_ZOOM_RANGES.get(target_lod, (0, 12))
 
             # Persist per-LOD MBTiles to tiles_dir so the server can serve
             # Per-LOD artifacts exist (humans_{year}_lod_{lod}.mbtiles) but the frontend uses the single per-year endpoint
             lod_out = tiles_dir_path / f"humans_{year}_lod_{target_lod}.mbtiles"
-            if lod_out.exists() and force:
-                lod_out.unlink()
-            if not lod_out.exists() or force:
-                ok = generate_mbtiles_for_lod(tmp_geojsonl, str(lod_out), target_lod, minzoom, maxzoom)
-                if not ok:
-                    return None
+            if force:
+                lod_out.unlink(missing_ok=True)
+            if force or not lod_out.exists():
+                if lod_input_format == "csv" and not HAVE_MKFIFO:
+                    source = write_csv_temp(settlements, target_lod)
+                    tmp_files.append(source)
+                else:
+                    # Streamed straight into tippecanoe: GeoJSONL via stdin, CSV via a FIFO
+                    source = settlements
+                lod_jobs.append((source, str(lod_out), target_lod, minzoom, maxzoom))
             else:
                 print(f"  ↪ Skipping LOD {target_lod}: {lod_out.name} already exists (use --force to overwrite)")
             lod_tiles.append(str(lod_out))
 
-        if not lod_tiles:
-            print(f"  ✗ No LOD tiles were generated for {year}")
-            return None
-
-        # Combine into final yearly MBTiles
-        if final_path.exists() and force:
-            final_path.unlink()
-        ok = combine_lod_mbtiles(lod_tiles, str(final_path))
-        if not ok:
+        if not generate_mbtiles_for_lods(lod_jobs, input_format=lod_input_format):
             return None
-
-        # Verify
-        verify_tiles(str(final_path))
-        print(f"  ✓ Year {year} MBTiles ready: {final_path}")
-        return str(final_path)
+        return lod_tiles
     finally:
         # Cleanup temp files
         for t in tmp_files:
@@ -409,6 +786,174 @@ def generate_year_tiles(asc_file: str, tiles_dir: str, year: int, force: bool =
             except OSError:
                 pass
 
+def compute_lod_data(
+    asc_file: str, year: int, tiles_dir: str, force: bool = False
+) -> Dict[Any, List[Any]]:
+    """Return the year's LOD data, reusing tiles_dir/.lod_cache unless force is set."""
+    cache_path = lod_cache_path(tiles_dir, asc_file, year)
+    if cache_path.exists() and not force:
+        try:
+            lod_data = load_lod_data(cache_path)
+            print(f"  ↪ Reusing cached LODs for {year}: {cache_path.name}")
+            return lod_data
+        except (OSError, ValueError, KeyError) as e:
+            print(f"  ⚠️  Ignoring unreadable LOD cache {cache_path.name}: {e}")
+    lod_data = generate_yearly_tile_data(asc_file, year, tiles_dir, force=force).lod_data
+    try:
+        save_lod_data(cache_path, lod_data)
+    except OSError as e:
+        print(f"  ⚠️  Could not write LOD cache: {e}")
+    return lod_data
+
+def existing_lod_mbtiles(tiles_dir: str, year: int) -> Optional[List[str]]:
+    """Return every per-LOD MBTiles path for year if all of them exist, else None."""
+    paths = [
+        pathlib.Path(tiles_dir) / f"humans_{year}_lod_{lod}.mbtiles"
+        for lod in sorted(LOD_ZOOM_RANGES)
+    ]
+    if all(p.exists() for p in paths):
+        return [str(p) for p in paths]
+    return None
+
+def generate_year_tiles(
+    asc_file: str,
+    tiles_dir: str,
+    year: int,
+    force: bool = False,
+    lod_input_format: str = "geojsonl",
+    lod_data: Optional[Dict[Any, List[Any]]] = None,
+    combine: bool = True,
+) -> Optional[str]:
+    """Generate a single MBTiles for a given year by computing LODs and combining them.
+
+    Tiles-only: computes LODs in-memory (no intermediate artifacts), streams GeoJSONL
+    per LOD into tippecanoe (or writes a temporary CSV, see lod_input_format), builds
+    per-LOD MBTiles, and combines into a single yearly MBTiles. Pass lod_data to reuse
+    LODs the caller already computed; without it, LODs are only computed when some
+    per-LOD MBTiles is missing (or force is set). With combine=False the tile-join
+    step is skipped and the first per-LOD path is returned.
+    """
+
+    tiles_dir_path = pathlib.Path(tiles_dir)
+    tiles_dir_path.mkdir(parents=True, exist_ok=True)
+    final_path = tiles_dir_path / f"humans_{year}.mbtiles"
+
+    if combine and final_path.exists() and not force:
+        print(f"  ↪ Skipping year {year}: {final_path.name} already exists (use --force to overwrite)")
+        return str(final_path)
+
+    lod_tiles = None if (force or lod_data is not None) else existing_lod_mbtiles(tiles_dir, year)
+    if lod_tiles is not None:
+        print(f"  ↪ All per-LOD MBTiles for {year} exist; skipping LOD computation")
+    else:
+        # Compute LODs for this year
+        if lod_data is None:
+            lod_data = compute_lod_data(asc_file, year, str(tiles_dir_path), force=force)
+        lod_tiles = build_lod_mbtiles(
+            lod_data, str(tiles_dir_path), year, force=force, lod_input_format=lod_input_format
+        )
+        if lod_tiles is None:
+            return None
+    if not lod_tiles:
+        print(f"  ✗ No LOD tiles were generated for {year}")
+        return None
+    if not combine:
+        print(f"  ✓ Year {year} per-LOD MBTiles ready ({len(lod_tiles)} files)")
+        return lod_tiles[0]
+
+    # Combine into final yearly MBTiles
+    if force:
+        final_path.unlink(missing_ok=True)
+    ok = combine_lod_mbtiles(lod_tiles, str(final_path))
+    if not ok:
+        return None
+
+    # Verify
+    verify_tiles(str(final_path))
+    print(f"  ✓ Year {year} MBTiles ready: {final_path}")
+    return str(final_path)
+
+def build_year_tiles(
+    asc_file: str,
+    tiles_dir: str,
+    year: int,
+    force: bool = False,
+    single_layer: bool = True,
+    verify: bool = False,
+    strict: bool = False,
+    pmtiles: bool = True,
+    lod_input_format: str = "geojsonl",
+    combine: bool = True,
+) -> bool:
+    """Build per-LOD, yearly and optional single-layer/PMTiles outputs for one year.
+
+    The tile-joined yearly file shares its path with the single-layer output, which
+    overwrites it, so it is only combined when single_layer is off and combine is on.
+    Returns True when the yearly (or, without combining, per-LOD) MBTiles was produced.
+    """
+    print(f"→ Building tiles for year {year}...")
+    # The single-layer build needs the LODs anyway, so compute them once up front and
+    # share them with the per-LOD build instead of processing the ASC grid twice
+    lod_data = None
+    single_layer_job = None
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if single_layer:
+            lod_data = compute_lod_data(asc_file, year, tiles_dir, force=force)
+            # Build single-layer variant using all LOD data deterministically
+            yearly_out = pathlib.Path(tiles_dir) / f"humans_{year}.mbtiles"
+            if force:
+                yearly_out.unlink(missing_ok=True)
+            # Its tippecanoe run is independent of the per-LOD ones, so overlap them.
+            # Use LOD windows so exactly one LOD is visible per zoom
+            single_layer_job = executor.submit(
+                pipe_single_layer_mbtiles, lod_data, str(yearly_out)
+            )
+        out = generate_year_tiles(
+            asc_file,
+            tiles_dir,
+            year,
+            force=force,
+            lod_input_format=lod_input_format,
+            lod_data=lod_data,
+            combine=combine and not single_layer,
+        )
+        ok = single_layer_job.result() if single_layer_job is not None else False
+    if not out:
+        return False
+    if single_layer:
+        if ok and verify:
+            print("→ Verifying single-layer output…")
+            ok2 = verify_single_layer(str(yearly_out), strict=strict)
+            if strict and not ok2:
+                raise SystemExit(1)
+        # Optionally produce PMTiles without re-running tippecanoe
+        if ok and pmtiles:
+            print("→ Converting to PMTiles…")
+            pm = ensure_pmtiles_for_year(tiles_dir, year)
+            if pm:
+                print(f"  ✓ Year {year} PMTiles ready: {pm}")
+            else:
+                print("  ⚠️  PMTiles conversion failed. Install `pmtiles` CLI or `pip install pmtiles`.")
+    return True
+
+def _build_year_tiles_captured(*args) -> Tuple[bool, str, Optional[int]]:
+    """Run build_year_tiles in a worker process, returning its status and captured log.
+
+    Only Python-level output is redirected; workers run with QUIET_TOOLS set so
+    external tools write to temp logs whose tail is printed (and so captured) on
+    failure. A strict-mode SystemExit is returned as its exit code (else None)
+    together with the log rather than raised.
+    """
+    buf = io.StringIO()
+    exit_code = None
+    with contextlib.redirect_stdout(buf):
+        try:
+            ok = build_year_tiles(*args)
+        except SystemExit as e:
+            ok = False
+            exit_code = 0 if e.code is None else e.code
+    return ok, buf.getvalue(), exit_code
+
 def main():
     """Main vector tile generation routine."""
     import argparse
@@ -456,12 +1001,49 @@ def main():
     group2.add_argument("--no-pmtiles", dest="pmtiles", action="store_false", help="Do not write .pmtiles outputs")
     parser.set_defaults(pmtiles=True)
     parser.add_argument("--strict", action="store_true", help="Fail build on verification regressions")
+    parser.add_argument(
+        "--lod-input-format",
+        choices=LOD_INPUT_FORMATS,
+        default="geojsonl",
+        help=(
+            "Format fed to tippecanoe for per-LOD tiles. geojsonl is piped via stdin; "
+            "csv goes through a named pipe (a temp file where FIFOs are unavailable) "
+            "and drops per-feature minzoom (default: geojsonl)"
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        help=(
+            "Number of years to build in parallel (default: half the CPU count, "
+            "since tippecanoe runs its own threads)"
+        ),
+    )
+    parser.add_argument(
+        "--no-combine",
+        dest="combine",
+        action="store_false",
+        help=(
+            "With --no-single-layer, keep only per-LOD MBTiles and skip the tile-join "
+            "into humans_{year}.mbtiles (single-layer builds never tile-join)"
+        ),
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help=(
+            "Hide tippecanoe/tile-join progress output unless a command fails "
+            "(always the case with --jobs > 1)"
+        ),
+    )
     args = parser.parse_args()
+    set_quiet_tools(args.quiet)
 
     raw_dir = args.raw_dir
 
     # Tiles-only per-year mode
-    hyde_map = find_hyde_files(raw_dir)
+    hyde_map = find_hyde_files(raw_dir, cache_dir=args.tiles_dir)
     if not hyde_map:
         print("✗ No HYDE ASC files found. Please download data first.")
         return
@@ -473,42 +1055,47 @@ def main():
     print(f"Found {len(target_years)} years to build: {', '.join(map(str, target_years))}")
     pathlib.Path(args.tiles_dir).mkdir(parents=True, exist_ok=True)
 
-    built = 0
+    jobs = max(1, args.jobs)
+    build_args = []
     for y in target_years:
-        print(f"→ Building tiles for year {y}...")
         asc_file = hyde_map.get(y)
         if not asc_file:
             print(f"  ✗ Skipping year {y}: ASC file not found in {raw_dir}")
             continue
-        out = generate_year_tiles(asc_file, args.tiles_dir, y, force=args.force)
-        if out:
-            built += 1
-            if args.single_layer:
-                # Build single-layer variant using all LOD data deterministically
-                result = generate_yearly_tile_data(asc_file, y, args.tiles_dir, force=args.force)
-                # Use LOD windows so exactly one LOD is visible per zoom
-                combined_geojsonl = write_combined_geojsonl_windows(result.lod_data)
-                yearly_out = pathlib.Path(args.tiles_dir) / f"humans_{y}.mbtiles"
-                if yearly_out.exists() and args.force:
-                    yearly_out.unlink()
-                ok = generate_single_layer_mbtiles(combined_geojsonl, str(yearly_out))
-                try:
-                    os.unlink(combined_geojsonl)
-                except OSError:
-                    pass
-                if ok and args.verify:
-                    print("→ Verifying single-layer output…")
-                    ok2 = verify_single_layer(str(yearly_out), strict=args.strict)
-                    if args.strict and not ok2:
-                        raise SystemExit(1)
-                # Optionally produce PMTiles without re-running tippecanoe
-                if ok and args.pmtiles:
-                    print("→ Converting to PMTiles…")
-                    pm = ensure_pmtiles_for_year(args.tiles_dir, y)
-                    if pm:
-                        print(f"  ✓ Year {y} PMTiles ready: {pm}")
-                    else:
-                        print("  ⚠️  PMTiles conversion failed. Install `pmtiles` CLI or `pip install pmtiles`.")
+        build_args.append(
+            (
+                asc_file, args.tiles_dir, y, args.force, args.single_layer,
+                args.verify, args.strict, args.pmtiles, args.lod_input_format, args.combine,
+            )
+        )
+
+    built = 0
+    if jobs == 1 or len(build_args) <= 1:
+        for year_args in build_args:
+            if build_year_tiles(*year_args):
+                built += 1
+    else:
+        # Years are independent (distinct ASC input, distinct outputs), so fan them
+        # out across processes. Each worker's log is captured and printed once the
+        # year finishes to keep output from different years from interleaving.
+        # Tools inherit the worker's fds, which redirect_stdout cannot capture, so
+        # workers always run them quiet: progress is dropped, failures are logged
+        print(f"Building {len(build_args)} years with {jobs} parallel jobs...")
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=set_quiet_tools, initargs=(True,)
+        ) as executor:
+            futures = [
+                executor.submit(_build_year_tiles_captured, *year_args)
+                for year_args in build_args
+            ]
+            for future in as_completed(futures):
+                ok, log, exit_code = future.result()
+                print(log, end="")
+                if exit_code is not None:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise SystemExit(exit_code)
+                if ok:
+                    built += 1
 
     print(f"\n✓ Built {built} yearly MBTiles → {args.tiles_dir}")
     if args.pmtiles:
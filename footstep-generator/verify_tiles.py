@@ -3,10 +3,27 @@ from __future__ import annotations
 
 import argparse
 import os
+import pathlib
 import sqlite3
 import math
 from typing import Tuple, List
 
+# Map up to 256 MiB of the file so page reads come straight from the OS page cache
+MBTILES_MMAP_SIZE = 1 << 28
+
+
+def connect_readonly(path: str) -> sqlite3.Connection:
+    """Open an MBTiles file read-only for inspection.
+
+    Read-only URI mode never takes write locks or touches a journal, so
+    verification can run alongside other readers (e.g. PMTiles conversion).
+    """
+    uri = f"{pathlib.Path(path).resolve().as_uri()}?mode=ro"
+    con = sqlite3.connect(uri, uri=True)
+    con.execute("PRAGMA query_only=1")
+    con.execute(f"PRAGMA mmap_size={MBTILES_MMAP_SIZE}")
+    return con
+
 
 def xyz(lon: float, lat: float, z: int) -> Tuple[int, int]:
     x = int((lon + 180.0) / 360.0 * (1 << z))
@@ -28,15 +45,20 @@ def tile_len(conn: sqlite3.Connection, z: int, x: int, y_xyz: int) -> int:
 
 
 def counts_by_zoom(path: str) -> List[Tuple[int, int]]:
-    con = sqlite3.connect(path)
+    con = connect_readonly(path)
+    try:
+        return _counts_by_zoom(con)
+    finally:
+        con.close()
+
+
+def _counts_by_zoom(con: sqlite3.Connection) -> List[Tuple[int, int]]:
     cur = con.cursor()
     cur.execute(
         "SELECT zoom_level, count(*) FROM tiles "
         "GROUP BY zoom_level ORDER BY zoom_level"
     )
-    rows = [(int(z), int(c)) for z, c in cur.fetchall()]
-    con.close()
-    return rows
+    return [(int(z), int(c)) for z, c in cur.fetchall()]
 
 
 def verify_single_layer(path: str, strict: bool = False) -> bool:
@@ -44,7 +66,15 @@ def verify_single_layer(path: str, strict: bool = False) -> bool:
     if not os.path.exists(path):
         print("  ✗ File not found")
         return not strict
-    rows = counts_by_zoom(path)
+    con = connect_readonly(path)
+    try:
+        return _verify_single_layer(con, strict)
+    finally:
+        con.close()
+
+
+def _verify_single_layer(con: sqlite3.Connection, strict: bool) -> bool:
+    rows = _counts_by_zoom(con)
     print("  Zoom counts:")
     for z, c in rows:
         print(f"    z{z}: {c} tiles")
@@ -64,7 +94,6 @@ def verify_single_layer(path: str, strict: bool = False) -> bool:
         "EastAsia": (120.0, 35.0),
         "NorthAmerica": (-95.0, 40.0),
     }
-    con = sqlite3.connect(path)
     nonzero_regions = 0
     for name, (lon, lat) in regions.items():
         x, y = xyz(lon, lat, 6)
@@ -78,7 +107,6 @@ def verify_single_layer(path: str, strict: bool = False) -> bool:
         print(f"  z6 {name}: nonzero {nz}/9, total bytes ~{total}")
         if nz > 0:
             nonzero_regions += 1
-    con.close()
     if strict and nonzero_regions < 2:
         print("  ✗ z=6 appears empty in most sampled regions")
         ok = False